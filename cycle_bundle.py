@@ -0,0 +1,244 @@
+'''
+This code reads and writes "cycle bundles": compact binary files holding the sorted cycles of the Abrams-discretized model
+D_{n,k} of a d-star, so that StarGraph (see star_graph.py) does not have to build the cubical complex and compute its homology
+every time it is launched.
+
+A bundle is written once, offline, for a given (d, n, k):
+
+    python cycle_bundle.py 3 4 3
+
+and is then loaded by StarGraph through a read-only memory map, so opening even a large bundle only costs a few milliseconds.
+Only the cycles that are actually displayed are ever decoded.
+
+Each cycle is stored as the list of its cubes (with their coefficients in the homology generator), together with the decoded
+position of every robot at every step of the cycle. A robot position is a triple (arm, start, end): the robot is on the arm
+with that index, on the vertex start (if start == end) or on the edge from start to end, where vertices along an arm are
+numbered by their distance from the center. The center itself is encoded as (-1, 0, 0).
+
+The file layout is (everything little-endian):
+    header       magic "SCB1", then the unsigned 32-bit integers d, n, k, width (the number of intervals in each cube)
+                 and the number of cycles,
+    offsets      (number of cycles + 1) unsigned 32-bit integers, where cycle c consists of the steps offsets[c] up to
+                 offsets[c+1],
+    coefficients one signed 32-bit integer per step,
+    cubes        width pairs of signed 16-bit integers (the interval endpoints) per step,
+    positions    n triples of signed 16-bit integers (arm, start, end) per step.
+'''
+import argparse
+import mmap
+import os
+import struct
+
+_MAGIC = b"SCB1"
+_HEADER = struct.Struct("<4s5I")
+
+# Bundles are looked up here unless another directory is given.
+BUNDLE_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), "bundles")
+
+# The robot position that encodes the center vertex.
+CENTER = (-1, 0, 0)
+
+def bundle_path(starNum, n, k, directory=None):
+    '''
+    :param starNum: The number of "arms" of the star.
+    :type starNum: int
+    :param n: The number of robots.
+    :type n: int
+    :param k: The integer k for the non-k-equal configuration space.
+    :type k: int
+    :param directory: The directory holding the bundles. Defaults to BUNDLE_DIRECTORY.
+    :type directory: str
+    :return: The path of the bundle for D_{n,k} of the starNum-star.
+    :rtype: str
+    '''
+    return os.path.join(directory or BUNDLE_DIRECTORY, "star%d_n%d_k%d.scb" % (starNum, n, k))
+
+def decode_position(cube, starNum, n):
+    '''
+    Decode the positions of all the robots in a cube of the Abrams-discretized model. The intervals of the cube are split
+    into n equal slices, one per robot, and the first nondegenerate interval of a slice tells us the arm the robot is on.
+
+    EXAMPLE (n=3, robot #0 at the center, robot #1 at the first vertex of arm 1, robot #2 moving out along arm 0):
+    >>> decode_position(((0, 0), (0, 0), (0, 0), (0, 0), (1, 1), (0, 0), (1, 2), (0, 0), (0, 0)), 3, 3)
+    ((-1, 0, 0), (1, 1, 1), (0, 1, 2))
+
+    :param cube: The intervals of a cube, e.g. the output of Cube.tuple().
+    :type cube: tuple
+    :param starNum: The number of "arms" of the star.
+    :type starNum: int
+    :param n: The number of robots.
+    :type n: int
+    :return: A tuple of n (arm, start, end) triples.
+    :rtype: tuple
+    '''
+    width = len(cube) // n
+    positions = []
+    for i in range(n):
+        position = CENTER
+        for j, (start, end) in enumerate(cube[i*width:(i+1)*width]):
+            if (start, end) != (0, 0):
+                position = (j % starNum, start, end)
+                break
+        positions.append(position)
+    return tuple(positions)
+
+def decode_cycle(cycle, starNum, n):
+    '''
+    :param cycle: A sorted cycle, as returned by CubicalComplex.sorted_n_cycles.
+    :type cycle: list
+    :return: The list of robot positions (see decode_position) at each step of the cycle.
+    :rtype: list
+    '''
+    return [decode_position(cube.tuple(), starNum, n) for (coefficient, cube) in cycle]
+
+def compute_cycles(starNum, n, k):
+    '''
+    Build D_{n,k} of the starNum-star and return its sorted 1-cycles. This is the slow path that bundles exist to avoid.
+
+    :return: The sorted 1-cycles, as returned by CubicalComplex.sorted_n_cycles.
+    :rtype: list
+    '''
+    return list(iter_cycles(starNum, n, k))
+
+def iter_cycles(starNum, n, k):
+    '''
+    Build D_{n,k} of the starNum-star and yield its sorted 1-cycles one at a time. The (Sage-dependent) builders are only
+    imported here.
+
+    :return: A generator of sorted 1-cycles, as yielded by CubicalComplex.iter_sorted_n_cycles.
+    :rtype: generator
+    '''
+    from homology.conf_n_k_Y import the_complex as Y_COMPLEX
+    # StarGraph draws every arm with n-1 edges, so the arms of the complex need as many.
+    cubical_complex = Y_COMPLEX(n, k, d=starNum, subdivision=n-1)
+
+    # TODO: Currently, when calling cubical_complex.sorted_n_cycles(n), n has to be manually changed to get the desired
+    #       n-cycles. Perhaps there a should be a neater way to choose n, maybe based on the largest homology.
+    return cubical_complex.iter_sorted_n_cycles(1)
+
+def write_bundle(path, starNum, n, k, cycles):
+    '''
+    Write sorted cycles to a bundle file.
+
+    :param path: The file to write.
+    :type path: str
+    :param cycles: The sorted cycles, as returned by CubicalComplex.sorted_n_cycles.
+    :type cycles: list
+    '''
+    steps = [term for cycle in cycles for term in cycle]
+    width = len(steps[0][1].tuple()) if steps else 0
+    offsets = [0]
+    for cycle in cycles:
+        offsets.append(offsets[-1] + len(cycle))
+
+    directory = os.path.dirname(path)
+    if directory and not os.path.isdir(directory):
+        os.makedirs(directory)
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(_MAGIC, starNum, n, k, width, len(cycles)))
+        f.write(struct.pack("<%dI" % len(offsets), *offsets))
+        f.write(struct.pack("<%di" % len(steps), *[int(coefficient) for (coefficient, cube) in steps]))
+        for (coefficient, cube) in steps:
+            f.write(struct.pack("<%dh" % (2*width), *[u for interval in cube.tuple() for u in interval]))
+        for (coefficient, cube) in steps:
+            position = decode_position(cube.tuple(), starNum, n)
+            f.write(struct.pack("<%dh" % (3*n), *[u for triple in position for u in triple]))
+
+def build_bundle(starNum, n, k, directory=None):
+    '''
+    The offline step: compute the sorted cycles of D_{n,k} of the starNum-star and write them to their bundle.
+
+    :return: The path of the bundle that was written.
+    :rtype: str
+    '''
+    path = bundle_path(starNum, n, k, directory)
+    write_bundle(path, starNum, n, k, compute_cycles(starNum, n, k))
+    return path
+
+class CycleBundle(object):
+    '''
+    A read-only, memory-mapped cycle bundle. It behaves like a list of cycles, where each cycle is the list of robot
+    positions (see decode_position) at each of its steps. Cycles are decoded from the map only when they are accessed.
+    '''
+    def __init__(self, path):
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.starNum, self.n, self.k, self.width, count = _HEADER.unpack_from(self._map, 0)
+        if magic != _MAGIC:
+            raise ValueError(path + " is not a cycle bundle.")
+        self._offsets = struct.unpack_from("<%dI" % (count+1), self._map, _HEADER.size)
+        total = self._offsets[-1]
+        self._coefficients_start = _HEADER.size + 4*(count+1)
+        self._cubes_start = self._coefficients_start + 4*total
+        self._positions_start = self._cubes_start + 2*2*self.width*total
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def __getitem__(self, c):
+        if c < 0:
+            c += len(self)
+        if not 0 <= c < len(self):
+            raise IndexError("cycle index out of range")
+        return self.positions(c)
+
+    def __iter__(self):
+        for c in range(len(self)):
+            yield self.positions(c)
+
+    def positions(self, c):
+        '''
+        :param c: The index of a cycle.
+        :type c: int
+        :return: The list of robot positions at each step of cycle c.
+        :rtype: list
+        '''
+        start, stop = self._offsets[c], self._offsets[c+1]
+        size = 3*self.n
+        flat = struct.unpack_from("<%dh" % (size*(stop-start)), self._map, self._positions_start + 2*size*start)
+        return [tuple(flat[i+3*j:i+3*j+3] for j in range(self.n)) for i in range(0, len(flat), size)]
+
+    def cubes(self, c):
+        '''
+        :param c: The index of a cycle.
+        :type c: int
+        :return: The list of (coefficient, intervals) pairs making up cycle c, in order.
+        :rtype: list
+        '''
+        start, stop = self._offsets[c], self._offsets[c+1]
+        size = 2*self.width
+        coefficients = struct.unpack_from("<%di" % (stop-start), self._map, self._coefficients_start + 4*start)
+        flat = struct.unpack_from("<%dh" % (size*(stop-start)), self._map, self._cubes_start + 2*size*start)
+        return [(coefficients[i], tuple(flat[size*i+2*j:size*i+2*j+2] for j in range(self.width)))
+                for i in range(stop-start)]
+
+    def close(self):
+        self._map.close()
+        self._file.close()
+
+def load_cycles(starNum, n, k, directory=None):
+    '''
+    :return: The CycleBundle for D_{n,k} of the starNum-star, or None if no bundle has been written for it.
+    :rtype: CycleBundle
+    '''
+    path = bundle_path(starNum, n, k, directory)
+    if not os.path.exists(path):
+        return None
+    return CycleBundle(path)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Precompute the cycle bundle of D_{n,k} of a d-star for star_graph.py.")
+    parser.add_argument("starNum", type=int, help="the number of arms of the star")
+    parser.add_argument("n", type=int, help="the number of robots")
+    parser.add_argument("k", type=int, nargs="?", default=2, help="the k of the non-k-equal configuration space")
+    parser.add_argument("--directory", default=None, help="where to write the bundle (default: %s)" % BUNDLE_DIRECTORY)
+    parser.add_argument("--memory-budget", type=int, default=None,
+                        help="stop cleanly if building the complex needs more than this many megabytes")
+    args = parser.parse_args()
+    from homology import memory
+    if args.memory_budget is not None:
+        memory.set_budget(args.memory_budget * 1024)
+    try:
+        print(build_bundle(args.starNum, args.n, args.k, args.directory))
+    except memory.MemoryBudgetExceeded as e:
+        parser.exit(1, str(e) + "\n")
@@ -0,0 +1,88 @@
+'''
+This code computes the cycles of the Abrams-discretized model D_{n,k} of a d-star in a separate process, so that StarGraph
+(see star_graph.py) can open its window and start animating right away instead of waiting for the complex, its homology and
+all of its sorted cycles.
+
+The worker process hands the cycles back one at a time through a queue, already decoded into robot positions (see
+cycle_bundle.py), as soon as each of them has been sorted. The Tkinter side only ever polls the queue without blocking.
+'''
+import multiprocessing
+import traceback
+try:
+    import Queue as queue
+except ImportError:
+    import queue
+
+import cycle_bundle
+
+def _compute(starNum, n, k, results):
+    '''
+    The body of the worker process: put ("cycle", positions) on the results queue for every cycle, then ("done", None), or
+    ("error", traceback) if anything went wrong.
+    '''
+    try:
+        for cycle in cycle_bundle.iter_cycles(starNum, n, k):
+            results.put(("cycle", cycle_bundle.decode_cycle(cycle, starNum, n)))
+        results.put(("done", None))
+    except Exception:
+        results.put(("error", traceback.format_exc()))
+
+class CycleWorker(object):
+    '''
+    A background process computing the cycles of D_{n,k} of the starNum-star.
+    '''
+    def __init__(self, starNum, n, k):
+        '''
+        :param starNum: The number of "arms" of the star.
+        :type starNum: int
+        :param n: The number of robots.
+        :type n: int
+        :param k: The integer k for the non-k-equal configuration space.
+        :type k: int
+        '''
+        self._results = multiprocessing.Queue()
+        self._process = multiprocessing.Process(target=_compute, args=(starNum, n, k, self._results))
+        # Don't outlive the visualization if its window is closed while we are still computing.
+        self._process.daemon = True
+
+        # True once every cycle has been received, or the computation has failed.
+        self.done = False
+        # The traceback of the computation if it failed, and None otherwise.
+        self.error = None
+
+    def start(self):
+        self._process.start()
+
+    def poll(self):
+        '''
+        Collect the cycles that have arrived since the last call, without blocking. If the computation failed, done is set
+        and error holds the reason.
+
+        :return: The list of newly computed cycles, each of which is a list of robot positions.
+        :rtype: list
+        '''
+        cycles = []
+        while not self.done:
+            try:
+                kind, value = self._results.get_nowait()
+            except queue.Empty:
+                if not self._process.is_alive() and self._results.empty():
+                    self.done = True
+                    self.error = "The cycle worker exited with code " + str(self._process.exitcode) + "."
+                break
+            if kind == "cycle":
+                cycles.append(value)
+            elif kind == "done":
+                self.done = True
+            else:
+                self.done = True
+                self.error = value
+        return cycles
+
+    def stop(self):
+        '''
+        Stop the worker process if it is still running.
+        '''
+        if self._process.is_alive():
+            self._process.terminate()
+        self.done = True
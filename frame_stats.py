@@ -0,0 +1,228 @@
+'''
+This code measures how long the frames of the StarGraph animation (see star_graph.py) take, so that we can tell where the time
+goes when an animation is slow.
+
+A FrameProfiler splits every frame into phases: the animation marks the end of each phase as it goes (e.g. working out where
+the robots are, then moving them on the canvas), and the time between the end of one frame and the start of the next, which is
+spent waiting for the next timer or handling other events, is the "idle" phase. Each finished frame is turned into a record,
+which is
+- handed to every registered hook, for custom collectors,
+- logged as one line of JSON at the DEBUG level of the logger of this module (which produces no output by default), and
+- kept in a short rolling window, from which the frames per second and the average time of each phase are worked out for the
+  frame-time overlay of StarGraph.
+
+Running this file benchmarks the work the animation does per frame without a display or any timers, e.g.
+
+    python frame_stats.py 3 4 2 --cycles 10
+
+plays the first 10 cycles of D_{4,2}Y as fast as possible and reports the throughput in cycles and frames per second.
+'''
+import argparse
+import collections
+import json
+import logging
+import time
+
+import cycle_bundle
+import keyframes
+import star_layout
+
+# Logging configuration: by default, produce no output
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+class FrameProfiler(object):
+    '''
+    Collects per-phase timings of the frames of an animation.
+
+    EXAMPLE (with a clock that is moved by hand):
+    >>> now = [0.0]
+    >>> profiler = FrameProfiler(clock=lambda: now[0])
+    >>> records = []
+    >>> profiler.add_hook(records.append)
+    >>> profiler.begin_frame(); now[0] += 0.002; profiler.mark("timeline"); now[0] += 0.003; profiler.mark("canvas")
+    >>> record = profiler.end_frame(dropped_frames=1)
+    >>> sorted(record["phases"].items())
+    [('canvas', 0.003), ('timeline', 0.002)]
+    >>> record["total"], record["dropped_frames"], records == [record]
+    (0.005, 1, True)
+    '''
+    def __init__(self, window=60, clock=time.time):
+        '''
+        :param window: How many of the latest frames the frames per second and average phase times are worked out from.
+        :type window: int
+        :param clock: The function giving the current time in seconds.
+        :type clock: function
+        '''
+        self._clock = clock
+        self._hooks = []
+        self._recent = collections.deque(maxlen=window)
+        self._frame_start = None
+        self._last_mark = None
+        self._frame_end = None
+        self._phases = None
+
+        # The number of frames recorded so far, and the number of frames the animation reported as dropped.
+        self.frame_count = 0
+        self.dropped_frames = 0
+
+    def add_hook(self, hook):
+        '''
+        Call hook with the record of every frame from now on. A record is a dictionary with the keys "frame" (the number of
+        the frame), "start" (the time the frame started at), "total" (how long it took, in seconds), "phases" (a dictionary
+        of how long each phase took, in seconds) and "dropped_frames" (the number of dropped frames so far).
+        '''
+        self._hooks.append(hook)
+
+    def remove_hook(self, hook):
+        self._hooks.remove(hook)
+
+    def begin_frame(self):
+        self._frame_start = self._last_mark = self._clock()
+        self._phases = {}
+        if self._frame_end is not None:
+            self._phases["idle"] = self._frame_start - self._frame_end
+
+    def mark(self, phase):
+        '''
+        Record the time since the last mark (or the start of the frame) as time spent in the given phase.
+        '''
+        now = self._clock()
+        self._phases[phase] = self._phases.get(phase, 0.0) + now - self._last_mark
+        self._last_mark = now
+
+    def end_frame(self, dropped_frames=None):
+        '''
+        :param dropped_frames: The total number of frames the animation has dropped so far, if it keeps count.
+        :type dropped_frames: int
+        :return: The record of the frame (see add_hook).
+        :rtype: dict
+        '''
+        self._frame_end = self._clock()
+        if dropped_frames is not None:
+            self.dropped_frames = dropped_frames
+        record = {"frame": self.frame_count, "start": self._frame_start, "total": self._frame_end - self._frame_start,
+                  "phases": self._phases, "dropped_frames": self.dropped_frames}
+        self.frame_count += 1
+        self._recent.append(record)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(json.dumps(record, sort_keys=True))
+        for hook in self._hooks:
+            hook(record)
+        return record
+
+    def fps(self):
+        '''
+        :return: The number of frames per second over the latest frames, or 0.0 if there are too few of them.
+        :rtype: float
+        '''
+        if len(self._recent) < 2:
+            return 0.0
+        elapsed = self._recent[-1]["start"] - self._recent[0]["start"]
+        return (len(self._recent)-1)/elapsed if elapsed > 0 else 0.0
+
+    def averages(self):
+        '''
+        :return: A dictionary of the average time (in seconds) of each phase, and of whole frames under the key "total",
+                 over the latest frames.
+        :rtype: dict
+        '''
+        totals = collections.defaultdict(float)
+        for record in self._recent:
+            totals["total"] += record["total"]
+            for phase, seconds in record["phases"].items():
+                totals[phase] += seconds
+        return dict((phase, seconds/max(1, len(self._recent))) for (phase, seconds) in totals.items())
+
+    def summary(self):
+        '''
+        :return: A short text giving the frames per second, the average time of each phase in milliseconds and the number
+                 of dropped frames, for the overlay of StarGraph.
+        :rtype: str
+        '''
+        averages = self.averages()
+        lines = ["%.1f FPS" % self.fps(), "frame %.2f ms" % (1000*averages.pop("total", 0.0))]
+        lines.extend("%s %.2f ms" % (phase, 1000*seconds) for (phase, seconds) in sorted(averages.items()))
+        lines.append("dropped %d" % self.dropped_frames)
+        return "\n".join(lines)
+
+def benchmark(starNum, n, k, cycles=None, frame_interval=0.03, speed=5*1000.0/30, pause=0.6, size=600.0, hooks=()):
+    '''
+    Play cycles of D_{n,k} of the starNum-star the way StarGraph does, one frame every frame_interval seconds of animation
+    time, but without a display and without waiting between frames.
+
+    :param cycles: How many cycles to play, starting from the first one. Defaults to all of them.
+    :type cycles: int
+    :param frame_interval: The animation time between two frames, in seconds.
+    :type frame_interval: float
+    :param speed: How fast (in pixels per second) robots move.
+    :type speed: float
+    :param pause: How long (in seconds) robots rest at each position.
+    :type pause: float
+    :param hooks: Functions to register on the profiler (see FrameProfiler.add_hook).
+    :type hooks: list
+    :return: A dictionary with the number of cycles and frames played, the elapsed time in seconds, the throughput in cycles
+             and frames per second, and the average time of each phase of a frame in seconds.
+    :rtype: dict
+    '''
+    bundle = cycle_bundle.load_cycles(starNum, n, k)
+    if bundle is not None:
+        source = bundle
+    else:
+        source = (cycle_bundle.decode_cycle(cycle, starNum, n) for cycle in cycle_bundle.iter_cycles(starNum, n, k))
+    layout = star_layout.StarLayout(starNum, n, size)
+
+    # Keep running totals rather than every record, so that long benchmarks don't fill up memory.
+    totals = collections.defaultdict(float)
+    def collect(record):
+        for phase, seconds in record["phases"].items():
+            totals[phase] += seconds
+    profiler = FrameProfiler(window=2)
+    for hook in (collect,) + tuple(hooks):
+        profiler.add_hook(hook)
+
+    played = 0
+    start = time.time()
+    try:
+        for cycle in source:
+            if cycles is not None and played >= cycles:
+                break
+            # Compiling the cycle counts towards its first frame, as it does in StarGraph.
+            profiler.begin_frame()
+            timeline = keyframes.CycleTimeline(keyframes.CycleKeyframes(cycle, n), layout, speed, pause)
+            profiler.mark("compile")
+            for frame in range(int(timeline.duration/frame_interval) + 1):
+                if frame > 0:
+                    profiler.begin_frame()
+                timeline.at(frame*frame_interval)
+                profiler.mark("timeline")
+                profiler.end_frame()
+            played += 1
+    finally:
+        if bundle is not None:
+            bundle.close()
+    elapsed = time.time() - start
+
+    frames = profiler.frame_count
+    return {"cycles": played, "frames": frames, "seconds": elapsed,
+            "cycles_per_second": played/elapsed if elapsed > 0 else 0.0,
+            "frames_per_second": frames/elapsed if elapsed > 0 else 0.0,
+            "phases": dict((phase, seconds/max(1, frames)) for (phase, seconds) in totals.items() if phase != "idle")}
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the per-frame work of the star_graph.py animation without a display.")
+    parser.add_argument("starNum", type=int, help="the number of arms of the star")
+    parser.add_argument("n", type=int, help="the number of robots")
+    parser.add_argument("k", type=int, nargs="?", default=2, help="the k of the non-k-equal configuration space")
+    parser.add_argument("--cycles", type=int, default=None, help="how many cycles to play (default: all of them)")
+    parser.add_argument("--json", action="store_true", help="print the results as JSON")
+    args = parser.parse_args()
+    results = benchmark(args.starNum, args.n, args.k, args.cycles)
+    if args.json:
+        print(json.dumps(results, sort_keys=True))
+    else:
+        print("%d cycles, %d frames in %.3f s: %.1f cycles/s, %.0f frames/s"
+              % (results["cycles"], results["frames"], results["seconds"], results["cycles_per_second"],
+                 results["frames_per_second"]))
+        for phase, seconds in sorted(results["phases"].items()):
+            print("  %-10s %.4f ms" % (phase, 1000*seconds))
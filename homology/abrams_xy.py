@@ -1,13 +1,14 @@
 #!/usr/bin/env python2
 
-from sage.all import *
 import cubical_complex
 import itertools
 import logging
-import collections
+import memory
+from array import array
+import tracing
 
-# Ensure we've got chomp
-from sage.interfaces.chomp import have_chomp
+# Ensure we've got chomp (this needs Sage, which is only loaded to compute the homology)
+#from sage.interfaces.chomp import have_chomp
 #assert have_chomp() is True
 
 # Logging configuration: by default, produce no output
@@ -16,7 +17,7 @@ logger.addHandler(logging.NullHandler())
 
 # Return lookup_Y and generate_tree_Y in lookup and generate_tree respectively to get
 # the Abrams-discretized model D_n(Y).
-def lookup_Y(n):
+def lookup_Y(n, subdivision=None):
     """\
     Lookup returns a list of points in R^3, it amounts to a labeling of the
     vertices of the Y graph. Examples, from left to right: ``lookup(1)``,
@@ -57,20 +58,26 @@ def lookup_Y(n):
       * The label-to-coordinate mapping should be unique:
 
         >>> assert len(frozenset(lookup_)) == len(lookup_)
+
+      * Each leg has n-1 edges unless ``subdivision`` says otherwise:
+
+        >>> lookup(3, subdivision=1)
+        [(0, 1, 0), (0, 0, 0), (1, 0, 0), (0, 0, 1)]
     """
 
     assert n > 0
+    s = n - 1 if subdivision is None else subdivision
 
-    lookup = [(0, n - t - 1, 0) for t in range(n - 1)]
+    lookup = [(0, s - t, 0) for t in range(s)]
     lookup.append((0, 0, 0))
-    lookup.extend([(t, 0, 0) for t in range(1, n)])
-    lookup.extend([(0, 0, t) for t in range(1, n)])
+    lookup.extend([(t, 0, 0) for t in range(1, s + 1)])
+    lookup.extend([(0, 0, t) for t in range(1, s + 1)])
 
     assert lookup != []
 
     return lookup
 
-def generate_tree_Y(n):
+def generate_tree_Y(n, subdivision=None):
     """\
     Returns a list of possible "downstream" moves (moves from one point to a
     point with a greater label). For instance, in the case of C^n(G)
@@ -83,6 +90,9 @@ def generate_tree_Y(n):
      * Legs: If a point is at n, it can move to n+1, etc. If a point is at
        2n-1, it can move to 2n, ... , 3n-3.
 
+    Each leg has n-1 edges, which Abrams needs for n points, unless
+    ``subdivision`` gives another number of edges (see lookup_Y).
+
     Examples:
 
         >>> generate_tree(1) # TODO: this seems incorrect
@@ -102,15 +112,16 @@ def generate_tree_Y(n):
         []
     """
     assert n > 0
+    s = n - 1 if subdivision is None else subdivision
 
     tree = []
-    for point in range(n - 1):
+    for point in range(s):
         tree.append([point + 1])
-    tree.append([n, 2 * n - 1])
-    for point in range(n, 2 * n - 2):
+    tree.append([s + 1, 2 * s + 1])
+    for point in range(s + 1, 2 * s):
         tree.append([point + 1])
     tree.append([])
-    for point in range(2 * n - 1, 3 * n - 3):
+    for point in range(2 * s + 1, 3 * s):
         tree.append([point + 1])
     tree.append([])
 
@@ -152,12 +163,13 @@ def generate_tree_X(n):
     return tuple(tree)
 
 # Choose either lookup_Y and 
-def lookup(n):
-    return lookup_Y(n)
+def lookup(n, subdivision=None):
+    return lookup_Y(n, subdivision)
 
-def generate_tree(n):
-    return generate_tree_Y(n) 
+def generate_tree(n, subdivision=None):
+    return generate_tree_Y(n, subdivision)
 
+@tracing.traced
 def iterate_over_conf(T, n):
     """\
     Enumerate all the possible configurations of points at vertices, which will
@@ -174,10 +186,15 @@ def iterate_over_conf(T, n):
     assert T != []
 
     for point_config in itertools.product(xrange(len(T)), repeat=n):
+        if tracing.enabled:
+            tracing.count("configurations scanned")
         if len(set(point_config)) == n:  # points all distinct
+            if tracing.enabled:
+                tracing.count("configurations accepted")
             yield point_config
 
 
+@tracing.traced
 def downstream_moves(point_config, T):
     """\
     Test which points in the configuration can move. We only move 'downstream'
@@ -242,14 +259,87 @@ def downstream_moves(point_config, T):
 
     return output
 
-# We "tag" the downstream cubes with their origin for debugging. If we know
-# what point_config and move inspired the addition of a cube to the Abrams
-# discretized configuration space, then we can more easily figure out where
-# things went wrong.
-MoveCube = collections.namedtuple("MoveCube", ["point_config", "move", "cube"])
+class Provenance(object):
+    """\
+    Tags the downstream cubes with their origin, for debugging. If we know
+    what point_config and move inspired the addition of a cube to the Abrams
+    discretized configuration space, then we can more easily figure out where
+    things went wrong.
+
+    Rather than one object per cube, the origins are two integer columns in
+    the order the cubes were built: the configuration, as a number in base
+    len(T), and the move, as a number in base len(T)+1 (with 0 for a point
+    that doesn't move). Both are decoded again on demand.
 
+    Examples:
 
-def downstream_cubes(point_config, T):
+        >>> provenance = Provenance()
+        >>> cubes = downstream_cubes([0, 1], generate_tree(2), provenance=provenance)
+        >>> len(provenance), provenance[1]
+        (2, ((0, 1), (None, 3)))
+        >>> provenance.cubes = cubes
+        >>> provenance.origin(cubes[0])
+        ((0, 1), (None, 2))
+    """
+
+    def __init__(self):
+        self.configs = array('l')
+        self.moves = array('l')
+        # The cubes of the rows, for origin (see the_complex).
+        self.cubes = None
+        self._n = None
+        self._vertices = None
+        self._rows = None
+
+    def record(self, point_config, move, vertices):
+        """\
+        Add a row for the cube built by moving the points at point_config
+        along move, on a tree with the given number of vertices.
+        """
+        if self._n is None:
+            (self._n, self._vertices) = (len(point_config), vertices)
+        assert (len(point_config), vertices) == (self._n, self._vertices)
+        config_id = 0
+        move_code = 0
+        for point in reversed(range(len(point_config))):
+            next_pos = move[point]
+            config_id = config_id * vertices + point_config[point]
+            move_code = move_code * (vertices + 1) + (0 if next_pos is None else next_pos + 1)
+        self.configs.append(config_id)
+        self.moves.append(move_code)
+        self._rows = None
+
+    def __len__(self):
+        return len(self.configs)
+
+    def __getitem__(self, row):
+        """\
+        Returns the (point_config, move) of a row.
+        """
+        (config_id, move_code) = (self.configs[row], self.moves[row])
+        point_config = []
+        move = []
+        for point in range(self._n):
+            (config_id, current_pos) = divmod(config_id, self._vertices)
+            (move_code, next_pos) = divmod(move_code, self._vertices + 1)
+            point_config.append(current_pos)
+            move.append(None if next_pos == 0 else next_pos - 1)
+        return (tuple(point_config), tuple(move))
+
+    def origin(self, cube):
+        """\
+        Returns the (point_config, move) that first built the cube, looking
+        it up in the cubes, which are indexed the first time this is called.
+        """
+        if self._rows is None:
+            self._rows = {}
+            for (row, built) in enumerate(self.cubes):
+                self._rows.setdefault(built, row)
+        return self[self._rows[cube]]
+
+
+@tracing.traced
+def downstream_cubes(point_config, T, subdivision=None, provenance=None):
     """\
     Builds the highest-dimensional cubes (in the Abrams-discretized
     configuration space) that result from performing moves at the same time.
@@ -265,13 +355,16 @@ def downstream_cubes(point_config, T):
         # >>> downstream_cubes([0, 2], generate_tree(2))
         # [[[0, 0], [0, 1], [0, 0], [1, 1], [0, 0], [0, 0]]]
 
+     * If a Provenance is given, the move that built each cube is recorded
+       in it, in the order of the cubes.
+
     See also:
       * http://doc.sagemath.org/html/en/reference/homology/sage/homology/cubical_complex.html
     """
     assert point_config != []
     assert T != []
 
-    lookup_ = lookup(len(point_config))
+    lookup_ = lookup(len(point_config), subdivision)
 
     cubes = []
     # This product contains all possible combinations of moves
@@ -294,16 +387,20 @@ def downstream_cubes(point_config, T):
                 ]
             new_cube.extend(intervals)  # (each cube has 3n intervals)
 
-        # Make a new "tagged" cube
-        cubes.append(
-            MoveCube(point_config, move, cubical_complex.Cube(new_cube)))
+        cubes.append(cubical_complex.Cube(new_cube))
+        if provenance is not None:
+            provenance.record(point_config, move, len(T))
 
     assert cubes != []
+    if tracing.enabled:
+        tracing.count("moves generated", len(cubes))
 
     return cubes
 
 
-def the_complex(n, maximality_check=True, logger=logger):
+@tracing.traced
+def the_complex(n, maximality_check=True, logger=logger, subdivision=None,
+                provenance=None):
     """ Build the cubical complex that is the Abrams-discretized configuration
     space of n vertices on the Y graph.
 
@@ -311,6 +408,13 @@ def the_complex(n, maximality_check=True, logger=logger):
     intentionally only add maximal cells to the complex with downstream_moves.
     This is not currently the case.
 
+    The legs of the Y graph have n-1 edges unless ``subdivision`` says
+    otherwise (see generate_tree_Y).
+
+    If a Provenance is given, it records the move that built every cube, and
+    can then tell where any cube came from (see Provenance). Otherwise the
+    cubes carry nothing but themselves.
+
     Examples:
 
         # TODO: this fails:
@@ -330,37 +434,46 @@ def the_complex(n, maximality_check=True, logger=logger):
         >>> the_complex(3).homology()
         {0: 0, 1: Z^13, 2: 0, 3: 0}
 
+        >>> provenance = Provenance()
+        >>> cubical = the_complex(2, provenance=provenance)
+        >>> len(provenance)
+        14
+        >>> provenance.origin(cubical_complex.Cube([[0, 0], [0, 1], [0, 0], [1, 1], [0, 0], [0, 0]]))
+        ((0, 2), (1, None))
+
     """
     assert n > 0
 
-    T = generate_tree(n)
+    T = generate_tree(n, subdivision)
     cubes = []
 
     # If any of the points are at the ends of the legs, then the
     # generated cube will be a face of one already generated.
     for point_config in iterate_over_conf(T, n):
         logger.debug("Generating downstream_cubes for {}".format(point_config))
-        downstream = downstream_cubes(point_config, T)
+        downstream = downstream_cubes(point_config, T, subdivision, provenance)
 
+        # (with a Provenance, and provenance.cubes = cubes)
         # for down in downstream:
         #     for cube in cubes:
-        #         if down.cube.is_face(cube.cube):
+        #         if down.is_face(cube):
         #             try:
         #                 assert 2 * n - 2 in point_config or 3 * n - 3 in point_config
         #             except AssertionError:
         #                 print("ERRR: the first contains the second")
-        #                 print("cube.point_config: {}".format(cube.point_config))
-        #                 print("cube.move: {}".format(cube.move))
-        #                 print("cube.cube: {}".format(cube.cube))
-        #                 print("down.point_config: {}".format(down.point_config))
-        #                 print("down.move: {}".format(down.move))
-        #                 print("down.cube: {}".format(down.cube))
+        #                 print("cube (point_config, move): {}".format(provenance.origin(cube)))
+        #                 print("cube: {}".format(cube))
+        #                 print("down (point_config, move): {}".format(provenance.origin(down)))
+        #                 print("down: {}".format(down))
         #                 raise
 
         cubes.extend(downstream)
+        if memory.budget_kb is not None:
+            memory.checkpoint("the_complex")
 
-    cubes = map(lambda t: t.cube, cubes)
-    downstream = map(lambda x: x.cube, downstream)
+    memory.check("the_complex")
+    if provenance is not None:
+        provenance.cubes = cubes
 
     return cubical_complex.CubicalComplex(
         cubes, maximality_check=maximality_check)
@@ -0,0 +1,248 @@
+'''
+This code times every stage of building and analysing the Abrams-discretized models D_{n,k}, separately, so that we can see
+which stage dominates for a given (n, k) and catch performance regressions in review.
+
+The stages are, in order:
+- "configurations": enumerating the configurations of the robots at vertices (iterate_over_conf),
+- "downstream_cubes": building the cubes downstream of every configuration,
+- "maximality_check": building the CubicalComplex from these cubes, which keeps only the maximal ones,
+- "cells": listing all the faces of the complex (CubicalComplex.cells),
+- "chain_complex": building the chain complex with its boundary matrices,
+- "homology": computing the homology, and
+- "sorted_n_cycles": sorting the generators of the first homology into cycles.
+Later stages reuse what earlier ones cached on the complex (e.g. the cells), just as they do in a normal run.
+
+The graphs are Y (conf_n_k_Y.py), X (the 4-star, also from conf_n_k_Y.py) and I (conf_n_k_I.py). Every (graph, n, k) case
+runs in a fresh process, so that its peak memory (the peak resident set size, which is all that Python 2 can tell us) is its
+own. After every stage we record the wall time of the stage, the current and peak memory so far (see memory.py) and the sizes
+of what the stage built: the number of Cube instances, the sizes of the sets of cells in every dimension and the number of
+nonzero entries of the boundary matrices. For example, from this directory,
+
+    sage -python benchmark.py --graphs Y X I --n 2 3 --k 2 3 --output results.json --baseline baseline.json
+
+runs all the cases with k <= n, writes the results to results.json and compares them with those saved in baseline.json,
+exiting with status 1 if a stage got slower than the tolerance allows.
+
+With --memory-budget, every case runs under that memory budget, and a case that goes over it is recorded with the stage it
+was in. The cases of the same graph and k with more robots are then skipped, as they would only need more memory.
+'''
+import argparse
+import json
+import multiprocessing
+import platform
+import sys
+import time
+try:
+    import Queue as queue
+except ImportError:
+    import queue
+
+STAGES = ["configurations", "downstream_cubes", "maximality_check", "cells", "chain_complex", "homology", "sorted_n_cycles"]
+GRAPHS = ["Y", "X", "I"]
+
+def _builder(graph, n, k):
+    '''
+    :return: The (module, lookup, I) of the builder of the given graph, where lookup and I are as returned by generate_tree,
+             subdivided as by the_complex.
+    :rtype: tuple
+    '''
+    if graph == "I":
+        import conf_n_k_I
+        (lookup, I) = conf_n_k_I.generate_interval(n, conf_n_k_I.minimal_subdivision(n, k))
+        return (conf_n_k_I, lookup, I)
+    import conf_n_k_Y
+    d = 3 if graph == "Y" else 4
+    (lookup, I) = conf_n_k_Y.generate_star_tree(d, n, conf_n_k_Y.minimal_subdivision(n, k, d))
+    return (conf_n_k_Y, lookup, I)
+
+def run_case(graph, n, k):
+    '''
+    Run every stage for D_{n,k} of the given graph in this process.
+
+    :param graph: One of GRAPHS.
+    :type graph: str
+    :return: A dictionary mapping every stage to a dictionary with its "seconds", the "rss_kb" and "peak_memory_kb" after
+             it, its "size" (e.g. the number of configurations, cubes or cells) and, where they apply, the number of "cubes"
+             (Cube instances) it holds, the sizes of the sets of "cells" and the "nonzeros" of the boundary matrices, by
+             dimension.
+    :rtype: dict
+    '''
+    import cubical_complex
+    import memory
+    stages = {}
+    def record(stage, start, size, **sizes):
+        seconds = time.time() - start
+        stages[stage] = memory.account(stage, seconds=seconds, size=size, **sizes)
+        del stages[stage]["stage"]
+
+    (builder, lookup, I) = _builder(graph, n, k)
+
+    start = time.time()
+    configurations = list(builder.iterate_over_conf(I, n, k))
+    record("configurations", start, len(configurations))
+
+    start = time.time()
+    cubes = []
+    for point_config in configurations:
+        cubes.extend(builder.downstream_cubes(point_config, I, lookup, k))
+    record("downstream_cubes", start, len(cubes), cubes=len(cubes))
+
+    start = time.time()
+    cubical = cubical_complex.CubicalComplex(cubes)
+    record("maximality_check", start, len(cubical.maximal_cells()), cubes=len(cubical.maximal_cells()))
+    del cubes
+
+    start = time.time()
+    cells = cubical.cells()
+    record("cells", start, sum(len(faces) for faces in cells.values()), cubes=sum(len(faces) for faces in cells.values()),
+           cells=dict((dim, len(faces)) for (dim, faces) in cells.items() if dim >= 0))
+    del cells
+
+    start = time.time()
+    chains = cubical.chain_complex()
+    nonzeros = dict((dim, len(matrix.nonzero_positions())) for (dim, matrix) in chains.differential().items())
+    record("chain_complex", start, sum(nonzeros.values()), nonzeros=nonzeros)
+
+    start = time.time()
+    homology = cubical.homology()
+    record("homology", start, str(homology))
+
+    start = time.time()
+    cycles = cubical.sorted_n_cycles(1) if cubical.dimension() >= 1 else []
+    record("sorted_n_cycles", start, len(cycles))
+    return stages
+
+def _run_case(graph, n, k, results, memory_budget_kb=None):
+    import memory
+    memory.set_budget(memory_budget_kb)
+    try:
+        results.put(("ok", run_case(graph, n, k)))
+    except memory.MemoryBudgetExceeded as e:
+        results.put(("over_budget", str(e)))
+    except Exception as e:
+        results.put(("error", repr(e)))
+
+def run_benchmarks(graphs, ns, ks, timeout=None, log=None, memory_budget_kb=None):
+    '''
+    Run every (graph, n, k) case with k <= n, each in its own process.
+
+    :param timeout: How long (in seconds) a case may take before it is stopped and recorded as timed out.
+    :type timeout: float
+    :param log: A function called with a line of progress after every case.
+    :type log: function
+    :param memory_budget_kb: The memory budget of every case in kilobytes (see memory.py). Once a case goes over it, the
+                             cases of the same graph and k with more robots are skipped.
+    :type memory_budget_kb: int
+    :return: The list of results, each of which is a dictionary with the "graph", "n", "k" and either the "stages" (see
+             run_case) or an "error".
+    :rtype: list
+    '''
+    results = []
+    # The smallest n that went over the memory budget, for every (graph, k).
+    over_budget = {}
+    for graph in graphs:
+        for n in sorted(ns):
+            for k in ks:
+                if k > n:
+                    continue
+                result = {"graph": graph, "n": n, "k": k}
+                if n > over_budget.get((graph, k), n):
+                    result["error"] = ("skipped, as D_{%d,%d}%s went over the memory budget"
+                                       % (over_budget[(graph, k)], k, graph))
+                    results.append(result)
+                    if log is not None:
+                        log(format_result(result))
+                    continue
+                channel = multiprocessing.Queue()
+                process = multiprocessing.Process(target=_run_case, args=(graph, n, k, channel, memory_budget_kb))
+                process.start()
+                try:
+                    status, value = channel.get(timeout=timeout)
+                    result["stages" if status == "ok" else "error"] = value
+                    if status == "over_budget":
+                        over_budget[(graph, k)] = n
+                except queue.Empty:
+                    process.terminate()
+                    result["error"] = "timed out after " + str(timeout) + " seconds"
+                process.join()
+                results.append(result)
+                if log is not None:
+                    log(format_result(result))
+    return results
+
+def format_result(result):
+    '''
+    :return: A line (or a few) describing the result of a case for humans.
+    :rtype: str
+    '''
+    title = "D_{%d,%d}%s" % (result["n"], result["k"], result["graph"])
+    if "error" in result:
+        return title + ": " + result["error"]
+    return title + "\n" + "\n".join("  %-17s %10.4f s %10d KB %10d KB peak  %s"
+                                    % (stage, result["stages"][stage]["seconds"], result["stages"][stage]["rss_kb"],
+                                       result["stages"][stage]["peak_memory_kb"], result["stages"][stage]["size"])
+                                    for stage in STAGES)
+
+def compare(results, baseline, tolerance=1.25, minimum=0.05):
+    '''
+    Compare results with a baseline, stage by stage.
+
+    EXAMPLE:
+    >>> old = [{"graph": "Y", "n": 3, "k": 2, "stages": {"cells": {"seconds": 1.0}, "homology": {"seconds": 0.01}}}]
+    >>> new = [{"graph": "Y", "n": 3, "k": 2, "stages": {"cells": {"seconds": 2.0}, "homology": {"seconds": 0.03}}}]
+    >>> compare(new, old)
+    [('Y', 3, 2, 'cells', 1.0, 2.0)]
+
+    :param results: The results of run_benchmarks.
+    :type results: list
+    :param baseline: Results saved earlier.
+    :type baseline: list
+    :param tolerance: How many times slower than in the baseline a stage may get.
+    :type tolerance: float
+    :param minimum: Stages that take less time than this (in seconds) are too noisy to compare.
+    :type minimum: float
+    :return: The list of (graph, n, k, stage, baseline seconds, seconds) of the stages that got slower than allowed.
+    :rtype: list
+    '''
+    old = dict(((result["graph"], result["n"], result["k"]), result) for result in baseline if "stages" in result)
+    regressions = []
+    for result in results:
+        case = (result["graph"], result["n"], result["k"])
+        if "stages" not in result or case not in old:
+            continue
+        for stage in sorted(result["stages"]):
+            if stage not in old[case]["stages"]:
+                continue
+            before, after = old[case]["stages"][stage]["seconds"], result["stages"][stage]["seconds"]
+            if after >= minimum and after > tolerance*before:
+                regressions.append(case + (stage, before, after))
+    return regressions
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Time every stage of building D_{n,k} and computing its cycles.")
+    parser.add_argument("--graphs", nargs="+", choices=GRAPHS, default=GRAPHS, help="the graphs to benchmark")
+    parser.add_argument("--n", type=int, nargs="+", default=[2, 3], help="the numbers of robots")
+    parser.add_argument("--k", type=int, nargs="+", default=[2, 3], help="the values of k")
+    parser.add_argument("--timeout", type=float, default=None, help="stop a case after this many seconds")
+    parser.add_argument("--output", default=None, help="write the results to this JSON file")
+    parser.add_argument("--baseline", default=None, help="compare the results with those in this JSON file")
+    parser.add_argument("--tolerance", type=float, default=1.25, help="how many times slower a stage may get")
+    parser.add_argument("--memory-budget", type=int, default=None, help="the memory budget of every case, in megabytes")
+    args = parser.parse_args()
+
+    def log(line):
+        print(line)
+        sys.stdout.flush()
+    budget = args.memory_budget * 1024 if args.memory_budget is not None else None
+    results = run_benchmarks(args.graphs, args.n, args.k, args.timeout, log, budget)
+    if args.output is not None:
+        with open(args.output, "w") as f:
+            json.dump({"python": platform.python_version(), "machine": platform.machine(), "results": results}, f,
+                      indent=1, sort_keys=True)
+    if args.baseline is not None:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f)["results"], args.tolerance)
+        for (graph, n, k, stage, before, after) in regressions:
+            print("REGRESSION D_{%d,%d}%s %s: %.4f s -> %.4f s" % (n, k, graph, stage, before, after))
+        if regressions:
+            sys.exit(1)
@@ -1,29 +1,48 @@
-from sage.all import *
 import cubical_complex
 import itertools
 import logging
 import collections
+import memory
+import morse
+import tracing
 
 # Code to get the cubical complex Conf_{n,k}(I)
-def generate_interval(n):
-    lookup = [(0, n-t+1, 0) for t in range(n+1)]
+def generate_interval(n, subdivision=None):
+    # The interval has n+1 edges unless subdivision says otherwise (see minimal_subdivision).
+    s = n+1 if subdivision is None else subdivision
+    lookup = [(0, s-t, 0) for t in range(s)]
     lookup.append((0,0,0))
     interval = []
-    for point in range (n+1):
+    for point in range (s):
         interval.append([point+1])
     interval.append([])
     return (lookup, tuple(interval))
 
+# The largest number of robots for which minimal_subdivision has been checked, for every k.
+SUBDIVISION_CHECKED = 6
+
+def minimal_subdivision(n, k):
+    # As for the stars (see conf_n_k_Y.minimal_subdivision): n-1 edges for k=2, and ceil((n-1)/(k-1)) in general, give
+    # the same homology as the n+1 edges of generate_interval, as checked with the Morse complexes.
+    if n > SUBDIVISION_CHECKED:
+        return n+1
+    return (n-1 + k-2) // (k-1)
+
 def no_k_equal(point_config, k):
     count_list = [point_config.count(i) < k for i in point_config]
     return count_list.count(False) == 0
 
+@tracing.traced
 def iterate_over_conf(I, n, k):
-    iterator_list = [xrange(len(I))] * n
-    for point_config in  xmrange_iter(iterator_list):
+    for point_config in itertools.product(xrange(len(I)), repeat=n):
+        if tracing.enabled:
+            tracing.count("configurations scanned")
         if no_k_equal(point_config, k): # no k points are equal
+            if tracing.enabled:
+                tracing.count("configurations accepted")
             yield point_config
 
+@tracing.traced
 def downstream_moves(point_config, I, k):
     locationlist = config_to_locationlist(point_config, I)
     output = [None]*len(locationlist)
@@ -56,6 +75,7 @@ def locationlist_to_config(mult, I, n):
             config[point] = location
     return config
 
+@tracing.traced
 def simultaneous_moves(point_config, I, k):
     down_moves = downstream_moves(point_config, I, k)
     locationlist = config_to_locationlist(point_config, I)
@@ -66,11 +86,17 @@ def simultaneous_moves(point_config, I, k):
             pass
         else:
             for (number, place) in down_moves[start]:
-                for t in Combinations(locationlist[start], number).list():
-                    possible_moves.append([t, place])
+                # The robots at a vertex are distinct, so these are the same (and in the same order) as Sage's
+                # Combinations(locationlist[start], number).
+                for t in itertools.combinations(locationlist[start], number):
+                    possible_moves.append([list(t), place])
             moves.append(possible_moves)
-    return [i for i in xmrange_iter(moves)]
+    sim_moves = [list(i) for i in itertools.product(*moves)]
+    if tracing.enabled:
+        tracing.count("moves generated", len(sim_moves))
+    return sim_moves
 
+@tracing.traced
 def downstream_cubes(point_config, I, lookup, k):
     cubes = []
     sim_moves = simultaneous_moves(point_config, I, k)
@@ -91,13 +117,25 @@ def downstream_cubes(point_config, I, lookup, k):
         cubes.append(new_cube)
     return cubes
 
-def the_complex(n, k):
-    (lookup, I) = generate_interval(n)
+@tracing.traced
+def the_complex(n, k, subdivision=None):
+    if subdivision is None:
+        subdivision = minimal_subdivision(n, k)
+    (lookup, I) = generate_interval(n, subdivision)
     cubes = []
     for point_config in iterate_over_conf(I, n, k):
         cubes.extend(downstream_cubes(point_config, I, lookup, k))
+        if memory.budget_kb is not None:
+            memory.checkpoint("the_complex")
+    memory.check("the_complex")
     return cubical_complex.CubicalComplex(cubes)
 
+def the_morse_complex(n, k, subdivision=None):
+    if subdivision is None:
+        subdivision = minimal_subdivision(n, k)
+    (lookup, I) = generate_interval(n, subdivision)
+    return morse.MorseComplex(lookup, I, n, k)
+
 
 sorted_cycles_4_3_I = [[(1, cubical_complex.Cube([[0,0], [2,2], [0,0], [0,0], [4,5], [0,0], [0,0], [1,1], [0,0], [0,0], [4,4], [0,0]])), (-1, cubical_complex.Cube([[0,0], [2,2], [0,0], [0,0], [5,5], [0,0], [0,0], [1,1], [0,0], [0,0], [3,4], [0,0]])), (-1, cubical_complex.Cube([[0,0], [2,2], [0,0], [0,0], [4,5], [0,0], [0,0], [1,1], [0,0], [0,0], [3,3], [0,0]])), (1, cubical_complex.Cube([[0,0], [2,2], [0,0], [0,0], [4,4], [0,0], [0,0], [1,2], [0,0], [0,0], [3,3], [0,0]])), (1, cubical_complex.Cube([[0,0], [2,2], [0,0], [0,0], [4,4], [0,0], [0,0], [2,3], [0,0], [0,0], [3,3], [0,0]])), (1, cubical_complex.Cube([[0,0], [2,2], [0,0], [0,0], [4,4], [0,0], [0,0], [3,4], [0,0], [0,0], [3,3], [0,0]])), (1, cubical_complex.Cube([[0,0], [2,3], [0,0], [0,0], [4,4], [0,0], [0,0], [4,4], [0,0], [0,0], [3,3], [0,0]])), (1, cubical_complex.Cube([[0,0], [3,3], [0,0], [0,0], [4,4], [0,0], [0,0], [4,5], [0,0], [0,0], [3,3], [0,0]])), (1, cubical_complex.Cube([[0,0], [3,4], [0,0], [0,0], [4,4], [0,0], [0,0], [5,5], [0,0], [0,0], [3,3], [0,0]])), (-1, cubical_complex.Cube([[0,0], [4,4], [0,0], [0,0], [4,4], [0,0], [0,0], [5,5], [0,0], [0,0], [2,3], [0,0]])), (-1, cubical_complex.Cube([[0,0], [3,4], [0,0], [0,0], [4,4], [0,0], [0,0], [5,5], [0,0], [0,0], [2,2], [0,0]])), (-1, cubical_complex.Cube([[0,0], [3,3], [0,0], [0,0], [4,4], [0,0], [0,0], [4,5], [0,0], [0,0], [2,2], [0,0]])), (-1, cubical_complex.Cube([[0,0], [2,3], [0,0], [0,0], [4,4], [0,0], [0,0], [4,4], [0,0], [0,0], [2,2], [0,0]])), (1, cubical_complex.Cube([[0,0], [2,2], [0,0], [0,0], [4,4], [0,0], [0,0], [4,5], [0,0], [0,0], [2,2], [0,0]])), (-1, cubical_complex.Cube([[0,0], [1,2], [0,0], [0,0], [4,4], [0,0], [0,0], [5,5], [0,0], [0,0], [2,2], [0,0]])), (1, cubical_complex.Cube([[0,0], [1,1], [0,0], [0,0], [4,4], [0,0], [0,0], [5,5], [0,0], [0,0], [2,3], [0,0]])), (-1, cubical_complex.Cube([[0,0], [0,1], [0,0], [0,0], [4,4], [0,0], [0,0], [5,5], [0,0], [0,0], [3,3], [0,0]])), (-1, cubical_complex.Cube([[0,0], [0,0], [0,0], [0,0], [3,4], [0,0], [0,0], [5,5], [0,0], [0,0], [3,3], [0,0]])), (-1, cubical_complex.Cube([[0,0], [0,0], [0,0], [0,0], [3,3], [0,0], [0,0], [4,5], [0,0], [0,0], [3,3], [0,0]])), (1, cubical_complex.Cube([[0,0], [0,0], [0,0], [0,0], [3,3], [0,0], [0,0], [4,4], [0,0], [0,0], [3,4], [0,0]])), (1, cubical_complex.Cube([[0,0], [0,0], [0,0], [0,0], [3,3], [0,0], [0,0], [4,4], [0,0], [0,0], [4,5], [0,0]])), (1, cubical_complex.Cube([[0,0], [0,1], [0,0], [0,0], [3,3], [0,0], [0,0], [4,4], [0,0], [0,0], [5,5], [0,0]])), (-1, cubical_complex.Cube([[0,0], [1,1], [0,0], [0,0], [2,3], [0,0], [0,0], [4,4], [0,0], [0,0], [5,5], [0,0]])), (-1, cubical_complex.Cube([[0,0], [1,1], [0,0], [0,0], [2,2], [0,0], [0,0], [4,4], [0,0], [0,0], [4,5], [0,0]])), (1, cubical_complex.Cube([[0,0], [1,1], [0,0], [0,0], [2,3], [0,0], [0,0], [4,4], [0,0], [0,0], [4,4], [0,0]])), (1, cubical_complex.Cube([[0,0], [1,1], [0,0], [0,0], [3,3], [0,0], [0,0], [4,5], [0,0], [0,0], [4,4], [0,0]])), (1, cubical_complex.Cube([[0,0], [1,1], [0,0], [0,0], [3,4], [0,0], [0,0], [5,5], [0,0], [0,0], [4,4], [0,0]])), (1, cubical_complex.Cube([[0,0], [1,1], [0,0], [0,0], [4,4], [0,0], [0,0], [5,5], [0,0], [0,0], [4,5], [0,0]])), (-1, cubical_complex.Cube([[0,0], [1,1], [0,0], [0,0], [4,4], [0,0], [0,0], [4,5], [0,0], [0,0], [5,5], [0,0]])), (1, cubical_complex.Cube([[0,0], [1,1], [0,0], [0,0], [4,5], [0,0], [0,0], [4,4], [0,0], [0,0], [5,5], [0,0]])), (-1, cubical_complex.Cube([[0,0], [1,1], [0,0], [0,0], [5,5], [0,0], [0,0], [4,4], [0,0], [0,0], [4,5], [0,0]])), (-1, cubical_complex.Cube([[0,0], [1,1], [0,0], [0,0], [5,5], [0,0], [0,0], [3,4], [0,0], [0,0], [4,4], [0,0]])), (-1, cubical_complex.Cube([[0,0], [1,1], [0,0], [0,0], [5,5], [0,0], [0,0], [2,3], [0,0], [0,0], [4,4], [0,0]])), (-1, cubical_complex.Cube([[0,0], [1,1], [0,0], [0,0], [5,5], [0,0], [0,0], [1,2], [0,0], [0,0], [4,4], [0,0]])), (-1, cubical_complex.Cube([[0,0], [1,1], [0,0], [0,0], [4,5], [0,0], [0,0], [1,1], [0,0], [0,0], [4,4], [0,0]])), (1, cubical_complex.Cube([[0,0], [1,2], [0,0], [0,0], [4,4], [0,0], [0,0], [1,1], [0,0], [0,0], [4,4], [0,0]]))], [(1, cubical_complex.Cube([[0,0], [2,3], [0,0], [0,0], [1,1], [0,0], [0,0], [5,5], [0,0], [0,0], [0,0], [0,0]])), (1, cubical_complex.Cube([[0,0], [1,2], [0,0], [0,0], [1,1], [0,0], [0,0], [5,5], [0,0], [0,0], [0,0], [0,0]])), (-1, cubical_complex.Cube([[0,0], [1,1], [0,0], [0,0], [1,2], [0,0], [0,0], [5,5], [0,0], [0,0], [0,0], [0,0]])), (1, cubical_complex.Cube([[0,0], [1,1], [0,0], [0,0], [2,2], [0,0], [0,0], [4,5], [0,0], [0,0], [0,0], [0,0]])), (1, cubical_complex.Cube([[0,0], [1,1], [0,0], [0,0], [1,2], [0,0], [0,0], [4,4], [0,0], [0,0], [0,0], [0,0]])), (1, cubical_complex.Cube([[0,0], [1,1], [0,0], [0,0], [1,1], [0,0], [0,0], [3,4], [0,0], [0,0], [0,0], [0,0]])), (1, cubical_complex.Cube([[0,0], [0,1], [0,0], [0,0], [1,1], [0,0], [0,0], [3,3], [0,0], [0,0], [0,0], [0,0]])), (-1, cubical_complex.Cube([[0,0], [0,0], [0,0], [0,0], [1,2], [0,0], [0,0], [3,3], [0,0], [0,0], [0,0], [0,0]])), (-1, cubical_complex.Cube([[0,0], [0,0], [0,0], [0,0], [2,3], [0,0], [0,0], [3,3], [0,0], [0,0], [0,0], [0,0]])), (-1, cubical_complex.Cube([[0,0], [0,0], [0,0], [0,0], [3,3], [0,0], [0,0], [3,3], [0,0], [0,0], [0,1], [0,0]])), (-1, cubical_complex.Cube([[0,0], [0,1], [0,0], [0,0], [3,3], [0,0], [0,0], [3,3], [0,0], [0,0], [1,1], [0,0]])), (-1, cubical_complex.Cube([[0,0], [1,1], [0,0], [0,0], [3,4], [0,0], [0,0], [3,3], [0,0], [0,0], [1,1], [0,0]])), (-1, cubical_complex.Cube([[0,0], [1,2], [0,0], [0,0], [4,4], [0,0], [0,0], [3,3], [0,0], [0,0], [1,1], [0,0]])), (-1, cubical_complex.Cube([[0,0], [2,2], [0,0], [0,0], [4,5], [0,0], [0,0], [3,3], [0,0], [0,0], [1,1], [0,0]])), (-1, cubical_complex.Cube([[0,0], [2,3], [0,0], [0,0], [5,5], [0,0], [0,0], [3,3], [0,0], [0,0], [1,1], [0,0]])), (-1, cubical_complex.Cube([[0,0], [3,3], [0,0], [0,0], [5,5], [0,0], [0,0], [3,4], [0,0], [0,0], [1,1], [0,0]])), (-1, cubical_complex.Cube([[0,0], [3,4], [0,0], [0,0], [5,5], [0,0], [0,0], [4,4], [0,0], [0,0], [1,1], [0,0]])), (-1, cubical_complex.Cube([[0,0], [4,4], [0,0], [0,0], [5,5], [0,0], [0,0], [4,4], [0,0], [0,0], [1,2], [0,0]])), (1, cubical_complex.Cube([[0,0], [4,4], [0,0], [0,0], [5,5], [0,0], [0,0], [3,4], [0,0], [0,0], [2,2], [0,0]])), (1, cubical_complex.Cube([[0,0], [4,4], [0,0], [0,0], [5,5], [0,0], [0,0], [3,3], [0,0], [0,0], [1,2], [0,0]])), (1, cubical_complex.Cube([[0,0], [4,4], [0,0], [0,0], [5,5], [0,0], [0,0], [2,3], [0,0], [0,0], [1,1], [0,0]])), (-1, cubical_complex.Cube([[0,0], [4,4], [0,0], [0,0], [5,5], [0,0], [0,0], [2,2], [0,0], [0,0], [1,2], [0,0]])), (1, cubical_complex.Cube([[0,0], [3,4], [0,0], [0,0], [5,5], [0,0], [0,0], [2,2], [0,0], [0,0], [2,2], [0,0]])), (-1, cubical_complex.Cube([[0,0], [3,3], [0,0], [0,0], [5,5], [0,0], [0,0], [2,3], [0,0], [0,0], [2,2], [0,0]])), (1, cubical_complex.Cube([[0,0], [3,3], [0,0], [0,0], [4,5], [0,0], [0,0], [3,3], [0,0], [0,0], [2,2], [0,0]])), (1, cubical_complex.Cube([[0,0], [3,3], [0,0], [0,0], [4,4], [0,0], [0,0], [2,3], [0,0], [0,0], [2,2], [0,0]])), (1, cubical_complex.Cube([[0,0], [3,3], [0,0], [0,0], [3,4], [0,0], [0,0], [2,2], [0,0], [0,0], [2,2], [0,0]])), (1, cubical_complex.Cube([[0,0], [3,3], [0,0], [0,0], [3,3], [0,0], [0,0], [1,2], [0,0], [0,0], [2,2], [0,0]])), (1, cubical_complex.Cube([[0,0], [3,3], [0,0], [0,0], [2,3], [0,0], [0,0], [1,1], [0,0], [0,0], [2,2], [0,0]])), (1, cubical_complex.Cube([[0,0], [3,3], [0,0], [0,0], [1,2], [0,0], [0,0], [1,1], [0,0], [0,0], [2,2], [0,0]])), (-1, cubical_complex.Cube([[0,0], [3,3], [0,0], [0,0], [1,1], [0,0], [0,0], [1,1], [0,0], [0,0], [2,3], [0,0]])), (-1, cubical_complex.Cube([[0,0], [3,3], [0,0], [0,0], [1,1], [0,0], [0,0], [1,2], [0,0], [0,0], [3,3], [0,0]])), (1, cubical_complex.Cube([[0,0], [3,3], [0,0], [0,0], [0,1], [0,0], [0,0], [2,2], [0,0], [0,0], [3,3], [0,0]])), (1, cubical_complex.Cube([[0,0], [3,3], [0,0], [0,0], [0,0], [0,0], [0,0], [2,2], [0,0], [0,0], [2,3], [0,0]])), (-1, cubical_complex.Cube([[0,0], [3,4], [0,0], [0,0], [0,0], [0,0], [0,0], [2,2], [0,0], [0,0], [2,2], [0,0]])), (-1, cubical_complex.Cube([[0,0], [4,4], [0,0], [0,0], [0,0], [0,0], [0,0], [2,3], [0,0], [0,0], [2,2], [0,0]])), (1, cubical_complex.Cube([[0,0], [4,4], [0,0], [0,0], [0,0], [0,0], [0,0], [3,3], [0,0], [0,0], [1,2], [0,0]])), (1, cubical_complex.Cube([[0,0], [3,4], [0,0], [0,0], [0,0], [0,0], [0,0], [3,3], [0,0], [0,0], [1,1], [0,0]])), (-1, cubical_complex.Cube([[0,0], [3,3], [0,0], [0,0], [0,0], [0,0], [0,0], [3,4], [0,0], [0,0], [1,1], [0,0]])), (-1, cubical_complex.Cube([[0,0], [3,3], [0,0], [0,0], [0,0], [0,0], [0,0], [4,5], [0,0], [0,0], [1,1], [0,0]])), (-1, cubical_complex.Cube([[0,0], [3,3], [0,0], [0,0], [0,1], [0,0], [0,0], [5,5], [0,0], [0,0], [1,1], [0,0]])), (-1, cubical_complex.Cube([[0,0], [3,3], [0,0], [0,0], [1,1], [0,0], [0,0], [5,5], [0,0], [0,0], [1,2], [0,0]])), (1, cubical_complex.Cube([[0,0], [3,3], [0,0], [0,0], [1,1], [0,0], [0,0], [4,5], [0,0], [0,0], [2,2], [0,0]])), (1, cubical_complex.Cube([[0,0], [3,3], [0,0], [0,0], [1,1], [0,0], [0,0], [4,4], [0,0], [0,0], [1,2], [0,0]])), (1, cubical_complex.Cube([[0,0], [3,3], [0,0], [0,0], [1,1], [0,0], [0,0], [4,4], [0,0], [0,0], [0,1], [0,0]])), (-1, cubical_complex.Cube([[0,0], [3,3], [0,0], [0,0], [1,1], [0,0], [0,0], [4,5], [0,0], [0,0], [0,0], [0,0]]))], [(1, cubical_complex.Cube([[0,0], [4,4], [0,0], [0,0], [1,2], [0,0], [0,0], [2,2], [0,0], [0,0], [4,4], [0,0]])), (1, cubical_complex.Cube([[0,0], [4,5], [0,0], [0,0], [2,2], [0,0], [0,0], [2,2], [0,0], [0,0], [4,4], [0,0]])), (-1, cubical_complex.Cube([[0,0], [5,5], [0,0], [0,0], [1,2], [0,0], [0,0], [2,2], [0,0], [0,0], [4,4], [0,0]])), (-1, cubical_complex.Cube([[0,0], [5,5], [0,0], [0,0], [1,1], [0,0], [0,0], [2,2], [0,0], [0,0], [3,4], [0,0]])), (-1, cubical_complex.Cube([[0,0], [5,5], [0,0], [0,0], [1,1], [0,0], [0,0], [1,2], [0,0], [0,0], [3,3], [0,0]])), (-1, cubical_complex.Cube([[0,0], [5,5], [0,0], [0,0], [1,1], [0,0], [0,0], [0,1], [0,0], [0,0], [3,3], [0,0]])), (-1, cubical_complex.Cube([[0,0], [4,5], [0,0], [0,0], [1,1], [0,0], [0,0], [0,0], [0,0], [0,0], [3,3], [0,0]])), (-1, cubical_complex.Cube([[0,0], [4,4], [0,0], [0,0], [1,1], [0,0], [0,0], [0,0], [0,0], [0,0], [2,3], [0,0]])), (-1, cubical_complex.Cube([[0,0], [4,4], [0,0], [0,0], [1,1], [0,0], [0,0], [0,0], [0,0], [0,0], [1,2], [0,0]])), (1, cubical_complex.Cube([[0,0], [4,4], [0,0], [0,0], [1,2], [0,0], [0,0], [0,0], [0,0], [0,0], [1,1], [0,0]])), (1, cubical_complex.Cube([[0,0], [4,4], [0,0], [0,0], [2,2], [0,0], [0,0], [0,1], [0,0], [0,0], [1,1], [0,0]])), (1, cubical_complex.Cube([[0,0], [4,4], [0,0], [0,0], [2,2], [0,0], [0,0], [1,2], [0,0], [0,0], [1,1], [0,0]])), (-1, cubical_complex.Cube([[0,0], [3,4], [0,0], [0,0], [2,2], [0,0], [0,0], [2,2], [0,0], [0,0], [1,1], [0,0]])), (-1, cubical_complex.Cube([[0,0], [3,3], [0,0], [0,0], [2,2], [0,0], [0,0], [2,2], [0,0], [0,0], [0,1], [0,0]])), (-1, cubical_complex.Cube([[0,0], [3,3], [0,0], [0,0], [1,2], [0,0], [0,0], [2,2], [0,0], [0,0], [0,0], [0,0]])), (1, cubical_complex.Cube([[0,0], [3,3], [0,0], [0,0], [1,1], [0,0], [0,0], [2,2], [0,0], [0,0], [0,1], [0,0]])), (1, cubical_complex.Cube([[0,0], [3,3], [0,0], [0,0], [1,1], [0,0], [0,0], [2,2], [0,0], [0,0], [1,2], [0,0]])), (1, cubical_complex.Cube([[0,0], [3,3], [0,0], [0,0], [1,1], [0,0], [0,0], [2,2], [0,0], [0,0], [2,3], [0,0]])), (-1, cubical_complex.Cube([[0,0], [3,3], [0,0], [0,0], [0,1], [0,0], [0,0], [2,2], [0,0], [0,0], [3,3], [0,0]])), (-1, cubical_complex.Cube([[0,0], [3,3], [0,0], [0,0], [0,0], [0,0], [0,0], [2,2], [0,0], [0,0], [2,3], [0,0]])), (1, cubical_complex.Cube([[0,0], [3,4], [0,0], [0,0], [0,0], [0,0], [0,0], [2,2], [0,0], [0,0], [2,2], [0,0]])), (1, cubical_complex.Cube([[0,0], [4,4], [0,0], [0,0], [0,0], [0,0], [0,0], [2,3], [0,0], [0,0], [2,2], [0,0]])), (1, cubical_complex.Cube([[0,0], [4,4], [0,0], [0,0], [0,0], [0,0], [0,0], [3,3], [0,0], [0,0], [2,3], [0,0]])), (1, cubical_complex.Cube([[0,0], [4,4], [0,0], [0,0], [0,1], [0,0], [0,0], [3,3], [0,0], [0,0], [3,3], [0,0]])), (1, cubical_complex.Cube([[0,0], [4,4], [0,0], [0,0], [1,1], [0,0], [0,0], [3,3], [0,0], [0,0], [3,4], [0,0]])), (-1, cubical_complex.Cube([[0,0], [4,4], [0,0], [0,0], [1,1], [0,0], [0,0], [2,3], [0,0], [0,0], [4,4], [0,0]]))], [(1, cubical_complex.Cube([[0,0], [4,4], [0,0], [0,0], [1,2], [0,0], [0,0], [0,0], [0,0], [0,0], [5,5], [0,0]])), (-1, cubical_complex.Cube([[0,0], [4,4], [0,0], [0,0], [1,1], [0,0], [0,0], [0,1], [0,0], [0,0], [5,5], [0,0]])), (1, cubical_complex.Cube([[0,0], [4,4], [0,0], [0,0], [1,1], [0,0], [0,0], [1,1], [0,0], [0,0], [4,5], [0,0]])), (-1, cubical_complex.Cube([[0,0], [4,4], [0,0], [0,0], [1,2], [0,0], [0,0], [1,1], [0,0], [0,0], [4,4], [0,0]])), (-1, cubical_complex.Cube([[0,0], [4,5], [0,0], [0,0], [2,2], [0,0], [0,0], [1,1], [0,0], [0,0], [4,4], [0,0]])), (-1, cubical_complex.Cube([[0,0], [5,5], [0,0], [0,0], [2,2], [0,0], [0,0], [1,2], [0,0], [0,0], [4,4], [0,0]])), (1, cubical_complex.Cube([[0,0], [5,5], [0,0], [0,0], [1,2], [0,0], [0,0], [2,2], [0,0], [0,0], [4,4], [0,0]])), (1, cubical_complex.Cube([[0,0], [5,5], [0,0], [0,0], [1,1], [0,0], [0,0], [2,2], [0,0], [0,0], [3,4], [0,0]])), (1, cubical_complex.Cube([[0,0], [5,5], [0,0], [0,0], [1,1], [0,0], [0,0], [1,2], [0,0], [0,0], [3,3], [0,0]])), (1, cubical_complex.Cube([[0,0], [5,5], [0,0], [0,0], [1,1], [0,0], [0,0], [0,1], [0,0], [0,0], [3,3], [0,0]])), (1, cubical_complex.Cube([[0,0], [4,5], [0,0], [0,0], [1,1], [0,0], [0,0], [0,0], [0,0], [0,0], [3,3], [0,0]])), (1, cubical_complex.Cube([[0,0], [4,4], [0,0], [0,0], [1,1], [0,0], [0,0], [0,0], [0,0], [0,0], [2,3], [0,0]])), (1, cubical_complex.Cube([[0,0], [4,4], [0,0], [0,0], [1,1], [0,0], [0,0], [0,0], [0,0], [0,0], [1,2], [0,0]])), (-1, cubical_complex.Cube([[0,0], [4,4], [0,0], [0,0], [1,2], [0,0], [0,0], [0,0], [0,0], [0,0], [1,1], [0,0]])), (-1, cubical_complex.Cube([[0,0], [4,4], [0,0], [0,0], [2,2], [0,0], [0,0], [0,1], [0,0], [0,0], [1,1], [0,0]])), (-1, cubical_complex.Cube([[0,0], [4,4], [0,0], [0,0], [2,2], [0,0], [0,0], [1,2], [0,0], [0,0], [1,1], [0,0]])), (1, cubical_complex.Cube([[0,0], [3,4], [0,0], [0,0], [2,2], [0,0], [0,0], [2,2], [0,0], [0,0], [1,1], [0,0]])), (1, cubical_complex.Cube([[0,0], [3,3], [0,0], [0,0], [2,2], [0,0], [0,0], [2,2], [0,0], [0,0], [0,1], [0,0]])), (1, cubical_complex.Cube([[0,0], [3,3], [0,0], [0,0], [1,2], [0,0], [0,0], [2,2], [0,0], [0,0], [0,0], [0,0]])), (-1, cubical_complex.Cube([[0,0], [3,3], [0,0], [0,0], [1,1], [0,0], [0,0], [2,2], [0,0], [0,0], [0,1], [0,0]])), (-1, cubical_complex.Cube([[0,0], [3,3], [0,0], [0,0], [1,1], [0,0], [0,0], [2,2], [0,0], [0,0], [1,2], [0,0]])), (-1, cubical_complex.Cube([[0,0], [3,3], [0,0], [0,0], [1,1], [0,0], [0,0], [2,2], [0,0], [0,0], [2,3], [0,0]])), (1, cubical_complex.Cube([[0,0], [3,3], [0,0], [0,0], [1,1], [0,0], [0,0], [1,2], [0,0], [0,0], [3,3], [0,0]])), (1, cubical_complex.Cube([[0,0], [3,3], [0,0], [0,0], [1,1], [0,0], [0,0], [1,1], [0,0], [0,0], [2,3], [0,0]])), (-1, cubical_complex.Cube([[0,0], [3,3], [0,0], [0,0], [1,2], [0,0], [0,0], [1,1], [0,0], [0,0], [2,2], [0,0]])), (-1, cubical_complex.Cube([[0,0], [3,3], [0,0], [0,0], [2,3], [0,0], [0,0], [1,1], [0,0], [0,0], [2,2], [0,0]])), (-1, cubical_complex.Cube([[0,0], [3,3], [0,0], [0,0], [3,3], [0,0], [0,0], [1,2], [0,0], [0,0], [2,2], [0,0]])), (-1, cubical_complex.Cube([[0,0], [3,3], [0,0], [0,0], [3,4], [0,0], [0,0], [2,2], [0,0], [0,0], [2,2], [0,0]])), (-1, cubical_complex.Cube([[0,0], [3,3], [0,0], [0,0], [4,4], [0,0], [0,0], [2,3], [0,0], [0,0], [2,2], [0,0]])), (-1, cubical_complex.Cube([[0,0], [3,3], [0,0], [0,0], [4,5], [0,0], [0,0], [3,3], [0,0], [0,0], [2,2], [0,0]])), (1, cubical_complex.Cube([[0,0], [3,3], [0,0], [0,0], [5,5], [0,0], [0,0], [2,3], [0,0], [0,0], [2,2], [0,0]])), (-1, cubical_complex.Cube([[0,0], [3,4], [0,0], [0,0], [5,5], [0,0], [0,0], [2,2], [0,0], [0,0], [2,2], [0,0]])), (1, cubical_complex.Cube([[0,0], [4,4], [0,0], [0,0], [5,5], [0,0], [0,0], [2,2], [0,0], [0,0], [1,2], [0,0]])), (-1, cubical_complex.Cube([[0,0], [4,4], [0,0], [0,0], [5,5], [0,0], [0,0], [2,3], [0,0], [0,0], [1,1], [0,0]])), (-1, cubical_complex.Cube([[0,0], [4,4], [0,0], [0,0], [5,5], [0,0], [0,0], [3,3], [0,0], [0,0], [1,2], [0,0]])), (-1, cubical_complex.Cube([[0,0], [4,4], [0,0], [0,0], [5,5], [0,0], [0,0], [3,4], [0,0], [0,0], [2,2], [0,0]])), (1, cubical_complex.Cube([[0,0], [4,4], [0,0], [0,0], [5,5], [0,0], [0,0], [4,4], [0,0], [0,0], [1,2], [0,0]])), (1, cubical_complex.Cube([[0,0], [3,4], [0,0], [0,0], [5,5], [0,0], [0,0], [4,4], [0,0], [0,0], [1,1], [0,0]])), (1, cubical_complex.Cube([[0,0], [3,3], [0,0], [0,0], [5,5], [0,0], [0,0], [3,4], [0,0], [0,0], [1,1], [0,0]])), (1, cubical_complex.Cube([[0,0], [2,3], [0,0], [0,0], [5,5], [0,0], [0,0], [3,3], [0,0], [0,0], [1,1], [0,0]])), (1, cubical_complex.Cube([[0,0], [2,2], [0,0], [0,0], [4,5], [0,0], [0,0], [3,3], [0,0], [0,0], [1,1], [0,0]])), (1, cubical_complex.Cube([[0,0], [1,2], [0,0], [0,0], [4,4], [0,0], [0,0], [3,3], [0,0], [0,0], [1,1], [0,0]])), (1, cubical_complex.Cube([[0,0], [1,1], [0,0], [0,0], [3,4], [0,0], [0,0], [3,3], [0,0], [0,0], [1,1], [0,0]])), (1, cubical_complex.Cube([[0,0], [0,1], [0,0], [0,0], [3,3], [0,0], [0,0], [3,3], [0,0], [0,0], [1,1], [0,0]])), (1, cubical_complex.Cube([[0,0], [0,0], [0,0], [0,0], [3,3], [0,0], [0,0], [3,3], [0,0], [0,0], [0,1], [0,0]])), (1, cubical_complex.Cube([[0,0], [0,0], [0,0], [0,0], [2,3], [0,0], [0,0], [3,3], [0,0], [0,0], [0,0], [0,0]])), (1, cubical_complex.Cube([[0,0], [0,0], [0,0], [0,0], [1,2], [0,0], [0,0], [3,3], [0,0], [0,0], [0,0], [0,0]])), (-1, cubical_complex.Cube([[0,0], [0,1], [0,0], [0,0], [1,1], [0,0], [0,0], [3,3], [0,0], [0,0], [0,0], [0,0]])), (-1, cubical_complex.Cube([[0,0], [1,1], [0,0], [0,0], [1,1], [0,0], [0,0], [3,4], [0,0], [0,0], [0,0], [0,0]])), (-1, cubical_complex.Cube([[0,0], [1,1], [0,0], [0,0], [1,2], [0,0], [0,0], [4,4], [0,0], [0,0], [0,0], [0,0]])), (-1, cubical_complex.Cube([[0,0], [1,1], [0,0], [0,0], [2,2], [0,0], [0,0], [4,5], [0,0], [0,0], [0,0], [0,0]])), (1, cubical_complex.Cube([[0,0], [0,1], [0,0], [0,0], [2,2], [0,0], [0,0], [5,5], [0,0], [0,0], [0,0], [0,0]])), (-1, cubical_complex.Cube([[0,0], [0,0], [0,0], [0,0], [2,2], [0,0], [0,0], [5,5], [0,0], [0,0], [0,1], [0,0]])), (-1, cubical_complex.Cube([[0,0], [0,0], [0,0], [0,0], [2,3], [0,0], [0,0], [5,5], [0,0], [0,0], [1,1], [0,0]])), (-1, cubical_complex.Cube([[0,0], [0,0], [0,0], [0,0], [3,3], [0,0], [0,0], [5,5], [0,0], [0,0], [1,2], [0,0]])), (-1, cubical_complex.Cube([[0,0], [0,1], [0,0], [0,0], [3,3], [0,0], [0,0], [5,5], [0,0], [0,0], [2,2], [0,0]])), (-1, cubical_complex.Cube([[0,0], [1,1], [0,0], [0,0], [3,4], [0,0], [0,0], [5,5], [0,0], [0,0], [2,2], [0,0]])), (-1, cubical_complex.Cube([[0,0], [1,1], [0,0], [0,0], [4,4], [0,0], [0,0], [5,5], [0,0], [0,0], [2,3], [0,0]])), (1, cubical_complex.Cube([[0,0], [0,1], [0,0], [0,0], [4,4], [0,0], [0,0], [5,5], [0,0], [0,0], [3,3], [0,0]])), (1, cubical_complex.Cube([[0,0], [0,0], [0,0], [0,0], [3,4], [0,0], [0,0], [5,5], [0,0], [0,0], [3,3], [0,0]])), (1, cubical_complex.Cube([[0,0], [0,0], [0,0], [0,0], [3,3], [0,0], [0,0], [4,5], [0,0], [0,0], [3,3], [0,0]])), (-1, cubical_complex.Cube([[0,0], [0,0], [0,0], [0,0], [3,3], [0,0], [0,0], [4,4], [0,0], [0,0], [3,4], [0,0]])), (-1, cubical_complex.Cube([[0,0], [0,0], [0,0], [0,0], [3,3], [0,0], [0,0], [4,4], [0,0], [0,0], [4,5], [0,0]])), (-1, cubical_complex.Cube([[0,0], [0,1], [0,0], [0,0], [3,3], [0,0], [0,0], [4,4], [0,0], [0,0], [5,5], [0,0]])), (1, cubical_complex.Cube([[0,0], [1,1], [0,0], [0,0], [2,3], [0,0], [0,0], [4,4], [0,0], [0,0], [5,5], [0,0]])), (1, cubical_complex.Cube([[0,0], [1,1], [0,0], [0,0], [2,2], [0,0], [0,0], [4,4], [0,0], [0,0], [4,5], [0,0]])), (-1, cubical_complex.Cube([[0,0], [1,1], [0,0], [0,0], [2,3], [0,0], [0,0], [4,4], [0,0], [0,0], [4,4], [0,0]])), (-1, cubical_complex.Cube([[0,0], [1,1], [0,0], [0,0], [3,3], [0,0], [0,0], [4,5], [0,0], [0,0], [4,4], [0,0]])), (-1, cubical_complex.Cube([[0,0], [1,1], [0,0], [0,0], [3,4], [0,0], [0,0], [5,5], [0,0], [0,0], [4,4], [0,0]])), (-1, cubical_complex.Cube([[0,0], [1,1], [0,0], [0,0], [4,4], [0,0], [0,0], [5,5], [0,0], [0,0], [4,5], [0,0]])), (1, cubical_complex.Cube([[0,0], [1,1], [0,0], [0,0], [4,4], [0,0], [0,0], [4,5], [0,0], [0,0], [5,5], [0,0]])), (-1, cubical_complex.Cube([[0,0], [1,1], [0,0], [0,0], [4,5], [0,0], [0,0], [4,4], [0,0], [0,0], [5,5], [0,0]])), (1, cubical_complex.Cube([[0,0], [1,1], [0,0], [0,0], [5,5], [0,0], [0,0], [4,4], [0,0], [0,0], [4,5], [0,0]])), (1, cubical_complex.Cube([[0,0], [1,1], [0,0], [0,0], [5,5], [0,0], [0,0], [3,4], [0,0], [0,0], [4,4], [0,0]])), (1, cubical_complex.Cube([[0,0], [1,1], [0,0], [0,0], [5,5], [0,0], [0,0], [2,3], [0,0], [0,0], [4,4], [0,0]])), (1, cubical_complex.Cube([[0,0], [1,1], [0,0], [0,0], [5,5], [0,0], [0,0], [1,2], [0,0], [0,0], [4,4], [0,0]])), (1, cubical_complex.Cube([[0,0], [1,1], [0,0], [0,0], [4,5], [0,0], [0,0], [1,1], [0,0], [0,0], [4,4], [0,0]])), (-1, cubical_complex.Cube([[0,0], [1,2], [0,0], [0,0], [4,4], [0,0], [0,0], [1,1], [0,0], [0,0], [4,4], [0,0]])), (1, cubical_complex.Cube([[0,0], [2,2], [0,0], [0,0], [3,4], [0,0], [0,0], [1,1], [0,0], [0,0], [4,4], [0,0]])), (1, cubical_complex.Cube([[0,0], [2,2], [0,0], [0,0], [3,3], [0,0], [0,0], [0,1], [0,0], [0,0], [4,4], [0,0]])), (-1, cubical_complex.Cube([[0,0], [2,2], [0,0], [0,0], [3,3], [0,0], [0,0], [0,0], [0,0], [0,0], [4,5], [0,0]])), (1, cubical_complex.Cube([[0,0], [2,2], [0,0], [0,0], [2,3], [0,0], [0,0], [0,0], [0,0], [0,0], [5,5], [0,0]])), (-1, cubical_complex.Cube([[0,0], [2,3], [0,0], [0,0], [2,2], [0,0], [0,0], [0,0], [0,0], [0,0], [5,5], [0,0]])), (-1, cubical_complex.Cube([[0,0], [3,4], [0,0], [0,0], [2,2], [0,0], [0,0], [0,0], [0,0], [0,0], [5,5], [0,0]]))], [(1, cubical_complex.Cube([[0,0], [1,2], [0,0], [0,0], [1,1], [0,0], [0,0], [5,5], [0,0], [0,0], [2,2], [0,0]])), (-1, cubical_complex.Cube([[0,0], [2,2], [0,0], [0,0], [0,1], [0,0], [0,0], [5,5], [0,0], [0,0], [2,2], [0,0]])), (-1, cubical_complex.Cube([[0,0], [2,2], [0,0], [0,0], [0,0], [0,0], [0,0], [4,5], [0,0], [0,0], [2,2], [0,0]])), (1, cubical_complex.Cube([[0,0], [2,3], [0,0], [0,0], [0,0], [0,0], [0,0], [4,4], [0,0], [0,0], [2,2], [0,0]])), (1, cubical_complex.Cube([[0,0], [3,3], [0,0], [0,0], [0,0], [0,0], [0,0], [4,5], [0,0], [0,0], [2,2], [0,0]])), (-1, cubical_complex.Cube([[0,0], [3,3], [0,0], [0,0], [0,0], [0,0], [0,0], [5,5], [0,0], [0,0], [1,2], [0,0]])), (-1, cubical_complex.Cube([[0,0], [3,3], [0,0], [0,0], [0,0], [0,0], [0,0], [4,5], [0,0], [0,0], [1,1], [0,0]])), (-1, cubical_complex.Cube([[0,0], [3,3], [0,0], [0,0], [0,0], [0,0], [0,0], [3,4], [0,0], [0,0], [1,1], [0,0]])), (1, cubical_complex.Cube([[0,0], [3,4], [0,0], [0,0], [0,0], [0,0], [0,0], [3,3], [0,0], [0,0], [1,1], [0,0]])), (1, cubical_complex.Cube([[0,0], [4,4], [0,0], [0,0], [0,0], [0,0], [0,0], [3,3], [0,0], [0,0], [1,2], [0,0]])), (-1, cubical_complex.Cube([[0,0], [4,4], [0,0], [0,0], [0,0], [0,0], [0,0], [2,3], [0,0], [0,0], [2,2], [0,0]])), (-1, cubical_complex.Cube([[0,0], [3,4], [0,0], [0,0], [0,0], [0,0], [0,0], [2,2], [0,0], [0,0], [2,2], [0,0]])), (1, cubical_complex.Cube([[0,0], [3,3], [0,0], [0,0], [0,0], [0,0], [0,0], [2,2], [0,0], [0,0], [2,3], [0,0]])), (1, cubical_complex.Cube([[0,0], [3,3], [0,0], [0,0], [0,1], [0,0], [0,0], [2,2], [0,0], [0,0], [3,3], [0,0]])), (-1, cubical_complex.Cube([[0,0], [3,3], [0,0], [0,0], [1,1], [0,0], [0,0], [1,2], [0,0], [0,0], [3,3], [0,0]])), (-1, cubical_complex.Cube([[0,0], [3,3], [0,0], [0,0], [1,1], [0,0], [0,0], [1,1], [0,0], [0,0], [2,3], [0,0]])), (1, cubical_complex.Cube([[0,0], [3,3], [0,0], [0,0], [1,2], [0,0], [0,0], [1,1], [0,0], [0,0], [2,2], [0,0]])), (1, cubical_complex.Cube([[0,0], [3,3], [0,0], [0,0], [2,3], [0,0], [0,0], [1,1], [0,0], [0,0], [2,2], [0,0]])), (1, cubical_complex.Cube([[0,0], [3,3], [0,0], [0,0], [3,3], [0,0], [0,0], [1,2], [0,0], [0,0], [2,2], [0,0]])), (1, cubical_complex.Cube([[0,0], [3,3], [0,0], [0,0], [3,4], [0,0], [0,0], [2,2], [0,0], [0,0], [2,2], [0,0]])), (1, cubical_complex.Cube([[0,0], [3,3], [0,0], [0,0], [4,4], [0,0], [0,0], [2,3], [0,0], [0,0], [2,2], [0,0]])), (1, cubical_complex.Cube([[0,0], [3,3], [0,0], [0,0], [4,5], [0,0], [0,0], [3,3], [0,0], [0,0], [2,2], [0,0]])), (-1, cubical_complex.Cube([[0,0], [3,3], [0,0], [0,0], [5,5], [0,0], [0,0], [2,3], [0,0], [0,0], [2,2], [0,0]])), (1, cubical_complex.Cube([[0,0], [3,4], [0,0], [0,0], [5,5], [0,0], [0,0], [2,2], [0,0], [0,0], [2,2], [0,0]])), (-1, cubical_complex.Cube([[0,0], [4,4], [0,0], [0,0], [5,5], [0,0], [0,0], [2,2], [0,0], [0,0], [1,2], [0,0]])), (1, cubical_complex.Cube([[0,0], [4,4], [0,0], [0,0], [5,5], [0,0], [0,0], [2,3], [0,0], [0,0], [1,1], [0,0]])), (1, cubical_complex.Cube([[0,0], [4,4], [0,0], [0,0], [5,5], [0,0], [0,0], [3,3], [0,0], [0,0], [1,2], [0,0]])), (1, cubical_complex.Cube([[0,0], [4,4], [0,0], [0,0], [5,5], [0,0], [0,0], [3,4], [0,0], [0,0], [2,2], [0,0]])), (-1, cubical_complex.Cube([[0,0], [4,4], [0,0], [0,0], [5,5], [0,0], [0,0], [4,4], [0,0], [0,0], [1,2], [0,0]])), (-1, cubical_complex.Cube([[0,0], [3,4], [0,0], [0,0], [5,5], [0,0], [0,0], [4,4], [0,0], [0,0], [1,1], [0,0]])), (-1, cubical_complex.Cube([[0,0], [3,3], [0,0], [0,0], [5,5], [0,0], [0,0], [3,4], [0,0], [0,0], [1,1], [0,0]])), (-1, cubical_complex.Cube([[0,0], [2,3], [0,0], [0,0], [5,5], [0,0], [0,0], [3,3], [0,0], [0,0], [1,1], [0,0]])), (-1, cubical_complex.Cube([[0,0], [2,2], [0,0], [0,0], [4,5], [0,0], [0,0], [3,3], [0,0], [0,0], [1,1], [0,0]])), (-1, cubical_complex.Cube([[0,0], [1,2], [0,0], [0,0], [4,4], [0,0], [0,0], [3,3], [0,0], [0,0], [1,1], [0,0]])), (-1, cubical_complex.Cube([[0,0], [1,1], [0,0], [0,0], [3,4], [0,0], [0,0], [3,3], [0,0], [0,0], [1,1], [0,0]])), (-1, cubical_complex.Cube([[0,0], [0,1], [0,0], [0,0], [3,3], [0,0], [0,0], [3,3], [0,0], [0,0], [1,1], [0,0]])), (-1, cubical_complex.Cube([[0,0], [0,0], [0,0], [0,0], [3,3], [0,0], [0,0], [3,3], [0,0], [0,0], [0,1], [0,0]])), (-1, cubical_complex.Cube([[0,0], [0,0], [0,0], [0,0], [2,3], [0,0], [0,0], [3,3], [0,0], [0,0], [0,0], [0,0]])), (-1, cubical_complex.Cube([[0,0], [0,0], [0,0], [0,0], [1,2], [0,0], [0,0], [3,3], [0,0], [0,0], [0,0], [0,0]])), (1, cubical_complex.Cube([[0,0], [0,1], [0,0], [0,0], [1,1], [0,0], [0,0], [3,3], [0,0], [0,0], [0,0], [0,0]])), (1, cubical_complex.Cube([[0,0], [1,1], [0,0], [0,0], [1,1], [0,0], [0,0], [3,4], [0,0], [0,0], [0,0], [0,0]])), (1, cubical_complex.Cube([[0,0], [1,1], [0,0], [0,0], [1,2], [0,0], [0,0], [4,4], [0,0], [0,0], [0,0], [0,0]])), (1, cubical_complex.Cube([[0,0], [1,1], [0,0], [0,0], [2,2], [0,0], [0,0], [4,5], [0,0], [0,0], [0,0], [0,0]])), (-1, cubical_complex.Cube([[0,0], [0,1], [0,0], [0,0], [2,2], [0,0], [0,0], [5,5], [0,0], [0,0], [0,0], [0,0]])), (1, cubical_complex.Cube([[0,0], [0,0], [0,0], [0,0], [2,2], [0,0], [0,0], [5,5], [0,0], [0,0], [0,1], [0,0]])), (1, cubical_complex.Cube([[0,0], [0,0], [0,0], [0,0], [2,3], [0,0], [0,0], [5,5], [0,0], [0,0], [1,1], [0,0]])), (1, cubical_complex.Cube([[0,0], [0,0], [0,0], [0,0], [3,3], [0,0], [0,0], [5,5], [0,0], [0,0], [1,2], [0,0]])), (1, cubical_complex.Cube([[0,0], [0,1], [0,0], [0,0], [3,3], [0,0], [0,0], [5,5], [0,0], [0,0], [2,2], [0,0]])), (1, cubical_complex.Cube([[0,0], [1,1], [0,0], [0,0], [3,4], [0,0], [0,0], [5,5], [0,0], [0,0], [2,2], [0,0]])), (1, cubical_complex.Cube([[0,0], [1,1], [0,0], [0,0], [4,4], [0,0], [0,0], [5,5], [0,0], [0,0], [2,3], [0,0]])), (-1, cubical_complex.Cube([[0,0], [0,1], [0,0], [0,0], [4,4], [0,0], [0,0], [5,5], [0,0], [0,0], [3,3], [0,0]])), (-1, cubical_complex.Cube([[0,0], [0,0], [0,0], [0,0], [3,4], [0,0], [0,0], [5,5], [0,0], [0,0], [3,3], [0,0]])), (-1, cubical_complex.Cube([[0,0], [0,0], [0,0], [0,0], [3,3], [0,0], [0,0], [4,5], [0,0], [0,0], [3,3], [0,0]])), (1, cubical_complex.Cube([[0,0], [0,0], [0,0], [0,0], [3,3], [0,0], [0,0], [4,4], [0,0], [0,0], [3,4], [0,0]])), (1, cubical_complex.Cube([[0,0], [0,0], [0,0], [0,0], [3,3], [0,0], [0,0], [4,4], [0,0], [0,0], [4,5], [0,0]])), (1, cubical_complex.Cube([[0,0], [0,1], [0,0], [0,0], [3,3], [0,0], [0,0], [4,4], [0,0], [0,0], [5,5], [0,0]])), (-1, cubical_complex.Cube([[0,0], [1,1], [0,0], [0,0], [2,3], [0,0], [0,0], [4,4], [0,0], [0,0], [5,5], [0,0]])), (-1, cubical_complex.Cube([[0,0], [1,1], [0,0], [0,0], [2,2], [0,0], [0,0], [4,4], [0,0], [0,0], [4,5], [0,0]])), (1, cubical_complex.Cube([[0,0], [1,1], [0,0], [0,0], [2,3], [0,0], [0,0], [4,4], [0,0], [0,0], [4,4], [0,0]])), (1, cubical_complex.Cube([[0,0], [1,1], [0,0], [0,0], [3,3], [0,0], [0,0], [4,5], [0,0], [0,0], [4,4], [0,0]])), (1, cubical_complex.Cube([[0,0], [1,1], [0,0], [0,0], [3,4], [0,0], [0,0], [5,5], [0,0], [0,0], [4,4], [0,0]])), (1, cubical_complex.Cube([[0,0], [1,1], [0,0], [0,0], [4,4], [0,0], [0,0], [5,5], [0,0], [0,0], [4,5], [0,0]])), (-1, cubical_complex.Cube([[0,0], [1,1], [0,0], [0,0], [4,4], [0,0], [0,0], [4,5], [0,0], [0,0], [5,5], [0,0]])), (1, cubical_complex.Cube([[0,0], [1,1], [0,0], [0,0], [4,5], [0,0], [0,0], [4,4], [0,0], [0,0], [5,5], [0,0]])), (-1, cubical_complex.Cube([[0,0], [1,1], [0,0], [0,0], [5,5], [0,0], [0,0], [4,4], [0,0], [0,0], [4,5], [0,0]])), (-1, cubical_complex.Cube([[0,0], [1,1], [0,0], [0,0], [5,5], [0,0], [0,0], [3,4], [0,0], [0,0], [4,4], [0,0]])), (-1, cubical_complex.Cube([[0,0], [1,1], [0,0], [0,0], [4,5], [0,0], [0,0], [3,3], [0,0], [0,0], [4,4], [0,0]])), (1, cubical_complex.Cube([[0,0], [1,2], [0,0], [0,0], [4,4], [0,0], [0,0], [3,3], [0,0], [0,0], [4,4], [0,0]])), (-1, cubical_complex.Cube([[0,0], [2,2], [0,0], [0,0], [3,4], [0,0], [0,0], [3,3], [0,0], [0,0], [4,4], [0,0]])), (1, cubical_complex.Cube([[0,0], [2,2], [0,0], [0,0], [3,3], [0,0], [0,0], [3,3], [0,0], [0,0], [4,5], [0,0]])), (-1, cubical_complex.Cube([[0,0], [2,2], [0,0], [0,0], [2,3], [0,0], [0,0], [3,3], [0,0], [0,0], [5,5], [0,0]])), (-1, cubical_complex.Cube([[0,0], [2,2], [0,0], [0,0], [2,2], [0,0], [0,0], [3,3], [0,0], [0,0], [4,5], [0,0]])), (-1, cubical_complex.Cube([[0,0], [2,2], [0,0], [0,0], [2,2], [0,0], [0,0], [3,3], [0,0], [0,0], [3,4], [0,0]])), (1, cubical_complex.Cube([[0,0], [2,2], [0,0], [0,0], [2,2], [0,0], [0,0], [3,4], [0,0], [0,0], [3,3], [0,0]])), (-1, cubical_complex.Cube([[0,0], [2,2], [0,0], [0,0], [1,2], [0,0], [0,0], [4,4], [0,0], [0,0], [3,3], [0,0]])), (-1, cubical_complex.Cube([[0,0], [1,2], [0,0], [0,0], [1,1], [0,0], [0,0], [4,4], [0,0], [0,0], [3,3], [0,0]])), (1, cubical_complex.Cube([[0,0], [1,1], [0,0], [0,0], [1,1], [0,0], [0,0], [4,5], [0,0], [0,0], [3,3], [0,0]])), (-1, cubical_complex.Cube([[0,0], [1,1], [0,0], [0,0], [1,1], [0,0], [0,0], [5,5], [0,0], [0,0], [2,3], [0,0]]))], [(1, cubical_complex.Cube([[0,0], [2,2], [0,0], [0,0], [4,4], [0,0], [0,0], [2,3], [0,0], [0,0], [1,1], [0,0]])), (-1, cubical_complex.Cube([[0,0], [1,2], [0,0], [0,0], [4,4], [0,0], [0,0], [3,3], [0,0], [0,0], [1,1], [0,0]])), (-1, cubical_complex.Cube([[0,0], [1,1], [0,0], [0,0], [3,4], [0,0], [0,0], [3,3], [0,0], [0,0], [1,1], [0,0]])), (-1, cubical_complex.Cube([[0,0], [0,1], [0,0], [0,0], [3,3], [0,0], [0,0], [3,3], [0,0], [0,0], [1,1], [0,0]])), (-1, cubical_complex.Cube([[0,0], [0,0], [0,0], [0,0], [3,3], [0,0], [0,0], [3,3], [0,0], [0,0], [0,1], [0,0]])), (-1, cubical_complex.Cube([[0,0], [0,0], [0,0], [0,0], [2,3], [0,0], [0,0], [3,3], [0,0], [0,0], [0,0], [0,0]])), (-1, cubical_complex.Cube([[0,0], [0,0], [0,0], [0,0], [1,2], [0,0], [0,0], [3,3], [0,0], [0,0], [0,0], [0,0]])), (1, cubical_complex.Cube([[0,0], [0,1], [0,0], [0,0], [1,1], [0,0], [0,0], [3,3], [0,0], [0,0], [0,0], [0,0]])), (1, cubical_complex.Cube([[0,0], [1,1], [0,0], [0,0], [1,1], [0,0], [0,0], [3,4], [0,0], [0,0], [0,0], [0,0]])), (1, cubical_complex.Cube([[0,0], [1,1], [0,0], [0,0], [1,2], [0,0], [0,0], [4,4], [0,0], [0,0], [0,0], [0,0]])), (1, cubical_complex.Cube([[0,0], [1,1], [0,0], [0,0], [2,2], [0,0], [0,0], [4,5], [0,0], [0,0], [0,0], [0,0]])), (-1, cubical_complex.Cube([[0,0], [0,1], [0,0], [0,0], [2,2], [0,0], [0,0], [5,5], [0,0], [0,0], [0,0], [0,0]])), (1, cubical_complex.Cube([[0,0], [0,0], [0,0], [0,0], [2,2], [0,0], [0,0], [5,5], [0,0], [0,0], [0,1], [0,0]])), (1, cubical_complex.Cube([[0,0], [0,0], [0,0], [0,0], [2,3], [0,0], [0,0], [5,5], [0,0], [0,0], [1,1], [0,0]])), (1, cubical_complex.Cube([[0,0], [0,0], [0,0], [0,0], [3,3], [0,0], [0,0], [5,5], [0,0], [0,0], [1,2], [0,0]])), (1, cubical_complex.Cube([[0,0], [0,1], [0,0], [0,0], [3,3], [0,0], [0,0], [5,5], [0,0], [0,0], [2,2], [0,0]])), (1, cubical_complex.Cube([[0,0], [1,1], [0,0], [0,0], [3,4], [0,0], [0,0], [5,5], [0,0], [0,0], [2,2], [0,0]])), (1, cubical_complex.Cube([[0,0], [1,2], [0,0], [0,0], [4,4], [0,0], [0,0], [5,5], [0,0], [0,0], [2,2], [0,0]])), (-1, cubical_complex.Cube([[0,0], [2,2], [0,0], [0,0], [4,4], [0,0], [0,0], [4,5], [0,0], [0,0], [2,2], [0,0]])), (1, cubical_complex.Cube([[0,0], [2,3], [0,0], [0,0], [4,4], [0,0], [0,0], [4,4], [0,0], [0,0], [2,2], [0,0]])), (1, cubical_complex.Cube([[0,0], [3,3], [0,0], [0,0], [4,4], [0,0], [0,0], [4,5], [0,0], [0,0], [2,2], [0,0]])), (1, cubical_complex.Cube([[0,0], [3,4], [0,0], [0,0], [4,4], [0,0], [0,0], [5,5], [0,0], [0,0], [2,2], [0,0]])), (1, cubical_complex.Cube([[0,0], [4,4], [0,0], [0,0], [4,4], [0,0], [0,0], [5,5], [0,0], [0,0], [2,3], [0,0]])), (-1, cubical_complex.Cube([[0,0], [3,4], [0,0], [0,0], [4,4], [0,0], [0,0], [5,5], [0,0], [0,0], [3,3], [0,0]])), (-1, cubical_complex.Cube([[0,0], [3,3], [0,0], [0,0], [4,4], [0,0], [0,0], [4,5], [0,0], [0,0], [3,3], [0,0]])), (-1, cubical_complex.Cube([[0,0], [2,3], [0,0], [0,0], [4,4], [0,0], [0,0], [4,4], [0,0], [0,0], [3,3], [0,0]])), (-1, cubical_complex.Cube([[0,0], [2,2], [0,0], [0,0], [4,4], [0,0], [0,0], [3,4], [0,0], [0,0], [3,3], [0,0]])), (-1, cubical_complex.Cube([[0,0], [2,2], [0,0], [0,0], [4,4], [0,0], [0,0], [2,3], [0,0], [0,0], [3,3], [0,0]])), (-1, cubical_complex.Cube([[0,0], [2,2], [0,0], [0,0], [4,4], [0,0], [0,0], [1,2], [0,0], [0,0], [3,3], [0,0]])), (-1, cubical_complex.Cube([[0,0], [2,2], [0,0], [0,0], [4,4], [0,0], [0,0], [1,1], [0,0], [0,0], [2,3], [0,0]])), (-1, cubical_complex.Cube([[0,0], [2,2], [0,0], [0,0], [4,4], [0,0], [0,0], [1,1], [0,0], [0,0], [1,2], [0,0]])), (1, cubical_complex.Cube([[0,0], [2,2], [0,0], [0,0], [4,4], [0,0], [0,0], [1,2], [0,0], [0,0], [1,1], [0,0]]))], [(1, cubical_complex.Cube([[0,0], [4,4], [0,0], [0,0], [0,0], [0,0], [0,0], [2,3], [0,0], [0,0], [5,5], [0,0]])), (-1, cubical_complex.Cube([[0,0], [4,4], [0,0], [0,0], [0,1], [0,0], [0,0], [2,2], [0,0], [0,0], [5,5], [0,0]])), (-1, cubical_complex.Cube([[0,0], [4,4], [0,0], [0,0], [1,2], [0,0], [0,0], [2,2], [0,0], [0,0], [5,5], [0,0]])), (1, cubical_complex.Cube([[0,0], [4,4], [0,0], [0,0], [2,2], [0,0], [0,0], [2,2], [0,0], [0,0], [4,5], [0,0]])), (-1, cubical_complex.Cube([[0,0], [4,5], [0,0], [0,0], [2,2], [0,0], [0,0], [2,2], [0,0], [0,0], [4,4], [0,0]])), (1, cubical_complex.Cube([[0,0], [5,5], [0,0], [0,0], [1,2], [0,0], [0,0], [2,2], [0,0], [0,0], [4,4], [0,0]])), (1, cubical_complex.Cube([[0,0], [5,5], [0,0], [0,0], [1,1], [0,0], [0,0], [2,2], [0,0], [0,0], [3,4], [0,0]])), (1, cubical_complex.Cube([[0,0], [5,5], [0,0], [0,0], [1,1], [0,0], [0,0], [1,2], [0,0], [0,0], [3,3], [0,0]])), (1, cubical_complex.Cube([[0,0], [5,5], [0,0], [0,0], [1,1], [0,0], [0,0], [0,1], [0,0], [0,0], [3,3], [0,0]])), (1, cubical_complex.Cube([[0,0], [4,5], [0,0], [0,0], [1,1], [0,0], [0,0], [0,0], [0,0], [0,0], [3,3], [0,0]])), (1, cubical_complex.Cube([[0,0], [4,4], [0,0], [0,0], [1,1], [0,0], [0,0], [0,0], [0,0], [0,0], [2,3], [0,0]])), (1, cubical_complex.Cube([[0,0], [4,4], [0,0], [0,0], [1,1], [0,0], [0,0], [0,0], [0,0], [0,0], [1,2], [0,0]])), (-1, cubical_complex.Cube([[0,0], [4,4], [0,0], [0,0], [1,2], [0,0], [0,0], [0,0], [0,0], [0,0], [1,1], [0,0]])), (-1, cubical_complex.Cube([[0,0], [4,4], [0,0], [0,0], [2,2], [0,0], [0,0], [0,1], [0,0], [0,0], [1,1], [0,0]])), (-1, cubical_complex.Cube([[0,0], [4,4], [0,0], [0,0], [2,2], [0,0], [0,0], [1,2], [0,0], [0,0], [1,1], [0,0]])), (1, cubical_complex.Cube([[0,0], [3,4], [0,0], [0,0], [2,2], [0,0], [0,0], [2,2], [0,0], [0,0], [1,1], [0,0]])), (1, cubical_complex.Cube([[0,0], [3,3], [0,0], [0,0], [2,2], [0,0], [0,0], [2,2], [0,0], [0,0], [0,1], [0,0]])), (1, cubical_complex.Cube([[0,0], [3,3], [0,0], [0,0], [1,2], [0,0], [0,0], [2,2], [0,0], [0,0], [0,0], [0,0]])), (-1, cubical_complex.Cube([[0,0], [3,3], [0,0], [0,0], [1,1], [0,0], [0,0], [2,2], [0,0], [0,0], [0,1], [0,0]])), (-1, cubical_complex.Cube([[0,0], [3,3], [0,0], [0,0], [1,1], [0,0], [0,0], [2,2], [0,0], [0,0], [1,2], [0,0]])), (-1, cubical_complex.Cube([[0,0], [3,3], [0,0], [0,0], [1,1], [0,0], [0,0], [2,2], [0,0], [0,0], [2,3], [0,0]])), (1, cubical_complex.Cube([[0,0], [3,3], [0,0], [0,0], [1,1], [0,0], [0,0], [1,2], [0,0], [0,0], [3,3], [0,0]])), (1, cubical_complex.Cube([[0,0], [3,3], [0,0], [0,0], [1,1], [0,0], [0,0], [1,1], [0,0], [0,0], [2,3], [0,0]])), (-1, cubical_complex.Cube([[0,0], [3,3], [0,0], [0,0], [1,2], [0,0], [0,0], [1,1], [0,0], [0,0], [2,2], [0,0]])), (-1, cubical_complex.Cube([[0,0], [3,3], [0,0], [0,0], [2,3], [0,0], [0,0], [1,1], [0,0], [0,0], [2,2], [0,0]])), (-1, cubical_complex.Cube([[0,0], [3,3], [0,0], [0,0], [3,3], [0,0], [0,0], [1,2], [0,0], [0,0], [2,2], [0,0]])), (-1, cubical_complex.Cube([[0,0], [3,3], [0,0], [0,0], [3,4], [0,0], [0,0], [2,2], [0,0], [0,0], [2,2], [0,0]])), (-1, cubical_complex.Cube([[0,0], [3,3], [0,0], [0,0], [4,4], [0,0], [0,0], [2,3], [0,0], [0,0], [2,2], [0,0]])), (-1, cubical_complex.Cube([[0,0], [3,3], [0,0], [0,0], [4,5], [0,0], [0,0], [3,3], [0,0], [0,0], [2,2], [0,0]])), (1, cubical_complex.Cube([[0,0], [3,3], [0,0], [0,0], [5,5], [0,0], [0,0], [2,3], [0,0], [0,0], [2,2], [0,0]])), (-1, cubical_complex.Cube([[0,0], [3,4], [0,0], [0,0], [5,5], [0,0], [0,0], [2,2], [0,0], [0,0], [2,2], [0,0]])), (1, cubical_complex.Cube([[0,0], [4,4], [0,0], [0,0], [5,5], [0,0], [0,0], [2,2], [0,0], [0,0], [1,2], [0,0]])), (-1, cubical_complex.Cube([[0,0], [4,4], [0,0], [0,0], [5,5], [0,0], [0,0], [2,3], [0,0], [0,0], [1,1], [0,0]])), (-1, cubical_complex.Cube([[0,0], [4,4], [0,0], [0,0], [5,5], [0,0], [0,0], [3,3], [0,0], [0,0], [1,2], [0,0]])), (-1, cubical_complex.Cube([[0,0], [4,4], [0,0], [0,0], [5,5], [0,0], [0,0], [3,4], [0,0], [0,0], [2,2], [0,0]])), (1, cubical_complex.Cube([[0,0], [4,4], [0,0], [0,0], [5,5], [0,0], [0,0], [4,4], [0,0], [0,0], [1,2], [0,0]])), (1, cubical_complex.Cube([[0,0], [3,4], [0,0], [0,0], [5,5], [0,0], [0,0], [4,4], [0,0], [0,0], [1,1], [0,0]])), (1, cubical_complex.Cube([[0,0], [3,3], [0,0], [0,0], [5,5], [0,0], [0,0], [3,4], [0,0], [0,0], [1,1], [0,0]])), (1, cubical_complex.Cube([[0,0], [2,3], [0,0], [0,0], [5,5], [0,0], [0,0], [3,3], [0,0], [0,0], [1,1], [0,0]])), (1, cubical_complex.Cube([[0,0], [2,2], [0,0], [0,0], [4,5], [0,0], [0,0], [3,3], [0,0], [0,0], [1,1], [0,0]])), (1, cubical_complex.Cube([[0,0], [1,2], [0,0], [0,0], [4,4], [0,0], [0,0], [3,3], [0,0], [0,0], [1,1], [0,0]])), (1, cubical_complex.Cube([[0,0], [1,1], [0,0], [0,0], [3,4], [0,0], [0,0], [3,3], [0,0], [0,0], [1,1], [0,0]])), (1, cubical_complex.Cube([[0,0], [0,1], [0,0], [0,0], [3,3], [0,0], [0,0], [3,3], [0,0], [0,0], [1,1], [0,0]])), (1, cubical_complex.Cube([[0,0], [0,0], [0,0], [0,0], [3,3], [0,0], [0,0], [3,3], [0,0], [0,0], [0,1], [0,0]])), (1, cubical_complex.Cube([[0,0], [0,0], [0,0], [0,0], [2,3], [0,0], [0,0], [3,3], [0,0], [0,0], [0,0], [0,0]])), (1, cubical_complex.Cube([[0,0], [0,0], [0,0], [0,0], [1,2], [0,0], [0,0], [3,3], [0,0], [0,0], [0,0], [0,0]])), (-1, cubical_complex.Cube([[0,0], [0,1], [0,0], [0,0], [1,1], [0,0], [0,0], [3,3], [0,0], [0,0], [0,0], [0,0]])), (-1, cubical_complex.Cube([[0,0], [1,1], [0,0], [0,0], [1,1], [0,0], [0,0], [3,4], [0,0], [0,0], [0,0], [0,0]])), (-1, cubical_complex.Cube([[0,0], [1,1], [0,0], [0,0], [1,2], [0,0], [0,0], [4,4], [0,0], [0,0], [0,0], [0,0]])), (-1, cubical_complex.Cube([[0,0], [1,1], [0,0], [0,0], [2,2], [0,0], [0,0], [4,5], [0,0], [0,0], [0,0], [0,0]])), (1, cubical_complex.Cube([[0,0], [0,1], [0,0], [0,0], [2,2], [0,0], [0,0], [5,5], [0,0], [0,0], [0,0], [0,0]])), (-1, cubical_complex.Cube([[0,0], [0,0], [0,0], [0,0], [2,2], [0,0], [0,0], [5,5], [0,0], [0,0], [0,1], [0,0]])), (-1, cubical_complex.Cube([[0,0], [0,0], [0,0], [0,0], [2,3], [0,0], [0,0], [5,5], [0,0], [0,0], [1,1], [0,0]])), (-1, cubical_complex.Cube([[0,0], [0,0], [0,0], [0,0], [3,3], [0,0], [0,0], [5,5], [0,0], [0,0], [1,2], [0,0]])), (-1, cubical_complex.Cube([[0,0], [0,1], [0,0], [0,0], [3,3], [0,0], [0,0], [5,5], [0,0], [0,0], [2,2], [0,0]])), (-1, cubical_complex.Cube([[0,0], [1,1], [0,0], [0,0], [3,4], [0,0], [0,0], [5,5], [0,0], [0,0], [2,2], [0,0]])), (-1, cubical_complex.Cube([[0,0], [1,1], [0,0], [0,0], [4,4], [0,0], [0,0], [5,5], [0,0], [0,0], [2,3], [0,0]])), (1, cubical_complex.Cube([[0,0], [0,1], [0,0], [0,0], [4,4], [0,0], [0,0], [5,5], [0,0], [0,0], [3,3], [0,0]])), (1, cubical_complex.Cube([[0,0], [0,0], [0,0], [0,0], [3,4], [0,0], [0,0], [5,5], [0,0], [0,0], [3,3], [0,0]])), (1, cubical_complex.Cube([[0,0], [0,0], [0,0], [0,0], [3,3], [0,0], [0,0], [4,5], [0,0], [0,0], [3,3], [0,0]])), (-1, cubical_complex.Cube([[0,0], [0,0], [0,0], [0,0], [3,3], [0,0], [0,0], [4,4], [0,0], [0,0], [3,4], [0,0]])), (-1, cubical_complex.Cube([[0,0], [0,0], [0,0], [0,0], [3,3], [0,0], [0,0], [4,4], [0,0], [0,0], [4,5], [0,0]])), (-1, cubical_complex.Cube([[0,0], [0,1], [0,0], [0,0], [3,3], [0,0], [0,0], [4,4], [0,0], [0,0], [5,5], [0,0]])), (1, cubical_complex.Cube([[0,0], [1,1], [0,0], [0,0], [2,3], [0,0], [0,0], [4,4], [0,0], [0,0], [5,5], [0,0]])), (1, cubical_complex.Cube([[0,0], [1,1], [0,0], [0,0], [2,2], [0,0], [0,0], [4,4], [0,0], [0,0], [4,5], [0,0]])), (-1, cubical_complex.Cube([[0,0], [1,1], [0,0], [0,0], [2,3], [0,0], [0,0], [4,4], [0,0], [0,0], [4,4], [0,0]])), (-1, cubical_complex.Cube([[0,0], [1,1], [0,0], [0,0], [3,3], [0,0], [0,0], [4,5], [0,0], [0,0], [4,4], [0,0]])), (-1, cubical_complex.Cube([[0,0], [1,1], [0,0], [0,0], [3,4], [0,0], [0,0], [5,5], [0,0], [0,0], [4,4], [0,0]])), (-1, cubical_complex.Cube([[0,0], [1,1], [0,0], [0,0], [4,4], [0,0], [0,0], [5,5], [0,0], [0,0], [4,5], [0,0]])), (1, cubical_complex.Cube([[0,0], [1,1], [0,0], [0,0], [4,4], [0,0], [0,0], [4,5], [0,0], [0,0], [5,5], [0,0]])), (-1, cubical_complex.Cube([[0,0], [1,1], [0,0], [0,0], [4,5], [0,0], [0,0], [4,4], [0,0], [0,0], [5,5], [0,0]])), (1, cubical_complex.Cube([[0,0], [1,1], [0,0], [0,0], [5,5], [0,0], [0,0], [4,4], [0,0], [0,0], [4,5], [0,0]])), (1, cubical_complex.Cube([[0,0], [1,1], [0,0], [0,0], [5,5], [0,0], [0,0], [3,4], [0,0], [0,0], [4,4], [0,0]])), (1, cubical_complex.Cube([[0,0], [1,1], [0,0], [0,0], [4,5], [0,0], [0,0], [3,3], [0,0], [0,0], [4,4], [0,0]])), (-1, cubical_complex.Cube([[0,0], [1,2], [0,0], [0,0], [4,4], [0,0], [0,0], [3,3], [0,0], [0,0], [4,4], [0,0]])), (1, cubical_complex.Cube([[0,0], [2,2], [0,0], [0,0], [3,4], [0,0], [0,0], [3,3], [0,0], [0,0], [4,4], [0,0]])), (-1, cubical_complex.Cube([[0,0], [2,2], [0,0], [0,0], [3,3], [0,0], [0,0], [3,3], [0,0], [0,0], [4,5], [0,0]])), (1, cubical_complex.Cube([[0,0], [2,2], [0,0], [0,0], [2,3], [0,0], [0,0], [3,3], [0,0], [0,0], [5,5], [0,0]])), (1, cubical_complex.Cube([[0,0], [2,2], [0,0], [0,0], [2,2], [0,0], [0,0], [3,3], [0,0], [0,0], [4,5], [0,0]])), (1, cubical_complex.Cube([[0,0], [2,2], [0,0], [0,0], [2,2], [0,0], [0,0], [3,3], [0,0], [0,0], [3,4], [0,0]])), (-1, cubical_complex.Cube([[0,0], [2,2], [0,0], [0,0], [2,2], [0,0], [0,0], [3,4], [0,0], [0,0], [3,3], [0,0]])), (-1, cubical_complex.Cube([[0,0], [2,3], [0,0], [0,0], [2,2], [0,0], [0,0], [4,4], [0,0], [0,0], [3,3], [0,0]])), (-1, cubical_complex.Cube([[0,0], [3,3], [0,0], [0,0], [2,2], [0,0], [0,0], [4,4], [0,0], [0,0], [3,4], [0,0]])), (-1, cubical_complex.Cube([[0,0], [3,3], [0,0], [0,0], [2,2], [0,0], [0,0], [4,4], [0,0], [0,0], [4,5], [0,0]])), (1, cubical_complex.Cube([[0,0], [3,3], [0,0], [0,0], [2,2], [0,0], [0,0], [3,4], [0,0], [0,0], [5,5], [0,0]])), (-1, cubical_complex.Cube([[0,0], [3,4], [0,0], [0,0], [2,2], [0,0], [0,0], [3,3], [0,0], [0,0], [5,5], [0,0]])), (1, cubical_complex.Cube([[0,0], [4,4], [0,0], [0,0], [1,2], [0,0], [0,0], [3,3], [0,0], [0,0], [5,5], [0,0]])), (1, cubical_complex.Cube([[0,0], [4,4], [0,0], [0,0], [0,1], [0,0], [0,0], [3,3], [0,0], [0,0], [5,5], [0,0]]))]]
 
@@ -12,13 +12,15 @@ TODO: No attempts have been made to optimize this code for performance, and the
       generate the Abrams-discretized model D_{n,2}Y (non-2-equal only) that has some performance improvements implemented by 
       Langston Barrett (see https://github.com/siddharthist/computational-homology).
 '''
-from sage.all import *
 import cubical_complex
 import itertools
 import logging
 import collections
+import memory
+import morse
+import tracing
 
-def generate_tree(n):
+def generate_tree(n, subdivision=None):
     '''
     We think of the Y-graph with numbered vertices, beginning from 0. The following are illustrations (from left to right)
     of n=1, n=2, and n=3:
@@ -37,25 +39,89 @@ def generate_tree(n):
 
     :param n: An integer representing the number of moving points (or "robots") living in our graph Y.
     :type n: int
+    :param subdivision: The number of edges on every arm, or None for n-1 (see generate_star_tree).
+    :type subdivision: int
     :return: A tuple, where the first element, lookup, is a list of points in 3-space coordinates, and the second element, tuple(tree), lists the possible "downstream" moves from a point to one greater than it.
     :rtype: tuple
     '''
-    lookup = [(0, n-t-1, 0) for t in range(n-1)]
-    lookup.append((0,0,0))
-    lookup.extend([(t, 0, 0) for t in range (1, n)])
-    lookup.extend([(0, 0, t) for t in range (1, n)])
-    tree = []
-    for point in range (n-1):
-        tree.append([point+1])
-    tree.append([n, 2*n-1])
-    for point in range(n, 2*n-2):
-        tree.append([point+1])
-    tree.append([])
-    for point in range(2*n-1, 3*n-3):
-        tree.append([point+1])
-    tree.append([])
+    return generate_star_tree(3, n, subdivision)
+
+def generate_star_tree(d, n, subdivision=None):
+    '''
+    Generalizes generate_tree to the star with d arms, which lives in d-space: as for the Y-graph, vertices 0 to n-2 lie on
+    the arm along the second coordinate (numbered from its outer end inwards), vertex n-1 is the center, and the vertices of
+    every other arm follow in turn, numbered from the center outwards, with arm j along coordinate j. So generate_star_tree(3, n)
+    is generate_tree(n), and generate_star_tree(4, n) gives the X-graph.
+
+    Every arm has n-1 edges, the subdivision Abrams needs for any graph and k=2, unless subdivision says otherwise (see
+    minimal_subdivision); the vertex at distance t from the center along an arm always has coordinate t.
+
+    EXAMPLE (the X-graph, n=2, and the Y-graph with arms of one edge):
+    >>> generate_star_tree(4, 2)
+    ([(0, 1, 0, 0), (0, 0, 0, 0), (1, 0, 0, 0), (0, 0, 1, 0), (0, 0, 0, 1)], ([1], [2, 3, 4], [], [], []))
+    >>> generate_star_tree(3, 4, subdivision=1)
+    ([(0, 1, 0), (0, 0, 0), (1, 0, 0), (0, 0, 1)], ([1], [2, 3], [], []))
+
+    :param d: The number of "arms" of the star.
+    :type d: int
+    :param n: An integer representing the number of moving points (or "robots") living in our graph.
+    :type n: int
+    :param subdivision: The number of edges on every arm (0 for just the center), or None for n-1.
+    :type subdivision: int
+    :return: The (lookup, tuple(tree)) pair, as in generate_tree.
+    :rtype: tuple
+    '''
+    s = n-1 if subdivision is None else subdivision
+    if s < 0:
+        raise ValueError("The subdivision must not be negative, but it is " + str(s) + ".")
+    origin = (0,)*d
+    if s == 0:
+        # The star shrunk to its center.
+        return ([origin], ([],))
+    point = lambda axis, t: origin[:axis] + (t,) + origin[axis+1:]
+    lookup = [point(1, s-t) for t in range(s)]
+    lookup.append(origin)
+    tree = [[t+1] for t in range(s)]
+    tree.append([s+1 + j*s for j in range(d-1)])
+    for j, axis in enumerate([0] + list(range(2, d))):
+        lookup.extend([point(axis, t) for t in range(1, s+1)])
+        start = s+1 + j*s
+        tree.extend([[t+1] for t in range(start, start+s-1)])
+        tree.append([])
     return (lookup, tuple(tree))
 
+# The largest number of robots for which minimal_subdivision has been checked, on the Y- and X-graphs and for every k.
+SUBDIVISION_CHECKED = 5
+
+def minimal_subdivision(n, k, d=3):
+    '''
+    The number of edges every arm of the star is subdivided into by the_complex (and the_morse_complex) by default.
+
+    Abrams needs n-1 edges on every arm of a graph for k=2, so that any robot can get out of the way of the others. When k > 2
+    up to k-1 robots can share a vertex, and arms of ceil((n-1)/(k-1)) edges give D_{n,k} the same homology as arms of n-1
+    edges (and of n edges): this was checked by comparing their Morse complexes (see morse.py), for every k, for up to
+    SUBDIVISION_CHECKED robots on the Y- and X-graphs. Anywhere else, it falls back to n-1 edges. Every edge less shrinks
+    the complex a lot, since the number of cells grows like the number of vertices to the power n.
+
+    EXAMPLE (D_{4,3}Y with arms of 2 edges instead of 3):
+    >>> [minimal_subdivision(4, k) for k in (2, 3, 4, 5)]
+    [3, 2, 1, 1]
+    >>> the_morse_complex(4, 3).betti_numbers() == the_morse_complex(4, 3, subdivision=3).betti_numbers()
+    True
+
+    :param n: An integer representing the number of moving points (or "robots") living in our graph.
+    :type n: int
+    :param k: The integer k for the non-k-equal configuration space.
+    :type k: int
+    :param d: The number of "arms" of the star.
+    :type d: int
+    :return: The number of edges on every arm (see generate_star_tree).
+    :rtype: int
+    '''
+    if d not in (3, 4) or n > SUBDIVISION_CHECKED:
+        return n-1
+    return (n-1 + k-2) // (k-1)
+
 def no_k_equal(point_config, k):
     '''
     A helper function that checks if a particular point configuration is "allowed", i.e. is non-k-equal.
@@ -78,10 +144,11 @@ def no_k_equal(point_config, k):
     count_list = [point_config.count(i) < k for i in point_config]
     return count_list.count(False) == 0
 
+@tracing.traced
 def iterate_over_conf(I, n, k):
     '''
     Enumerate all the possible configurations of points at vertices, which will
-    be the 0-cells. Gives lists of length n which consist of the positions
+    be the 0-cells. Gives tuples of length n which consist of the positions
     (vertex labels) of different points.
     
     :param I: A tuple of possible "downstream" moves. This is obtained from the second element of the tuple returned by generate_tree.
@@ -93,11 +160,15 @@ def iterate_over_conf(I, n, k):
     :return: A generator which can be accessed by enumeration to give all the possible configurations for this space.
     :rtype: generator
     '''
-    iterator_list = [xrange(len(I))] * n
-    for point_config in  xmrange_iter(iterator_list):
+    for point_config in itertools.product(xrange(len(I)), repeat=n):
+        if tracing.enabled:
+            tracing.count("configurations scanned")
         if no_k_equal(point_config, k): # no k points are equal
+            if tracing.enabled:
+                tracing.count("configurations accepted")
             yield point_config
 
+@tracing.traced
 def downstream_moves(point_config, I, k):
     '''
     Returns a list that encodes downstream movement information in this graph given a particular point configuration. 
@@ -189,11 +260,11 @@ def iterate_over_count(count, key_length):
     :return: A generator which can be accessed by enumeration to give the possible ways to arrange 'count' robots between 'key_length' vertices.
     :rtype: generator
     '''
-    iterator_list = [xrange(count+1)] * key_length
-    for partition in  xmrange_iter(iterator_list):
+    for partition in itertools.product(xrange(count+1), repeat=key_length):
         if sum(partition) == count:
             yield partition
 
+@tracing.traced
 def capacity(point_config, I, k):
     '''
     TODO: This function probably needs renaming.
@@ -250,6 +321,7 @@ def capacity(point_config, I, k):
                     capacity_moves[i] = moves_for_location
     return capacity_moves    
 
+@tracing.traced
 def simultaneous_moves(point_config, I, k):
     '''
     :param point_config: A list representing how the robots are configured.
@@ -272,16 +344,18 @@ def simultaneous_moves(point_config, I, k):
             for perm_moves_dict in down_moves[start]:
                 perm_moves_dict_keys = perm_moves_dict.keys()
                 value_sum = sum(perm_moves_dict.values())
-                for t in Permutations(locationlist[start], value_sum).list():
+                # The robots at a vertex are distinct, so these are the same (and in the same order) as Sage's
+                # Permutations(locationlist[start], value_sum).
+                for t in itertools.permutations(locationlist[start], value_sum):
                     offset = 0
                     sub_perm_move = []
                     for i in range(len(perm_moves_dict_keys)):
                         value = perm_moves_dict[perm_moves_dict_keys[i]]
-                        sub_perm_move.append([t[offset:value+offset], perm_moves_dict_keys[i]])
+                        sub_perm_move.append([list(t[offset:value+offset]), perm_moves_dict_keys[i]])
                         offset += value
                     possible_moves.append(sub_perm_move)
             moves.append(possible_moves)
-    sim_moves = [i for i in xmrange_iter(moves)]
+    sim_moves = [list(i) for i in itertools.product(*moves)]
 
     # TODO: The triple for-loop below is a REALLY silly-looking step, but it is a quick fix to ensure that the output of this function has 
     # all its simultaneous moves together on the same "level". In sim_moves the moves are "grouped together" according to the vertices
@@ -300,8 +374,11 @@ def simultaneous_moves(point_config, I, k):
         for j in range(len(sim_moves[i])):
                 for h in range(len(sim_moves[i][j])):
                     new_sim_moves[i].append(sim_moves[i][j][h])
+    if tracing.enabled:
+        tracing.count("moves generated", len(new_sim_moves))
     return new_sim_moves
 
+@tracing.traced
 def downstream_cubes(point_config, I, lookup, k):
     '''
     Builds the highest-dimensional cubes (in the Abrams-discretized configuration space) that result from performing moves at the same time.
@@ -343,19 +420,50 @@ def downstream_cubes(point_config, I, lookup, k):
         # this improves performance. Leave it in if so, but take it out if not. 
         if new_cube not in cubes:
             cubes.append(new_cube)
+        elif tracing.enabled:
+            tracing.count("duplicate cubes dropped")
     return cubes
 
-def the_complex(n, k):
+@tracing.traced
+def the_complex(n, k, d=3, subdivision=None):
     '''
     :param n: An integer representing the number of moving points (or "robots") living in our graph Y.
     :type n: int
     :param k: The integer k for the non-k-equal configuration space.
     :type k: int
+    :param d: The number of "arms" of the star. The default is 3 (the Y-graph); e.g. d=4 gives D_{n,k}X.
+    :type d: int
+    :param subdivision: The number of edges on every arm, or None for minimal_subdivision(n, k, d).
+    :type subdivision: int
     :return: The cubical complex D_{n,k}Y.
     :rtype: CubicalComplex
     '''
-    (lookup, I) = generate_tree(n)
+    if subdivision is None:
+        subdivision = minimal_subdivision(n, k, d)
+    (lookup, I) = generate_star_tree(d, n, subdivision)
     cubes = []
     for point_config in iterate_over_conf(I, n, k):
         cubes.extend(downstream_cubes(point_config, I, lookup, k))
+        if memory.budget_kb is not None:
+            memory.checkpoint("the_complex")
+    memory.check("the_complex")
     return cubical_complex.CubicalComplex(cubes)
+
+def the_morse_complex(n, k, d=3, subdivision=None):
+    '''
+    :param n: An integer representing the number of moving points (or "robots") living in our graph Y.
+    :type n: int
+    :param k: The integer k for the non-k-equal configuration space.
+    :type k: int
+    :param d: The number of "arms" of the star, as in the_complex.
+    :type d: int
+    :param subdivision: The number of edges on every arm, as in the_complex.
+    :type subdivision: int
+    :return: The Morse complex of D_{n,k}Y (see morse.py), which has the homology of the_complex(n, k, d, subdivision) from
+             far fewer cells.
+    :rtype: MorseComplex
+    '''
+    if subdivision is None:
+        subdivision = minimal_subdivision(n, k, d)
+    (lookup, I) = generate_star_tree(d, n, subdivision)
+    return morse.MorseComplex(lookup, I, n, k)
@@ -36,7 +36,7 @@ integers, of one of the two forms `[i, i]` or `[i, i+1]`.  So the
 cubical complex ``S1`` above has four maximal cubes::
 
     >>> S1.maximal_cells()
-    {[0,0] x [2,3], [1,1] x [2,3], [0,1] x [3,3], [0,1] x [2,2]}
+    frozenset({[0,0] x [2,3], [1,1] x [2,3], [0,1] x [3,3], [0,1] x [2,2]})
 
 The first of these, for instance, is the product of the degenerate
 interval `[0,0]` with the unit interval `[2,3]`: this is the line
@@ -57,32 +57,33 @@ reflected in the fact that they have isomorphic homology groups.
 
 .. note::
 
-   This class derives from
-   :class:`~sage.homology.cell_complex.GenericCellComplex`, and so
-   inherits its methods.  Some of those methods are not listed here;
-   see the :mod:`Generic Cell Complex <sage.homology.cell_complex>`
-   page instead.
+   Unlike Sage's version, these classes do not derive from Sage's
+   classes, and the cubes, cells, faces and boundary matrices (see
+   :meth:`CubicalComplex.boundary_matrix`) are plain Python, so they
+   work without Sage.  Sage is only imported, when needed, by the
+   methods that hand the complex over to it: :meth:`~CubicalComplex.chain_complex`,
+   :meth:`~CubicalComplex.homology` and the like.
 """
 from __future__ import print_function, absolute_import
-from six.moves import zip
-
-from sage.all import *
+try:
+    from itertools import izip as zip
+except ImportError:
+    # Python 3, where zip is already lazy.
+    pass
+
+import operator
+from array import array
 from copy import copy
-from sage.homology.cell_complex import GenericCellComplex
-from sage.structure.sage_object import SageObject
-from sage.rings.integer import Integer
-from sage.sets.set import Set
-from sage.rings.integer_ring import ZZ
-from sage.rings.rational_field import QQ
-from sage.matrix.constructor import matrix
-from sage.homology.chain_complex import ChainComplex
-from sage.graphs.graph import Graph
-from sage.misc.cachefunc import cached_method
-from sage.misc.decorators import rename_keyword
+try:
+    from . import memory, tracing
+except (ImportError, ValueError):
+    # Imported on its own (e.g. from this directory) rather than as part of the homology package.
+    import memory
+    import tracing
 from functools import total_ordering
 
 @total_ordering
-class Cube(SageObject):
+class Cube(object):
     r"""
     Define a cube for use in constructing a cubical complex.
 
@@ -142,7 +143,7 @@ class Cube(SageObject):
         for x in data:
             if len(x) == 2:
                 try:
-                    Integer(x[0])
+                    operator.index(x[0])
                 except TypeError:
                     raise ValueError("The interval %s is not of the correct form" % x)
                 if x[0] + 1 == x[1]:
@@ -718,6 +719,9 @@ class Cube(SageObject):
         s = ["[%s,%s]"%(str(x), str(y)) for (x,y) in self.__tuple]
         return " x ".join(s)
 
+    def __repr__(self):
+        return self._repr_()
+
     def _latex_(self):
         r"""
         LaTeX representation of a cube..
@@ -726,7 +730,7 @@ class Cube(SageObject):
         return self._repr_().replace('x', r'\times')
 
 
-class CubicalComplex(GenericCellComplex):
+class CubicalComplex(object):
     r"""
     Define a cubical complex.
 
@@ -786,7 +790,7 @@ class CubicalComplex(GenericCellComplex):
     You can get the set of maximal cells or a dictionary of all cells::
 
         >>> X.maximal_cells()
-        {[0,0] x [2,3] x [-12,-12], [0,1] x [3,3] x [5,5], [0,1] x [2,2] x [3,3], [0,1] x [2,2] x [0,0], [0,1] x [3,3] x [6,6], [1,1] x [2,3] x [0,0], [0,1] x [2,2] x [-12,-12], [0,0] x [2,3] x [6,6], [1,1] x [2,3] x [-12,-12], [1,1] x [2,3] x [5,5], [0,1] x [2,2] x [5,5], [0,1] x [3,3] x [3,3], [1,1] x [2,3] x [3,3], [0,0] x [2,3] x [5,5], [0,1] x [3,3] x [0,0], [1,1] x [2,3] x [6,6], [0,1] x [2,2] x [6,6], [0,0] x [2,3] x [0,0], [0,0] x [2,3] x [3,3], [0,1] x [3,3] x [-12,-12]}
+        frozenset({[0,0] x [2,3] x [-12,-12], [0,1] x [3,3] x [5,5], [0,1] x [2,2] x [3,3], [0,1] x [2,2] x [0,0], [0,1] x [3,3] x [6,6], [1,1] x [2,3] x [0,0], [0,1] x [2,2] x [-12,-12], [0,0] x [2,3] x [6,6], [1,1] x [2,3] x [-12,-12], [1,1] x [2,3] x [5,5], [0,1] x [2,2] x [5,5], [0,1] x [3,3] x [3,3], [1,1] x [2,3] x [3,3], [0,0] x [2,3] x [5,5], [0,1] x [3,3] x [0,0], [1,1] x [2,3] x [6,6], [0,1] x [2,2] x [6,6], [0,0] x [2,3] x [0,0], [0,0] x [2,3] x [3,3], [0,1] x [3,3] x [-12,-12]})
         >>> S1.cells()
         {0: set([[1,1] x [2,2], [0,0] x [2,2], [1,1] x [3,3], [0,0] x [3,3]]), 1: set([[0,1] x [3,3], [1,1] x [2,3], [0,0] x [2,3], [0,1] x [2,2]]), -1: set([])}
 
@@ -831,7 +835,9 @@ class CubicalComplex(GenericCellComplex):
         if C is not None:
             self._facets = copy(C._facets)
             self._cells = copy(C._cells)
+            self._cell_indices = copy(C._cell_indices)
             self._complex = copy(C._complex)
+            self._models = copy(C._models)
             return
 
         cubes = [Cube(f) for f in maximal_faces]
@@ -848,14 +854,24 @@ class CubicalComplex(GenericCellComplex):
         # dictionary keyed by dimension.  This should be empty until
         # needed -- that is, until the faces method is called
         self._cells = {}
-        # self._complex: dictionary indexed by dimension d, base_ring,
-        # etc.: differential from dim d to dim d-1 in the associated
-        # chain complex.  thus to get the differential in the cochain
-        # complex from dim d-1 to dim d, take the transpose of this
-        # one.
+        # self._cell_indices: dictionary keyed by (dimension,
+        # subcomplex), giving the stable ordering of the cells in that
+        # dimension that is shared by the chain complex and the
+        # homology generators.  Filled in by cell_index.
+        self._cell_indices = {}
+        # self._complex: dictionary keyed by (dimension d,
+        # subcomplex): the differential from dim d to dim d-1 in the
+        # associated chain complex, in the plain form returned by
+        # boundary_matrix.  thus to get the differential in the
+        # cochain complex from dim d-1 to dim d, take the transpose of
+        # this one.
         self._complex = {}
+        # self._models: dictionary keyed by base ring, caching
+        # algebraic_topological_model.
+        self._models = {}
 
     @staticmethod
+    @tracing.traced
     def maximal_cubes(cubes):
         """ Remove cubes that are faces of other cubes in this list
 
@@ -896,11 +912,25 @@ class CubicalComplex(GenericCellComplex):
             >>> interval
             Cubical complex with 2 vertices and 3 cubes
             >>> interval.maximal_cells()
-            {[0,1]}
+            frozenset({[0,1]})
             >>> interval.product(interval).maximal_cells()
-            {[0,1] x [0,1]}
+            frozenset({[0,1] x [0,1]})
+        """
+        return frozenset(self._facets)
+
+    def dimension(self):
+        """
+        The dimension of this cubical complex: the largest dimension
+        of its maximal cubes, or -1 if it is empty.
+
+        EXAMPLES::
+
+            >>> cubical_complexes.Sphere(2).dimension()
+            2
+            >>> CubicalComplex().dimension()
+            -1
         """
-        return Set(self._facets)
+        return max(cube.dimension() for cube in self._facets)
 
     def __eq__(self, other):
         r"""
@@ -1007,6 +1037,7 @@ class CubicalComplex(GenericCellComplex):
                                      for other_cube in other_facets])
         return answer
 
+    @tracing.traced
     def cells(self, subcomplex=None):
         """
         The cells of this cubical complex, in the form of a dictionary:
@@ -1064,10 +1095,34 @@ class CubicalComplex(GenericCellComplex):
                     bad_bdries.update(f.faces())
                 for f in Cells[dim]:
                     Cells[dim-1].update(set(f.faces()).difference(bad_bdries))
+                    if memory.budget_kb is not None:
+                        memory.checkpoint("cells")
                 bad_faces = bad_bdries
             self._cells[subcomplex] = Cells
+            if tracing.enabled:
+                # Every d-cell that is not in the subcomplex produced its 2d faces.
+                tracing.count("faces produced", sum(2*dim*len(Cells[dim]) for dim in range(1, dimension+1)))
         return self._cells[subcomplex]
 
+    def n_cells(self, n, subcomplex=None):
+        """
+        The list of cubes of dimension n of this cubical complex (not
+        contained in ``subcomplex``), in no particular order.
+
+        :param n: dimension
+        :type n: integer
+        :param subcomplex: a subcomplex of this cubical complex
+        :type subcomplex: a cubical complex; optional, default None
+        :return: cells in dimension ``n``
+        :rtype: list
+
+        EXAMPLES::
+
+            >>> len(cubical_complexes.Sphere(2).n_cells(1))
+            12
+        """
+        return list(self.cells(subcomplex).get(n, ()))
+
     def n_cubes(self, n, subcomplex=None):
         """
         The set of cubes of dimension n of this cubical complex.
@@ -1097,12 +1152,94 @@ class CubicalComplex(GenericCellComplex):
         """
         return set(self.n_cells(n, subcomplex))
 
-    @rename_keyword(deprecation=20723, check_diffs='check')
+    def f_vector(self):
+        """
+        The `f`-vector of this cubical complex: the list of the
+        numbers of its cubes in each dimension, starting with
+        dimension `-1`.
+
+        EXAMPLES::
+
+            >>> cubical_complexes.Sphere(2).f_vector()
+            [0, 8, 12, 6]
+        """
+        return [len(self.cells().get(n, ())) for n in range(-1, self.dimension()+1)]
+
+    def euler_characteristic(self):
+        """
+        The Euler characteristic of this cubical complex: the
+        alternating sum of the numbers of its cubes in each dimension.
+
+        EXAMPLES::
+
+            >>> cubical_complexes.Sphere(2).euler_characteristic()
+            2
+        """
+        return sum((-1)**n * len(self.cells().get(n, ())) for n in range(self.dimension()+1))
+
+    def cell_index(self, n, subcomplex=None):
+        """
+        A stable indexing of the cubes of dimension n of this cubical
+        complex (not contained in ``subcomplex``).
+
+        The cubes are sorted, so the ordering does not depend on the
+        iteration order of the underlying sets, and it is computed
+        once and cached.  This is the ordering used for the bases of
+        the chain groups in :meth:`chain_complex`, so it is also the
+        ordering of the entries of homology generators.
+
+        :param n: dimension
+        :type n: integer
+        :param subcomplex: a subcomplex of this cubical complex
+        :type subcomplex: a cubical complex; optional, default None
+        :return: a pair ``(cells, positions)``, where ``cells`` is a
+          tuple of the cubes in dimension ``n`` and ``positions`` is a
+          dictionary mapping each of these cubes to its index in
+          ``cells``.
+        :rtype: tuple
+
+        EXAMPLES::
+
+            >>> S1 = cubical_complexes.Sphere(1)
+            >>> cells, positions = S1.cell_index(0)
+            >>> cells
+            ([0,0] x [0,0], [0,0] x [1,1], [1,1] x [0,0], [1,1] x [1,1])
+            >>> positions[cells[2]]
+            2
+        """
+        # The empty subcomplex gives the same cells as no subcomplex.
+        if subcomplex is not None and subcomplex.dimension() < 0:
+            subcomplex = None
+        if (n, subcomplex) not in self._cell_indices:
+            cells = tuple(sorted(self.cells(subcomplex).get(n, ())))
+            positions = dict(zip(cells, range(len(cells))))
+            self._cell_indices[(n, subcomplex)] = (cells, positions)
+        return self._cell_indices[(n, subcomplex)]
+
+    def _release_caches(self, keep_indices=(), keep_cells=True):
+        '''
+        Free memory by dropping cached data that can be recomputed if it is needed again: the cell indices (see
+        cell_index) of the dimensions not in keep_indices and, unless keep_cells, the cells (see cells). The boundary
+        matrices are kept.
+
+        :param keep_indices: The dimensions whose cell indices to keep.
+        :type keep_indices: list
+        :param keep_cells: Whether to keep the cells.
+        :type keep_cells: bool
+        '''
+        for key in list(self._cell_indices):
+            if key[0] not in keep_indices:
+                del self._cell_indices[key]
+        if not keep_cells:
+            self._cells = {}
+
+    @tracing.traced
     def chain_complex(self, subcomplex=None, augmented=False,
                       verbose=False, check=False, dimensions=None,
-                      base_ring=ZZ, cochain=False):
+                      base_ring=None, cochain=False):
         r"""
-        The chain complex associated to this cubical complex.
+        The chain complex associated to this cubical complex, as a
+        Sage chain complex (this needs Sage).
 
         :param dimensions: if None, compute the chain complex in all
            dimensions.  If a list or tuple of integers, compute the
@@ -1154,6 +1291,11 @@ class CubicalComplex(GenericCellComplex):
             >>> C1.homology(subcomplex=S0)
             {0: 0, 1: Z}
         """
+        from sage.rings.integer_ring import ZZ
+        from sage.matrix.constructor import matrix
+        from sage.homology.chain_complex import ChainComplex
+        if base_ring is None:
+            base_ring = ZZ
         # initialize subcomplex
         if subcomplex is None:
             subcomplex = CubicalComplex()
@@ -1165,62 +1307,28 @@ class CubicalComplex(GenericCellComplex):
             empty_cell = 1  # number of (-1)-dimensional cubes
         else:
             empty_cell = 0
-        vertices = self.n_cells(0, subcomplex=subcomplex)
+        vertices = self.cell_index(0, subcomplex=subcomplex)[0]
         n = len(vertices)
         mat = matrix(base_ring, empty_cell, n, n*empty_cell*[1])
         if cochain:
             differentials[-1] = mat.transpose()
         else:
             differentials[0] = mat
-        current = vertices
         # now loop from 1 to dimension of the complex
         for dim in range(1,self.dimension()+1):
             if verbose:
                 print("  starting dimension %s" % dim)
-            if (dim, subcomplex) in self._complex:
-                if cochain:
-                    differentials[dim-1] = self._complex[(dim, subcomplex)].transpose().change_ring(base_ring)
-                    mat = differentials[dim-1]
-                else:
-                    differentials[dim] = self._complex[(dim, subcomplex)].change_ring(base_ring)
-                    mat = differentials[dim]
-                if verbose:
-                    print("    boundary matrix (cached): it's %s by %s." % (mat.nrows(), mat.ncols()))
+            # The boundary matrices themselves are built (and cached)
+            # in plain Python by boundary_matrix; this only hands them
+            # over to Sage.
+            (nrows, ncols, rows, cols, values) = self.boundary_matrix(dim, subcomplex=subcomplex)
+            mat = matrix(ZZ, nrows, ncols, dict(zip(zip(rows, cols), values)))
+            if cochain:
+                differentials[dim-1] = mat.transpose().change_ring(base_ring)
             else:
-                # 'current' is the list of cells in dimension n
-                #
-                # 'old' is a dictionary, with keys the cells in the
-                # previous dimension, values the integers 0, 1, 2,
-                # ... (the index of the face).  finding an entry in a
-                # dictionary seems to be faster than finding the index
-                # of an entry in a list.
-                old = dict(zip(current, range(len(current))))
-                current = list(self.n_cells(dim, subcomplex=subcomplex))
-                # construct matrix.  it is easiest to construct it as
-                # a sparse matrix, specifying which entries are
-                # nonzero via a dictionary.
-                matrix_data = {}
-                col = 0
-                if len(old) and len(current):
-                    for cube in current:
-                        faces = cube.faces_as_pairs()
-                        sign = 1
-                        for (upper, lower) in faces:
-                            try:
-                                matrix_data[(old[upper], col)] = sign
-                                sign *= -1
-                                matrix_data[(old[lower], col)] = sign
-                            except KeyError:
-                                pass
-                        col += 1
-                mat = matrix(ZZ, len(old), len(current), matrix_data)
-                self._complex[(dim, subcomplex)] = mat
-                if cochain:
-                    differentials[dim-1] = mat.transpose().change_ring(base_ring)
-                else:
-                    differentials[dim] = mat.change_ring(base_ring)
-                if verbose:
-                    print("    boundary matrix computed: it's %s by %s." % (mat.nrows(), mat.ncols()))
+                differentials[dim] = mat.change_ring(base_ring)
+            if verbose:
+                print("    boundary matrix: it's %s by %s." % (mat.nrows(), mat.ncols()))
         # finally, return the chain complex
         if cochain:
             return ChainComplex(data=differentials, base_ring=base_ring,
@@ -1229,6 +1337,247 @@ class CubicalComplex(GenericCellComplex):
             return ChainComplex(data=differentials, base_ring=base_ring,
                                 degree=-1, check=check)
 
+    def homology(self, dim=None, base_ring=None, subcomplex=None,
+                 generators=False, cohomology=False, algorithm='auto',
+                 verbose=False, reduced=True):
+        r"""
+        The (reduced) homology of this cubical complex, computed by
+        Sage from :meth:`chain_complex` (this needs Sage).
+
+        :param dim: If None, then return the homology in every
+           dimension.  If ``dim`` is an integer or list, return the
+           homology in the given dimensions.
+        :type dim: integer or list of integers or None; optional,
+           default None
+        :param base_ring: commutative ring
+        :type base_ring: optional, default ZZ
+        :param subcomplex: a subcomplex of this cubical complex.
+           Compute the homology relative to this subcomplex.
+        :type subcomplex: optional, default None
+        :param generators: If True, return generators for the homology
+           groups along with the groups (see
+           :meth:`ChainComplex.homology` in Sage).
+        :type generators: boolean; optional, default False
+        :param cohomology: If True, compute cohomology rather than
+           homology.
+        :type cohomology: boolean; optional, default False
+        :param algorithm: The algorithm Sage uses to compute the
+           homology of the chain complex.
+        :type algorithm: string; optional, default 'auto'
+        :param verbose: If True, print some messages as the homology
+           is computed.
+        :type verbose: boolean; optional, default False
+        :param reduced: If True, return the reduced homology.
+        :type reduced: boolean; optional, default True
+        :return: the homology group in dimension ``dim`` if it is an
+           integer, and otherwise a dictionary of homology groups
+           keyed by dimension.
+
+        EXAMPLES::
+
+            >>> S1 = cubical_complexes.Sphere(1)
+            >>> S1.homology()
+            {0: 0, 1: Z}
+            >>> S1.homology(0, reduced=False)
+            Z
+        """
+        from sage.rings.integer_ring import ZZ
+        from sage.homology.homology_group import HomologyGroup
+        if base_ring is None:
+            base_ring = ZZ
+        if dim is not None:
+            if isinstance(dim, (list, tuple)):
+                dims = range(min(dim) - 1, max(dim) + 2)
+            else:
+                dims = range(dim - 1, dim + 2)
+        else:
+            dims = None
+        C = self.chain_complex(cochain=cohomology, augmented=reduced,
+                               dimensions=dims, subcomplex=subcomplex,
+                               base_ring=base_ring, verbose=verbose)
+        answer = C.homology(base_ring=base_ring, generators=generators,
+                            verbose=verbose, algorithm=algorithm)
+        zero = HomologyGroup(0, base_ring)
+        if dim is None:
+            dim = list(range(self.dimension()+1))
+        if isinstance(dim, (list, tuple)):
+            return dict([d, answer.get(d, zero)] for d in dim)
+        return answer.get(dim, zero)
+
+    def cohomology(self, dim=None, base_ring=None, subcomplex=None,
+                   generators=False, algorithm='auto', verbose=False,
+                   reduced=True):
+        r"""
+        The (reduced) cohomology of this cubical complex: see
+        :meth:`homology`, which takes the same arguments.
+        """
+        return self.homology(dim=dim, base_ring=base_ring,
+                             subcomplex=subcomplex, generators=generators,
+                             cohomology=True, algorithm=algorithm,
+                             verbose=verbose, reduced=reduced)
+
+    def betti(self, dim=None, subcomplex=None):
+        r"""
+        The Betti numbers of this cubical complex, the ranks of its
+        unreduced rational homology (this needs Sage).
+
+        :param dim: If None, then return every Betti number, as a
+           dictionary keyed by dimension.  If ``dim`` is an integer or
+           list, return the Betti number in the given dimensions.
+        :type dim: integer or list of integers or None; optional,
+           default None
+        :param subcomplex: a subcomplex of this cubical complex.
+           Compute the Betti numbers relative to this subcomplex.
+        :type subcomplex: optional, default None
+
+        EXAMPLES::
+
+            >>> cubical_complexes.Sphere(2).betti()
+            {0: 1, 1: 0, 2: 1}
+            >>> cubical_complexes.Sphere(2).betti(2)
+            1
+        """
+        from sage.rings.rational_field import QQ
+        H = self.homology(dim, base_ring=QQ, subcomplex=subcomplex, reduced=False)
+        if isinstance(H, dict):
+            return dict((n, group.dimension()) for (n, group) in H.items())
+        return H.dimension()
+
+    def is_acyclic(self, base_ring=None):
+        r"""
+        True iff the reduced homology of this cubical complex with
+        coefficients in ``base_ring`` (default ZZ) vanishes (this needs
+        Sage).
+
+        EXAMPLES::
+
+            >>> cubical_complexes.Cube(3).is_acyclic()
+            True
+            >>> cubical_complexes.Sphere(1).is_acyclic()
+            False
+        """
+        H = self.homology(base_ring=base_ring)
+        return all(group.order() == 1 for group in H.values())
+
+    def n_chains(self, n, base_ring=None, cochains=False):
+        r"""
+        The free module of ``n``-chains (or ``n``-cochains) of this
+        cubical complex over ``base_ring`` (default ZZ), with basis the
+        ``n``-cubes (this needs Sage).
+
+        EXAMPLES::
+
+            >>> C = cubical_complexes.Sphere(1).n_chains(1)
+            >>> len(C.basis())
+            4
+        """
+        from sage.rings.integer_ring import ZZ
+        if base_ring is None:
+            base_ring = ZZ
+        try:
+            from sage.homology.chains import Chains, Cochains
+        except ImportError:
+            # Sage before 8.0 has no Chains, and gives the module of its cells.
+            from sage.combinat.free_module import CombinatorialFreeModule
+            return CombinatorialFreeModule(base_ring, tuple(self.n_cells(n)),
+                                           prefix="Cochain" if cochains else "Chain")
+        return (Cochains if cochains else Chains)(tuple(self.n_cells(n)), base_ring)
+
+    def is_connected(self):
+        """
+        True iff this cubical complex is connected, i.e. its 1-skeleton
+        is (unlike Sage's, this does not need Sage).
+
+        EXAMPLES::
+
+            >>> cubical_complexes.Sphere(1).is_connected()
+            True
+            >>> X = cubical_complexes.Sphere(1).disjoint_union(cubical_complexes.Sphere(1))
+            >>> X.is_connected()
+            False
+        """
+        vertices = self.n_cells(0)
+        if not vertices:
+            return True
+        # Merge the components at the ends of every edge, keeping one representative per component.
+        parent = dict((vertex, vertex) for vertex in vertices)
+        def find(vertex):
+            while parent[vertex] != vertex:
+                parent[vertex] = parent[parent[vertex]]
+                vertex = parent[vertex]
+            return vertex
+        components = len(parent)
+        for edge in self.n_cells(1):
+            (start, end) = (find(edge.face(0, False)), find(edge.face(0, True)))
+            if start != end:
+                parent[start] = end
+                components -= 1
+        return components == 1
+
+    def boundary_matrix(self, dim, subcomplex=None):
+        '''
+        The boundary map from the cubes of dimension dim to those of dimension dim-1 of this cubical complex (not contained in
+        subcomplex), as a sparse integer matrix in plain Python, so that it can be built (and, e.g., its size measured)
+        without Sage. Its rows and columns are in the orderings of cell_index(dim-1) and cell_index(dim), and it is computed
+        once and cached; chain_complex hands it over to Sage.
+
+        EXAMPLE:
+        >>> I = CubicalComplex([([0,1],)])
+        >>> (nrows, ncols, rows, cols, values) = I.boundary_matrix(1)
+        >>> nrows, ncols, list(zip(rows, cols, values))
+        (2, 1, [(1, 0, 1), (0, 0, -1)])
+
+        :param dim: dimension
+        :type dim: int
+        :param subcomplex: a subcomplex of this cubical complex
+        :type subcomplex: CubicalComplex
+        :return: a tuple (nrows, ncols, rows, cols, values) giving the shape of the matrix and, in three arrays of the same
+                 length, the row, column and value of each of its nonzero entries, column by column.
+        :rtype: tuple
+        '''
+        # The empty subcomplex gives the same matrices as no subcomplex.
+        if subcomplex is not None and subcomplex.dimension() < 0:
+            subcomplex = None
+        if (dim, subcomplex) not in self._complex:
+            # 'old' is a dictionary, with keys the cells in the
+            # previous dimension, values the integers 0, 1, 2,
+            # ... (the index of the face).  finding an entry in a
+            # dictionary seems to be faster than finding the index
+            # of an entry in a list.  Both come from cell_index,
+            # so the bases of the chain groups are stable.
+            old = self.cell_index(dim-1, subcomplex=subcomplex)[1]
+            current = self.cell_index(dim, subcomplex=subcomplex)[0]
+            # If memory runs short, the indices of the lower dimensions are no longer needed to build the matrices.
+            relief = lambda: self._release_caches(keep_indices=range(dim-1, self.dimension()+1))
+            rows = array('l')
+            cols = array('l')
+            values = array('l')
+            if len(old) and len(current):
+                for (col, cube) in enumerate(current):
+                    sign = 1
+                    for (upper, lower) in cube.faces_as_pairs():
+                        # Faces in the subcomplex are left out; as
+                        # in Sage, a missing upper face skips its
+                        # lower face too.
+                        if upper not in old:
+                            continue
+                        rows.append(old[upper])
+                        cols.append(col)
+                        values.append(sign)
+                        sign *= -1
+                        if lower not in old:
+                            continue
+                        rows.append(old[lower])
+                        cols.append(col)
+                        values.append(sign)
+                    if memory.budget_kb is not None:
+                        memory.checkpoint("chain_complex", relief)
+            memory.check("chain_complex", relief)
+            if tracing.enabled:
+                tracing.count("matrix nonzeros", len(values))
+            self._complex[(dim, subcomplex)] = (len(old), len(current), rows, cols, values)
+        return self._complex[(dim, subcomplex)]
+
     def alexander_whitney(self, cube, dim_left):
         r"""
         Subdivide ``cube`` in this cubical complex into pairs of cubes.
@@ -1299,6 +1648,7 @@ class CubicalComplex(GenericCellComplex):
             start = edge.face(0, False)
             end = edge.face(0, True)
             data[vertex_dict[start]].append(vertex_dict[end])
+        from sage.graphs.graph import Graph
         return Graph(data)
 
     def is_pure(self):
@@ -1434,8 +1784,8 @@ class CubicalComplex(GenericCellComplex):
             >>> S1.disjoint_union(S2).homology()
             {0: Z, 1: Z, 2: Z}
         """
-        embedded_left = len(tuple(self.maximal_cells()[0]))
-        embedded_right = len(tuple(other.maximal_cells()[0]))
+        embedded_left = len(tuple(self._facets[0]))
+        embedded_right = len(tuple(other._facets[0]))
         zero = [0] * max(embedded_left, embedded_right)
         facets = []
         for f in self.maximal_cells():
@@ -1469,10 +1819,10 @@ class CubicalComplex(GenericCellComplex):
             >>> S1.wedge(S2).homology()
             {0: 0, 1: Z, 2: Z}
         """
-        embedded_left = len(tuple(self.maximal_cells()[0]))
-        embedded_right = len(tuple(other.maximal_cells()[0]))
-        translate_left = [-a[0] for a in self.maximal_cells()[0]] + [0] * embedded_right
-        translate_right = [-a[0] for a in other.maximal_cells()[0]]
+        embedded_left = len(tuple(self._facets[0]))
+        embedded_right = len(tuple(other._facets[0]))
+        translate_left = [-a[0] for a in self._facets[0]] + [0] * embedded_right
+        translate_right = [-a[0] for a in other._facets[0]]
         point_right = Cube([[0,0]] * embedded_left)
 
         facets = []
@@ -1579,9 +1929,6 @@ class CubicalComplex(GenericCellComplex):
         """
         return CubicalComplex([f._translate(vec) for f in self.maximal_cells()])
 
-    # This is cached for speed reasons: it can be very slow to run
-    # this function.
-    @cached_method
     def algebraic_topological_model(self, base_ring=None):
         r"""
         Algebraic topological model for this cubical complex with
@@ -1630,10 +1977,15 @@ class CubicalComplex(GenericCellComplex):
              1: Vector space of dimension 2 over Rational Field,
              2: Vector space of dimension 1 over Rational Field}
         """
-        from .algebraic_topological_model import algebraic_topological_model
+        from sage.homology.algebraic_topological_model import algebraic_topological_model
+        from sage.rings.rational_field import QQ
         if base_ring is None:
             base_ring = QQ
-        return algebraic_topological_model(self, base_ring)
+        # This is cached for speed reasons: it can be very slow to run
+        # this function.
+        if base_ring not in self._models:
+            self._models[base_ring] = algebraic_topological_model(self, base_ring)
+        return self._models[base_ring]
 
     # def _repr_(self):
     #     return str(self.maximal_cells())
@@ -1733,6 +2085,52 @@ class CubicalComplex(GenericCellComplex):
         """
         return ('Cubical', 'cube', 'cubes')
 
+    def _repr_(self):
+        """
+        Print representation of this cubical complex.
+
+        EXAMPLES::
+
+            >>> cubical_complexes.Cube(0)
+            Cubical complex with 1 vertex and 1 cube
+        """
+        vertices = len(self.cells().get(0, ()))
+        cells = sum(len(faces) for faces in self.cells().values())
+        (name, cell_name, cells_name) = self._string_constants()
+        vertex_string = "with 1 vertex" if vertices == 1 else "with %s vertices" % vertices
+        cells_string = " and 1 %s" % cell_name if cells == 1 else " and %s %s" % (cells, cells_name)
+        return name + " complex " + vertex_string + cells_string
+
+    def __repr__(self):
+        return self._repr_()
+
+    @tracing.traced
+    def n_cycle_generators(self, n):
+        '''
+        This method returns the generators of the n-dimensional homology of this cubical complex in sparse form.
+        Each generator is a pair (indices, coefficients) of arrays of the same length, listing the nonzero entries of the
+        generating cycle. The indices refer to the ordering of the n-cells given by cell_index(n), which is the same
+        ordering that chain_complex uses, so only the support of each generator is ever materialized.
+
+        :param n: dimension
+        :type n: int
+        :return: a list of (indices, coefficients) pairs, one for each generator.
+        :rtype: list
+        '''
+        # Collect all the generators by computing the n-homology.
+        # See https://doc.sagemath.org/html/en/reference/homology/sage/homology/chain_complex.html for details.
+        chains = self.chain_complex()
+        # If memory runs short, only the boundary matrices and the ordering of the n-cells are still needed.
+        self.cell_index(n)
+        memory.check("homology", lambda: self._release_caches(keep_indices=(n,), keep_cells=False))
+        generators = []
+        for (summand, chain) in chains.homology(deg=n, generators=True):
+            entries = sorted(chain.vector(n).dict().items())
+            generators.append((array('l', [index for (index, coefficient) in entries]),
+                               array('l', [int(coefficient) for (index, coefficient) in entries])))
+        return generators
+
+    @tracing.traced
     def sorted_n_cycles(self, n):
         '''
         This method returns a list of the n-dimensional cycles of this cubical complex.
@@ -1743,61 +2141,76 @@ class CubicalComplex(GenericCellComplex):
         :return: a list of lists, which themselves contain tuples of the generators and cubes in each cycle.
         :rtype: list
         '''
-        # Create a list of all n-dimensional cubes in complex.
-        cellsDict = self.cells()
+        return list(self.iter_sorted_n_cycles(n))
+
+    def iter_sorted_n_cycles(self, n):
+        '''
+        This method yields the n-dimensional cycles of this cubical complex one at a time, in the same format and order
+        as sorted_n_cycles. The homology is computed up front, but each cycle is only sorted when it is requested, so
+        the first cycles are available before the last ones have been sorted.
+
+        :param n: dimension
+        :type n: int
+        :return: a generator of lists of tuples of the generators and cubes in each cycle.
+        :rtype: generator
+        '''
         # Make sure that the parameter n is not too high, or else there will be an list indexing error.
-        # TODO: Will complex.cells() always include -1 cells?
-        assert(n <= len(cellsDict)-2), "This complex only has cells up to dimension " + str(len(cellsDict)-2) + "."
-        cellsList = list(cellsDict[n])
-        
-        # Collect all the generators by computing the n-homology.
-        # See https://doc.sagemath.org/html/en/reference/homology/sage/homology/chain_complex.html for details.
-        generators = []
-        homology = self.chain_complex().homology(deg=n, generators=True)
-        for i in range(len(homology)):
-            generator = homology[i][1].vector(n) # A tuple of the generators of a cycle
-            generators.append(generator)
-    
-        # Create the list of cycles.
-        cycles = [[] for i in range(len(generators))]
-        _cycleCellsCount = 0
-        for i in range(len(generators)):
-            for j in range(len(generators[i])):
-                if generators[i][j] != 0:
-                    cycles[i].append((generators[i][j], cellsList[j]))
-            _cycleCellsCount += len(cycles[i])
-        
+        assert(n <= self.dimension()), "This complex only has cells up to dimension " + str(self.dimension()) + "."
+        # Create a list of all n-dimensional cubes in complex.
+        cellsList = self.cell_index(n)[0]
+
+        # The generators index into the same cell ordering as the chain complex.
+        generators = self.n_cycle_generators(n)
+
         def _sort_cycle(cycle):
             '''
-            This private function takes a cycle and sorts it by checking the first cube and searching for the next cube 
-            that shares a face with it. The process is then repeated until every cube in the cycle shares a face with the 
-            one next to it on the cycle list. See the Cube class above for information about cubes and faces.
+            This private function takes a cycle and sorts it so that, wherever possible, every cube in the cycle shares
+            a face with the one next to it on the cycle list. See the Cube class above for information about cubes and faces.
+
+            The faces of each cube are computed once and collected into an index from each face to the cubes that contain
+            it. The cubes are then walked depth-first through that index, starting from the first cube, so ordering a cycle
+            of L cubes of dimension d costs O(L*d). When the walk reaches a dead end (at a branch point of the cycle) it
+            backtracks to the most recent cube with an unvisited neighbour, and when a whole component has been walked it
+            starts again from the first unvisited cube, so no cube of the cycle is ever dropped.
 
             :param cycle: an unsorted cycle
             :type cycle: list
             :return: a sorted cycle
             :rtype: list
             '''
-            current = cycle[0]
-            cycle = cycle[1:]
-            orderedCellsList = [current]
-            i = 0
-            while len(cycle) > 0 and i < len(cycle):
-                currentCell = orderedCellsList[len(orderedCellsList)-1]
-                nextCell = cycle[i]
-                for face in nextCell[1].faces():
-                    if face in currentCell[1].faces():
-                        orderedCellsList.append(nextCell)
-                        cycle.pop(i)
-                        i = -1
-                        break
-                i += 1
+            cycleFaces = [term[1].faces() for term in cycle]
+            faceIndex = {}
+            for position, faces in enumerate(cycleFaces):
+                for face in faces:
+                    faceIndex.setdefault(face, []).append(position)
+
+            def _neighbours(position):
+                for face in cycleFaces[position]:
+                    for other in faceIndex[face]:
+                        yield other
+
+            visited = [False] * len(cycle)
+            orderedCellsList = []
+            for start in range(len(cycle)):
+                if visited[start]:
+                    continue
+                visited[start] = True
+                orderedCellsList.append(cycle[start])
+                # Each entry of the stack is the (partially consumed) neighbour iterator of a cube on the current path.
+                stack = [_neighbours(start)]
+                while stack:
+                    for position in stack[-1]:
+                        if not visited[position]:
+                            visited[position] = True
+                            orderedCellsList.append(cycle[position])
+                            stack.append(_neighbours(position))
+                            break
+                    else:
+                        stack.pop()
             return orderedCellsList
-    
-        for i in range(len(cycles)):
-            cycles[i] = _sort_cycle(cycles[i])
-    
-        return cycles
+
+        for (indices, coefficients) in generators:
+            yield _sort_cycle([(coefficients[j], cellsList[indices[j]]) for j in range(len(indices))])
 
 
 class CubicalComplexExamples():
@@ -1924,7 +2337,7 @@ class CubicalComplexExamples():
             Cubical complex with 21 vertices and 81 cubes
         """
         try:
-            g = Integer(g)
+            g = operator.index(g)
         except TypeError:
             raise ValueError("genus must be a non-negative integer")
         if g < 0:
@@ -0,0 +1,277 @@
+'''
+This code estimates how big the Abrams-discretized model D_{n,k} of a tree will be before building it: how many cells it has
+in every dimension (and so how many 0-cells, i.e. configurations), how many maximal cubes, how big its boundary matrices are,
+and roughly how much memory CubicalComplex will need for all of that. A sweep (see sweep.py) can then reject or reroute the
+jobs that would not fit, instead of finding out halfway through building them.
+
+Nothing is enumerated: the cells are counted straight from the tree of generate_tree (see conf_n_k_Y.py and conf_n_k_I.py).
+A cell of D_{n,k} puts each robot either at a vertex or on an edge, and is in the complex exactly when no k robots can meet:
+at every vertex, the robots at it plus the robots on the edges at it number fewer than k. (For k=2 this is Abrams' condition
+that the closures of the cells of the robots are disjoint.) A cell is a face of a bigger one exactly when a robot at a vertex
+can move onto an edge at it, so it is maximal when every neighbour of a vertex with a robot already has k-1 robots at or next
+to it. Both conditions only involve a vertex and its edges, so the cells are counted by dynamic programming over the tree,
+keeping for every vertex how many robots are at or next to it. The robots are labelled, so the counts are those of the cells of
+the complex the builders make.
+
+For example, from this directory,
+
+    python estimate.py 3 6 3
+
+prints the estimate for D_{6,3}Y.
+'''
+import argparse
+import sys
+
+def _binomials(n):
+    binomial = [[1]]
+    for m in range(1, n+1):
+        row = binomial[-1]
+        binomial.append([1] + [row[i-1] + row[i] for i in range(1, m)] + [1])
+    return binomial
+
+def _product(first, second, n, binomial):
+    # The counts of placing two disjoint sets of labelled robots independently: a placement of r1 robots (e1 of them on
+    # edges) and one of r2 robots give binomial(r1+r2, r1) placements of r1+r2 robots, one for every way to share out the
+    # labels.
+    product = {}
+    for (r1, e1), a in first.items():
+        for (r2, e2), b in second.items():
+            if r1 + r2 <= n:
+                key = (r1 + r2, e1 + e2)
+                product[key] = product.get(key, 0) + binomial[r1+r2][r1] * a * b
+    return product
+
+def _add(counts, key, polynomial):
+    total = counts.setdefault(key, {})
+    for term, value in polynomial.items():
+        total[term] = total.get(term, 0) + value
+
+def _count(I, n, k, maximal):
+    '''
+    Count the cells (or the maximal cells) of D_{n,k} of the tree I, by dimension.
+
+    The counts are kept as polynomials: dictionaries mapping (r, e) to the number of placements of r labelled robots with e
+    of them on edges. For every vertex v, the placements of the robots in the subtree below v (and on the edge above it) are
+    counted by their "state": the number of robots on the edge above v, whether there is a robot at v and whether v is full,
+    i.e. has k-1 robots at or next to it. The last two only matter for maximal cells.
+    '''
+    binomial = _binomials(n)
+    parent = {}
+    for vertex, children in enumerate(I):
+        for child in children:
+            parent[child] = vertex
+    # Children before their parents.
+    order = []
+    stack = [vertex for vertex in range(len(I)) if vertex not in parent]
+    roots = list(stack)
+    while stack:
+        vertex = stack.pop()
+        order.append(vertex)
+        stack.extend(I[vertex])
+    order.reverse()
+
+    up = {}
+    for vertex in order:
+        # The placements below the vertex, by (robots next to it so far, whether a child has a robot, whether all children
+        # are full).
+        below = {(0, False, True): {(0, 0): 1}}
+        for child in I[vertex]:
+            child_states = up.pop(child)
+            merged = {}
+            for (load, occupied, full), polynomial in below.items():
+                for (edge, child_occupied, child_full), child_polynomial in child_states.items():
+                    if load + edge < k:
+                        _add(merged, (load + edge, occupied or child_occupied, full and child_full),
+                             _product(polynomial, child_polynomial, n, binomial))
+            below = merged
+        above = {}
+        edges = range(k) if vertex in parent else [0]
+        for (load, occupied_child, full_children), polynomial in below.items():
+            for robots in range(k - load):
+                for edge in edges:
+                    total = load + robots + edge
+                    if total >= k:
+                        break
+                    full = total == k-1
+                    if maximal and ((occupied_child and not full) or (robots and not full_children)):
+                        continue
+                    # The robots at the vertex and those on the edge above it are any robots+edge of the labels, of
+                    # which any edge go on the edge; the labels are shared out with the subtree by _product.
+                    here = {(robots + edge, edge): binomial[robots+edge][edge]}
+                    placed = _product(polynomial, here, n, binomial)
+                    _add(above, (edge, robots > 0, full) if maximal else (edge, False, False), placed)
+        up[vertex] = above
+
+    # The trees of generate_tree have one root, but a forest is counted just as well.
+    total = {(0, 0): 1}
+    for root in roots:
+        root_polynomial = {}
+        for polynomial in up.pop(root).values():
+            for term, value in polynomial.items():
+                root_polynomial[term] = root_polynomial.get(term, 0) + value
+        total = _product(total, root_polynomial, n, binomial)
+    counts = [total.get((n, dim), 0) for dim in range(n+1)]
+    while len(counts) > 1 and counts[-1] == 0:
+        counts.pop()
+    return counts
+
+def count_cells(I, n, k):
+    '''
+    EXAMPLE (D_{3,2}Y, as in the f_vector of conf_n_k_Y.the_complex(3, 2), without the empty cell):
+    >>> I = ([1], [2], [3, 5], [4], [], [6], [])
+    >>> count_cells(I, 3, 2)
+    [210, 360, 162, 24]
+
+    :param I: The tree, as the second element of generate_tree (or generate_star_tree, or generate_interval).
+    :type I: tuple
+    :param n: The number of robots.
+    :type n: int
+    :param k: The k of the non-k-equal configuration space.
+    :type k: int
+    :return: The number of cells of D_{n,k} in every dimension, from 0 to the dimension of the complex.
+    :rtype: list
+    '''
+    return _count(I, n, k, False)
+
+def count_maximal_cells(I, n, k):
+    '''
+    EXAMPLE (the 96 maximal cubes of D_{3,2}Y, the cubes of CubicalComplex.maximal_cells):
+    >>> I = ([1], [2], [3, 5], [4], [], [6], [])
+    >>> count_maximal_cells(I, 3, 2)
+    [0, 36, 36, 24]
+
+    :return: The number of maximal cells of D_{n,k} of the tree I in every dimension (see count_cells).
+    :rtype: list
+    '''
+    return _count(I, n, k, True)
+
+def euler_characteristic(cells):
+    '''
+    EXAMPLE:
+    >>> euler_characteristic([210, 360, 162, 24])
+    -12
+
+    :param cells: The number of cells in every dimension, as given by count_cells.
+    :type cells: list
+    :return: The Euler characteristic, to check against that of the complex once it is built.
+    :rtype: int
+    '''
+    return sum((-1)**dim * number for (dim, number) in enumerate(cells))
+
+def boundary_matrices(cells):
+    '''
+    Every d-cube has 2d faces, all in the complex, and each is an entry +1 or -1 of the boundary matrix.
+
+    EXAMPLE:
+    >>> boundary_matrices([210, 360, 162, 24])
+    [(1, 210, 360, 720), (2, 360, 162, 648), (3, 162, 24, 144)]
+
+    :return: The (dimension, rows, columns, nonzero entries) of every boundary matrix (see CubicalComplex.boundary_matrix).
+    :rtype: list
+    '''
+    return [(dim, cells[dim-1], cells[dim], 2*dim*cells[dim]) for dim in range(1, len(cells))]
+
+def _sizes(width):
+    # The sizes in bytes of what CubicalComplex keeps per cell and per matrix entry, measured on this Python, as they differ
+    # between Python 2 and 3 and between 32 and 64 bit builds.
+    from array import array
+    import cubical_complex
+    samples = 4096
+    cube = cubical_complex.Cube([[0, 1]] + [[0]]*(width-1))
+    cube_bytes = sys.getsizeof(cube) + sys.getsizeof(cube.tuple()) + sys.getsizeof(cube.nondegenerate_intervals())
+    if hasattr(cube, "__dict__"):
+        cube_bytes += sys.getsizeof(cube.__dict__)
+    set_bytes = sys.getsizeof(set(range(samples))) // samples
+    # cell_index keeps a sorted tuple of the cells and a dictionary of their positions.
+    index_bytes = sys.getsizeof(tuple(range(samples))) // samples + sys.getsizeof(dict.fromkeys(range(samples))) // samples
+    # A nonzero entry takes its row, column and value in boundary_matrix.
+    entry_bytes = 3 * array('l').itemsize
+    return (cube_bytes + set_bytes, index_bytes, entry_bytes)
+
+def estimate(lookup, I, n, k):
+    '''
+    Estimate the size of D_{n,k} of a tree before building it.
+
+    The memory is that of the cells (the Cube instances and the sets of CubicalComplex.cells), their indices
+    (CubicalComplex.cell_index) and the boundary matrices (CubicalComplex.boundary_matrix), when all of them are cached at
+    once, as they are at the end of CubicalComplex.chain_complex without a memory budget. It leaves out the pairs of
+    coordinates that the cubes share with each other, the interpreter itself and whatever Sage needs for the homology, so it
+    is a lower bound of the peak resident set size more than a prediction of it; it is meant for telling apart the jobs that
+    cannot fit from those that might.
+
+    :param lookup: The coordinates of the vertices, as the first element of generate_tree.
+    :type lookup: list
+    :param I: The tree, as the second element of generate_tree.
+    :type I: tuple
+    :return: A dictionary with the number of "cells" and of "maximal_cells" in every dimension, the number of "vertices"
+             (0-cells), the "dimension", the "euler_characteristic", the (dimension, rows, columns, nonzero entries) of the
+             "boundary_matrices", and the estimated "memory_kb", broken down into "memory" (in kilobytes).
+    :rtype: dict
+    '''
+    cells = count_cells(I, n, k)
+    matrices = boundary_matrices(cells)
+    (cell_bytes, index_bytes, entry_bytes) = _sizes(n * len(lookup[0]))
+    breakdown = {"cells": sum(cells) * cell_bytes // 1024,
+                 "cell_indices": sum(cells) * index_bytes // 1024,
+                 "boundary_matrices": sum(nonzeros for (dim, rows, columns, nonzeros) in matrices) * entry_bytes // 1024}
+    return {"n": n, "k": k, "cells": cells, "maximal_cells": count_maximal_cells(I, n, k), "vertices": cells[0],
+            "dimension": len(cells) - 1, "euler_characteristic": euler_characteristic(cells),
+            "boundary_matrices": matrices, "memory_kb": sum(breakdown.values()), "memory": breakdown}
+
+def estimate_star(d, n, k, subdivision=None):
+    '''
+    Estimate the size of D_{n,k} of the star with d arms (see generate_star_tree), or of the interval if d is None (see
+    generate_interval), subdivided as by the_complex.
+    '''
+    if d is None:
+        import conf_n_k_I
+        if subdivision is None:
+            subdivision = conf_n_k_I.minimal_subdivision(n, k)
+        (lookup, I) = conf_n_k_I.generate_interval(n, subdivision)
+    else:
+        import conf_n_k_Y
+        if subdivision is None:
+            subdivision = conf_n_k_Y.minimal_subdivision(n, k, d)
+        (lookup, I) = conf_n_k_Y.generate_star_tree(d, n, subdivision)
+    return estimate(lookup, I, n, k)
+
+def format_estimate(result):
+    '''
+    :return: The estimate for humans.
+    :rtype: str
+    '''
+    lines = ["%d cells in dimensions 0 to %d: %s" % (sum(result["cells"]), result["dimension"],
+                                                      " ".join(str(number) for number in result["cells"])),
+             "%d maximal cubes: %s" % (sum(result["maximal_cells"]),
+                                       " ".join(str(number) for number in result["maximal_cells"])),
+             "Euler characteristic: %d" % result["euler_characteristic"]]
+    lines.extend("boundary matrix %d: %d x %d, %d nonzero entries" % matrix for matrix in result["boundary_matrices"])
+    lines.append("memory: about %d KB (%s)" % (result["memory_kb"], ", ".join("%s %d KB" % item
+                                                                              for item in sorted(result["memory"].items()))))
+    return "\n".join(lines)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Estimate the size of D_{n,k} of a star (or the interval) without building it.")
+    parser.add_argument("starNum", type=int, help="the number of arms of the star, or 0 for the interval")
+    parser.add_argument("n", type=int, help="the number of robots")
+    parser.add_argument("k", type=int, help="the k of the non-k-equal configuration space")
+    parser.add_argument("--subdivision", type=int, help="the number of edges of every arm (default: as the_complex)")
+    parser.add_argument("--check", action="store_true", help="also build the complex and compare its cells with the estimate")
+    args = parser.parse_args()
+    d = args.starNum or None
+    result = estimate_star(d, args.n, args.k, args.subdivision)
+    print(format_estimate(result))
+    if args.check:
+        import conf_n_k_I
+        import conf_n_k_Y
+        if d is None:
+            cubical = conf_n_k_I.the_complex(args.n, args.k, args.subdivision)
+        else:
+            cubical = conf_n_k_Y.the_complex(args.n, args.k, d, args.subdivision)
+        built = cubical.f_vector()[1:]
+        maximal = [0]*len(built)
+        for cube in cubical.maximal_cells():
+            maximal[cube.dimension()] += 1
+        if built != result["cells"] or maximal != result["maximal_cells"]:
+            parser.exit(1, "The complex has %s cells and %s maximal cubes.\n" % (built, maximal))
+        print("checked against the complex")
@@ -0,0 +1,152 @@
+'''
+This code keeps track of how much memory building the Abrams-discretized models takes, and stops a build cleanly when it
+outgrows a memory budget, instead of leaving it to the operating system to kill the process (or the whole node).
+
+The builders (conf_n_k_Y.py, conf_n_k_I.py and abrams_xy.py) and CubicalComplex check the budget as they go, at the places
+where memory grows: while collecting the cubes of the_complex, while listing the cells, while building the boundary matrices
+and before computing the homology. Like tracing (see tracing.py), this is off unless a budget is set, and hot loops only
+check budget_kb before doing anything.
+
+When the resident set size of the process goes over a "soft" fraction of the budget, the check first gives the code a chance
+to switch to a leaner strategy (e.g. while building its boundary matrices, CubicalComplex drops the indices of the cells of
+the dimensions it is done with, and recomputes them later if they are needed again). If that is not enough and the process
+goes over the budget itself, MemoryBudgetExceeded is raised, naming the stage that was running. For example, from this
+directory,
+
+    import memory, conf_n_k_Y
+    memory.set_budget(4*1024*1024)  # 4 GB
+    try:
+        cycles = conf_n_k_Y.the_complex(6, 3).sorted_n_cycles(1)
+    except memory.MemoryBudgetExceeded as e:
+        print(e)
+
+The memory is measured as the resident set size, which is what the OOM killer goes by. Python frees memory back to the
+operating system lazily, so the resident set size is an upper bound of what is actually in use, and a check can only catch
+growth that happened since the last one; a hard limit on the address space (see set_budget) is the backstop for the rest.
+'''
+import json
+import logging
+import os
+import resource
+import sys
+
+# Logging configuration: by default, produce no output
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# The memory budget in kilobytes, or None if there is none. Hot loops check this before calling checkpoint.
+budget_kb = None
+
+# How often (in calls) checkpoint actually measures the memory.
+CHECK_EVERY = 4096
+
+_soft_fraction = 0.8
+_checkpoint_calls = 0
+
+class MemoryBudgetExceeded(MemoryError):
+    '''
+    Raised when the process goes over the memory budget.
+    '''
+    def __init__(self, stage, used_kb, budget_kb):
+        MemoryError.__init__(self, "Over the memory budget in %s: using %d KB of %d KB." % (stage, used_kb, budget_kb))
+        self.stage = stage
+        self.used_kb = used_kb
+        self.budget_kb = budget_kb
+
+def peak_memory():
+    '''
+    :return: The peak resident set size of this process so far, in kilobytes.
+    :rtype: int
+    '''
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, but macOS reports bytes.
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+def current_memory():
+    '''
+    :return: The current resident set size of this process, in kilobytes. Where that is not available (outside Linux),
+             the peak resident set size is used instead, which makes the budget stricter but never looser.
+    :rtype: int
+    '''
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+    except (IOError, OSError, ValueError, IndexError):
+        return peak_memory()
+    return pages * (os.sysconf("SC_PAGE_SIZE") // 1024)
+
+def set_budget(kb, soft_fraction=0.8, address_space_kb=None):
+    '''
+    Set the memory budget of this process.
+
+    :param kb: The budget in kilobytes, or None to remove it.
+    :type kb: int
+    :param soft_fraction: The fraction of the budget above which code is asked to switch to a leaner strategy.
+    :type soft_fraction: float
+    :param address_space_kb: If given, also limit the address space of the process to this many kilobytes, so that an
+                             allocation that would go over it raises MemoryError in Python, even between two checks. This
+                             limit cannot be raised again by the process, and should leave room above the budget, as the
+                             address space includes memory that is mapped but not resident (e.g. shared libraries).
+    :type address_space_kb: int
+    '''
+    global budget_kb, _soft_fraction
+    budget_kb = kb
+    _soft_fraction = soft_fraction
+    if address_space_kb is not None:
+        limit = address_space_kb * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+def check(stage, relief=None):
+    '''
+    Check the memory budget, if there is one.
+
+    :param stage: The name of what is running, for the error message.
+    :type stage: str
+    :param relief: A function to call if the process is over the soft fraction of the budget. It should free what it can
+                   (e.g. caches that can be recomputed) and switch to a leaner strategy. It is called on every check that
+                   finds the process over the soft fraction, so it should be cheap when there is nothing left to free.
+    :type relief: function
+    :raises MemoryBudgetExceeded: If the process is over the budget.
+    '''
+    if budget_kb is None:
+        return
+    used = current_memory()
+    if relief is not None and used > _soft_fraction * budget_kb:
+        logger.info("Using %d KB of %d KB in %s, freeing memory.", used, budget_kb, stage)
+        relief()
+        used = current_memory()
+    if used > budget_kb:
+        raise MemoryBudgetExceeded(stage, used, budget_kb)
+
+def checkpoint(stage, relief=None):
+    '''
+    Like check, but only measures the memory every CHECK_EVERY calls, for use in hot loops.
+    '''
+    global _checkpoint_calls
+    _checkpoint_calls += 1
+    if _checkpoint_calls >= CHECK_EVERY:
+        _checkpoint_calls = 0
+        check(stage, relief)
+
+def account(stage, **sizes):
+    '''
+    Record the memory use at the end of a stage, together with the sizes of what the stage built, and log it as one line of
+    JSON at the DEBUG level of the logger of this module.
+
+    EXAMPLE:
+    >>> record = account("cells", cubes=10)
+    >>> sorted(record)
+    ['cubes', 'peak_memory_kb', 'rss_kb', 'stage']
+
+    :param stage: The name of the stage.
+    :type stage: str
+    :param sizes: The sizes (e.g. the number of Cube instances, the sizes of sets, or the number of nonzero matrix entries)
+                  of what the stage built.
+    :return: A dictionary with the stage, the current ("rss_kb") and peak ("peak_memory_kb") resident set size, and the
+             sizes.
+    :rtype: dict
+    '''
+    record = dict(sizes, stage=stage, rss_kb=current_memory(), peak_memory_kb=peak_memory())
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(json.dumps(record, sort_keys=True))
+    return record
@@ -0,0 +1,458 @@
+'''
+This code builds a much smaller chain complex with the same homology as the Abrams-discretized model D_{n,k} of a tree, by
+discrete Morse theory, without building D_{n,k} itself. It follows Farley and Sabalka (Discrete Morse theory and graph braid
+groups), who give a discrete gradient on the Abrams model of the unordered configuration space of a tree; here the robots are
+labelled, as in conf_n_k_Y.py and conf_n_k_I.py, and the space is the non-k-equal one.
+
+The vertices are numbered as by generate_tree (or generate_star_tree, or generate_interval): every vertex but the root 0
+comes after its parent, and the numbering goes through the tree depth first. A cell puts each robot at a vertex v or on the
+edge from v to its parent, and is in D_{n,k} when, at every vertex, the robots at it plus those on the edges at it number
+fewer than k (see estimate.py). The gradient pairs cells that differ by one robot moving between a vertex v and the edge from
+v to its parent p:
+- a robot at v can move onto the edge when p has fewer than k-1 robots at or next to it, and
+- a robot on the edge can move down to v unless p has k-1 robots at or next to it and there is a robot at a vertex w with
+  parent p that comes before it, i.e. with (w, robot at w) < (v, robot on the edge) (moving the robot down would let that
+  robot move first, which is Farley and Sabalka's "order respecting" condition).
+Of all the moves a cell allows, the gradient pairs it along the one with the smallest (v, robot), and a cell that allows none
+is critical. In a critical cell every robot away from the root sits at, or on the edge below, a vertex with k-1 robots at or
+next to it, so the critical cells are few, and they are counted and listed straight from the tree (see critical_cells).
+
+The Morse complex has the critical cells as its basis, and its boundary follows the gradient paths from the faces of a
+critical cell down to the critical cells of one dimension less (see boundary). For example, from this directory,
+
+    import conf_n_k_Y
+    M = conf_n_k_Y.the_morse_complex(4, 3)
+    print(M)
+    print(M.homology())
+
+has the same homology as conf_n_k_Y.the_complex(4, 3), but from 84 cells instead of 21996 (and instead of 114780 with arms
+of 3 edges, see minimal_subdivision). The homology needs Sage, the rest does not, and betti_numbers gives the Betti numbers
+modulo a prime without it.
+'''
+import itertools
+from array import array
+
+import cubical_complex
+import memory
+import persistence
+import tracing
+
+class MorseComplex(object):
+    '''
+    The Morse complex of D_{n,k} of a tree, for the gradient described at the top of this file.
+
+    A cell is a tuple giving the place of every robot: (v, v) for a robot at vertex v, and (p, v) for a robot on the edge
+    from v to its parent p, so its dimension is the number of robots on edges. (These are the moves of downstream_moves, from
+    p to v.)
+
+    EXAMPLE (D_{2,2}Y, a circle with 12 vertices and 12 edges, becomes a circle with 2 vertices and 2 edges):
+    >>> M = MorseComplex([(0, 1, 0), (0, 0, 0), (1, 0, 0), (0, 0, 1)], ([1], [2, 3], [], []), 2, 2)
+    >>> M
+    Morse complex with 2 critical vertices and 4 critical cells
+    >>> M.critical_cells(1)
+    (((1, 3), (2, 2)), ((2, 2), (1, 3)))
+    >>> sorted(M.boundary(M.critical_cells(1)[0]).items())
+    [(((0, 0), (1, 1)), -1), (((1, 1), (0, 0)), 1)]
+    '''
+    def __init__(self, lookup, I, n, k):
+        '''
+        :param lookup: The coordinates of the vertices, as the first element of generate_tree.
+        :type lookup: list
+        :param I: The tree, as the second element of generate_tree.
+        :type I: tuple
+        :param n: The number of robots.
+        :type n: int
+        :param k: The k of the non-k-equal configuration space.
+        :type k: int
+        '''
+        self._lookup = lookup
+        self._I = I
+        self._n = n
+        self._k = k
+        self._parent = [None]*len(I)
+        for vertex, children in enumerate(I):
+            for child in children:
+                self._parent[child] = vertex
+        # The critical cells by dimension, sorted, and their positions in that order.
+        self._critical = None
+        self._positions = {}
+        # The critical cells (with coefficients) that the gradient paths from a cell lead to, for every cell seen so far.
+        self._flows = {}
+        self._complex = {}
+
+    def _loads(self, cell):
+        loads = [0]*len(self._I)
+        for (start, end) in cell:
+            loads[start] += 1
+            if end != start:
+                loads[end] += 1
+        return loads
+
+    def _move(self, cell):
+        # The (v, robot) of the smallest move the cell allows (see the top of this file), or None if it is critical.
+        loads = self._loads(cell)
+        full = self._k - 1
+        best = None
+        for robot, (start, end) in enumerate(cell):
+            if best is not None and (end, robot) > best:
+                continue
+            if start == end:
+                if self._parent[end] is None or loads[self._parent[end]] >= full:
+                    continue
+            elif loads[start] == full and any(other == end_other and self._parent[end_other] == start and
+                                              (end_other, before) < (end, robot)
+                                              for before, (other, end_other) in enumerate(cell)):
+                continue
+            best = (end, robot)
+        return best
+
+    def partner(self, cell):
+        '''
+        EXAMPLE (D_{2,2}Y: a robot moves onto an edge, and back down):
+        >>> M = MorseComplex([(0, 1, 0), (0, 0, 0), (1, 0, 0), (0, 0, 1)], ([1], [2, 3], [], []), 2, 2)
+        >>> M.partner(((1, 2), (3, 3))), M.partner(((2, 2), (3, 3))), M.partner(((0, 0), (1, 3)))
+        (((2, 2), (3, 3)), ((1, 2), (3, 3)), ((0, 0), (3, 3)))
+        >>> M.partner(((1, 3), (2, 2))) is None
+        True
+
+        :param cell: A cell of D_{n,k}.
+        :type cell: tuple
+        :return: The cell paired with this one by the gradient (a coface or a face of it), or None if it is critical.
+        :rtype: tuple
+        '''
+        move = self._move(cell)
+        if move is None:
+            return None
+        (end, robot) = move
+        place = (end, end) if cell[robot][0] != end else (self._parent[end], end)
+        return cell[:robot] + (place,) + cell[robot+1:]
+
+    def faces(self, cell):
+        '''
+        The faces of a cell with their signs in its boundary, which are those of the corresponding cubes of D_{n,k} (see
+        cube and CubicalComplex.boundary_matrix): the robot on the j-th edge moves to its end with the larger coordinates
+        with sign (-1)^j, and to the other end with the opposite sign.
+
+        :return: A list of pairs (face, sign).
+        :rtype: list
+        '''
+        faces = []
+        sign = 1
+        for robot, (start, end) in enumerate(cell):
+            if start == end:
+                continue
+            (upper, lower) = (start, end) if self._lookup[start] > self._lookup[end] else (end, start)
+            faces.append((cell[:robot] + ((upper, upper),) + cell[robot+1:], sign))
+            faces.append((cell[:robot] + ((lower, lower),) + cell[robot+1:], -sign))
+            sign = -sign
+        return faces
+
+    def _flow(self, first):
+        # The critical cells the gradient paths from a cell lead to, with their coefficients: a critical cell leads to
+        # itself, a cell paired with a face leads nowhere, and a cell paired with a coface leads to wherever the other faces
+        # of that coface lead, with the signs that cancel the cell from the boundary of the coface. This is a depth first
+        # search, without recursion, as gradient paths can be long.
+        flows = self._flows
+        stack = [first]
+        # The faces of the cofaces of the cells whose flows are being worked out.
+        entered = {}
+        while stack:
+            cell = stack[-1]
+            if cell in flows:
+                stack.pop()
+                continue
+            faces = entered.get(cell)
+            if faces is None:
+                move = self._move(cell)
+                if move is None:
+                    flows[cell] = {cell: 1}
+                    continue
+                (end, robot) = move
+                if cell[robot][0] != end:
+                    # The robot is on an edge, so the cell is paired with a face.
+                    flows[cell] = {}
+                    continue
+                faces = self.faces(cell[:robot] + ((self._parent[end], end),) + cell[robot+1:])
+                entered[cell] = faces
+                pending = [face for (face, sign) in faces if face != cell and face not in flows]
+                for face in pending:
+                    # A cell whose flow is still being worked out is on the path from the first cell to this one.
+                    if face in entered:
+                        raise ValueError("The gradient has a closed path through " + str(face) + ".")
+                if pending:
+                    stack.extend(pending)
+                    if memory.budget_kb is not None:
+                        memory.checkpoint("morse_boundary")
+                    continue
+            incidence = [sign for (face, sign) in faces if face == cell][0]
+            flow = {}
+            for (face, sign) in faces:
+                if face != cell:
+                    for critical, coefficient in flows[face].items():
+                        flow[critical] = flow.get(critical, 0) - sign*incidence*coefficient
+            flows[cell] = dict((critical, coefficient) for (critical, coefficient) in flow.items() if coefficient)
+            if tracing.enabled:
+                tracing.count("gradient steps")
+            stack.pop()
+        return flows[first]
+
+    def boundary(self, cell):
+        '''
+        EXAMPLE (D_{3,2}Y: the boundary of every critical edge is the difference of two critical vertices):
+        >>> import conf_n_k_Y
+        >>> M = conf_n_k_Y.the_morse_complex(3, 2)
+        >>> M.f_vector()
+        [6, 18]
+        >>> sorted(set(tuple(sorted(M.boundary(cell).values())) for cell in M.critical_cells(1)))
+        [(-1, 1)]
+
+        :param cell: A critical cell.
+        :type cell: tuple
+        :return: Its boundary in the Morse complex, as a dictionary mapping critical cells of one dimension less to their
+                 (nonzero) coefficients.
+        :rtype: dict
+        '''
+        boundary = {}
+        for (face, sign) in self.faces(cell):
+            for critical, coefficient in self._flow(face).items():
+                boundary[critical] = boundary.get(critical, 0) + sign*coefficient
+        return dict((critical, coefficient) for (critical, coefficient) in boundary.items() if coefficient)
+
+    @tracing.traced
+    def _critical_cells(self):
+        # First list the critical "patterns", i.e. the numbers of robots at every vertex and on every edge, by going up the
+        # tree from the leaves. For every vertex v (and the robots on the edge from v to its parent), the patterns of its
+        # subtree are kept with the number of robots in them, the number on the edge above v, whether there is a robot at v,
+        # and whether there is one at v or on the edge above it (which then needs the parent to be full).
+        n = self._n
+        full = self._k - 1
+        order = []
+        stack = [vertex for vertex in range(len(self._I)) if self._parent[vertex] is None]
+        while stack:
+            vertex = stack.pop()
+            order.append(vertex)
+            stack.extend(self._I[vertex])
+        patterns = {}
+        for vertex in reversed(order):
+            # (robots, robots next to the vertex so far, whether a child before has a robot at it, whether the vertex
+            # must be full, places, vertices whose robots must come before those on the edge above them)
+            partial = [(0, 0, False, False, (), ())]
+            for child in sorted(self._I[vertex]):
+                child_patterns = patterns.pop(child)
+                combined = []
+                for (robots, load, occupied, must_be_full, places, ordered) in partial:
+                    for (child_robots, edge, child_occupied, needs_full, child_places, child_ordered) in child_patterns:
+                        if robots + child_robots > n or load + edge > full:
+                            continue
+                        child_ordered = list(child_ordered)
+                        if edge and not occupied:
+                            # The robots on the edge may only stay there if a robot at an earlier child of the vertex
+                            # (there is none) or an earlier robot at the child itself would move first.
+                            if not child_occupied:
+                                continue
+                            child_ordered.append(child)
+                        combined.append((robots + child_robots, load + edge, occupied or child_occupied,
+                                         must_be_full or needs_full, places + child_places, ordered + tuple(child_ordered)))
+                partial = combined
+            root = self._parent[vertex] is None
+            mine = []
+            for (robots, load, occupied, must_be_full, places, ordered) in partial:
+                for here in range(min(full - load, n - robots) + 1):
+                    for edge in ([0] if root else range(min(full - load - here, n - robots - here) + 1)):
+                        if must_be_full and load + here + edge != full:
+                            continue
+                        new_places = places
+                        if here:
+                            new_places += (((vertex, vertex), here),)
+                        if edge:
+                            new_places += (((self._parent[vertex], vertex), edge),)
+                        mine.append((robots + here + edge, edge, here > 0, (here + edge > 0) and not root, new_places,
+                                     ordered))
+            patterns[vertex] = mine
+
+        # Then give the robots their labels, in every way that keeps the cells critical.
+        critical = {}
+        for root in [vertex for vertex in range(len(self._I)) if self._parent[vertex] is None]:
+            for (robots, edge, occupied, needs_full, places, ordered) in patterns[root]:
+                if robots != n:
+                    continue
+                for cell in _labellings(places, n):
+                    if all(min(robot for robot in range(n) if cell[robot] == (child, child)) <
+                           min(robot for robot in range(n) if cell[robot] == (self._parent[child], child))
+                           for child in ordered):
+                        critical.setdefault(_dimension(cell), []).append(cell)
+        # A forest would need the patterns of its trees combined; the trees of generate_tree have a single root.
+        dimension = max(critical) if critical else -1
+        self._critical = dict((dim, tuple(sorted(critical.get(dim, ())))) for dim in range(dimension+1))
+        if tracing.enabled:
+            tracing.count("critical cells", sum(len(cells) for cells in self._critical.values()))
+
+    def critical_cells(self, dim):
+        '''
+        :param dim: A dimension.
+        :type dim: int
+        :return: The critical cells of that dimension, sorted.
+        :rtype: tuple
+        '''
+        if self._critical is None:
+            self._critical_cells()
+        return self._critical.get(dim, ())
+
+    def dimension(self):
+        '''
+        :return: The largest dimension of a critical cell.
+        :rtype: int
+        '''
+        if self._critical is None:
+            self._critical_cells()
+        return max(self._critical) if self._critical else -1
+
+    def f_vector(self):
+        '''
+        :return: The numbers of critical cells in every dimension, from 0 to the dimension.
+        :rtype: list
+        '''
+        return [len(self.critical_cells(dim)) for dim in range(self.dimension()+1)]
+
+    def euler_characteristic(self):
+        '''
+        EXAMPLE (the same as that of D_{3,2}Y, see estimate.py):
+        >>> import conf_n_k_Y
+        >>> conf_n_k_Y.the_morse_complex(3, 2).euler_characteristic()
+        -12
+
+        :return: The alternating sum of the numbers of critical cells, which is the Euler characteristic of D_{n,k}.
+        :rtype: int
+        '''
+        return sum((-1)**dim * number for (dim, number) in enumerate(self.f_vector()))
+
+    def betti_numbers(self, prime=persistence.PRIME):
+        '''
+        The Betti numbers of D_{n,k} modulo a prime, without Sage (see persistence.reduce_filtration).
+
+        EXAMPLE:
+        >>> import conf_n_k_Y
+        >>> conf_n_k_Y.the_morse_complex(3, 2).betti_numbers()
+        [1, 13]
+
+        :param prime: The prime to compute the homology modulo.
+        :type prime: int
+        :return: The Betti numbers, from dimension 0 to the dimension.
+        :rtype: list
+        '''
+        births = dict((dim, [0]*len(self.critical_cells(dim))) for dim in range(self.dimension()+1))
+        return persistence.betti_numbers(persistence.reduce_filtration(self, births, prime), 0)
+
+    def cell_index(self, dim):
+        '''
+        :return: A dictionary mapping every critical cell of dimension dim to its position in critical_cells(dim).
+        :rtype: dict
+        '''
+        if dim not in self._positions:
+            cells = self.critical_cells(dim)
+            self._positions[dim] = dict(zip(cells, range(len(cells))))
+        return self._positions[dim]
+
+    @tracing.traced
+    def boundary_matrix(self, dim):
+        '''
+        The boundary map of the Morse complex from dimension dim to dim-1, in the same form as
+        CubicalComplex.boundary_matrix, with the rows and columns in the order of critical_cells.
+
+        :return: A tuple (nrows, ncols, rows, cols, values) giving the shape of the matrix and, in three arrays of the same
+                 length, the row, column and value of each of its nonzero entries, column by column.
+        :rtype: tuple
+        '''
+        if dim not in self._complex:
+            old = self.cell_index(dim-1)
+            current = self.critical_cells(dim)
+            rows = array('l')
+            cols = array('l')
+            values = array('l')
+            for (col, cell) in enumerate(current):
+                for (critical, coefficient) in sorted(self.boundary(cell).items(), key=lambda item: old[item[0]]):
+                    rows.append(old[critical])
+                    cols.append(col)
+                    values.append(coefficient)
+                # The flows of the cells of one dimension are not needed for the next one, and can be recomputed.
+                memory.check("morse_boundary", self._flows.clear)
+            self._flows.clear()
+            self._complex[dim] = (len(old), len(current), rows, cols, values)
+        return self._complex[dim]
+
+    def chain_complex(self, base_ring=None, augmented=False):
+        '''
+        :param base_ring: The base ring (this needs Sage). Defaults to the integers.
+        :param augmented: Whether to add a class in dimension -1, for reduced homology.
+        :type augmented: bool
+        :return: The Morse complex as a Sage chain complex.
+        :rtype: ChainComplex
+        '''
+        from sage.rings.integer_ring import ZZ
+        from sage.matrix.constructor import matrix
+        from sage.homology.chain_complex import ChainComplex
+        if base_ring is None:
+            base_ring = ZZ
+        vertices = len(self.critical_cells(0))
+        empty_cell = 1 if augmented else 0
+        differentials = {0: matrix(base_ring, empty_cell, vertices, vertices*empty_cell*[1])}
+        for dim in range(1, self.dimension()+1):
+            (nrows, ncols, rows, cols, values) = self.boundary_matrix(dim)
+            differentials[dim] = matrix(ZZ, nrows, ncols, dict(zip(zip(rows, cols), values))).change_ring(base_ring)
+        return ChainComplex(data=differentials, base_ring=base_ring, degree=-1)
+
+    def homology(self, dim=None, base_ring=None, reduced=True):
+        '''
+        The homology of the Morse complex, which is that of D_{n,k} (this needs Sage).
+
+        :param dim: A dimension, or None for all of them.
+        :type dim: int
+        :param base_ring: The base ring. Defaults to the integers.
+        :param reduced: Whether to compute the reduced homology.
+        :type reduced: bool
+        :return: The homology group in dimension dim, or a dictionary of them keyed by dimension.
+        '''
+        answer = self.chain_complex(base_ring, augmented=reduced).homology(base_ring=base_ring)
+        if dim is not None:
+            return answer[dim]
+        return dict((d, answer[d]) for d in range(self.dimension()+1))
+
+    def cube(self, cell):
+        '''
+        EXAMPLE:
+        >>> M = MorseComplex([(0, 1, 0), (0, 0, 0), (1, 0, 0), (0, 0, 1)], ([1], [2, 3], [], []), 2, 2)
+        >>> M.cube(((1, 3), (2, 2)))
+        [0,0] x [0,0] x [0,1] x [1,1] x [0,0] x [0,0]
+
+        :return: The cube of D_{n,k} (as built by the_complex) of a cell.
+        :rtype: Cube
+        '''
+        intervals = []
+        for (start, end) in cell:
+            intervals.extend(sorted([u, v]) for (u, v) in zip(self._lookup[start], self._lookup[end]))
+        return cubical_complex.Cube(intervals)
+
+    def __repr__(self):
+        vertices = len(self.critical_cells(0))
+        cells = sum(self.f_vector())
+        return "Morse complex with %d critical %s and %d critical %s" % (
+            vertices, "vertex" if vertices == 1 else "vertices", cells, "cell" if cells == 1 else "cells")
+
+def _dimension(cell):
+    return sum(1 for (start, end) in cell if start != end)
+
+def _labellings(places, n):
+    # All the ways to give the n robots the places, where places lists (place, number of robots) pairs.
+    cell = [None]*n
+    def fill(index, robots):
+        if index == len(places):
+            yield tuple(cell)
+            return
+        (place, number) = places[index]
+        for chosen in itertools.combinations(robots, number):
+            for robot in chosen:
+                cell[robot] = place
+            rest = [robot for robot in robots if robot not in chosen]
+            for labelled in fill(index + 1, rest):
+                yield labelled
+    return fill(0, list(range(n)))
@@ -0,0 +1,217 @@
+'''
+This code computes the homology of D_{n,k} for all k at once. The non-k-equal configuration spaces of a graph are nested,
+D_{n,2} in D_{n,3} in ... in D_{n,n+1} (the whole product of the graph with itself), and so are their Abrams-discretized
+models on the same tree: a cell of D_{n,k_max} is in D_{n,k} exactly when every vertex has fewer than k robots at or next to
+it (see estimate.py). So D_{n,k_max} is built once, every cell is tagged with the smallest k at which it appears, and a single
+persistent homology reduction over that filtration gives the Betti numbers of every D_{n,k} with k <= k_max, together with the
+ranks of the maps on homology induced by the inclusions.
+
+The result is a list of intervals [birth, death) for every dimension: a class of the homology that first appears in
+D_{n,birth} and dies (becomes a boundary, or merges with an older class) in D_{n,death}, with death None for the classes that
+are still alive in D_{n,k_max}. The reduction is over the integers modulo a prime, which gives the rational Betti numbers
+unless the homology has torsion of that order. For example, from this directory,
+
+    import persistence
+    intervals = persistence.persistence_star(3, 4, 5)
+    for k in range(2, 6):
+        print(k, persistence.betti_numbers(intervals, k))
+
+prints the Betti numbers of D_{4,k}Y for k = 2, ..., 5, building only D_{4,5}Y.
+'''
+import memory
+import tracing
+
+PRIME = 32003
+
+def cell_birth(cube, position, width):
+    '''
+    EXAMPLE (D_{2,k}Y, with one robot at the center and the other on an edge at it, and then away from it):
+    >>> position = {(0, 1, 0): 0, (0, 0, 0): 1, (1, 0, 0): 2, (0, 0, 1): 3}
+    >>> import cubical_complex
+    >>> cell_birth(cubical_complex.Cube([[0], [0], [0], [0, 1], [0], [0]]), position, 3)
+    3
+    >>> cell_birth(cubical_complex.Cube([[0], [1], [0], [0, 1], [0], [0]]), position, 3)
+    2
+
+    :param cube: A cube of D_{n,k}, as built by the_complex.
+    :type cube: Cube
+    :param position: A dictionary mapping the coordinates of every vertex of the tree (see generate_tree) to the vertex.
+    :type position: dict
+    :param width: The number of coordinates of a vertex.
+    :type width: int
+    :return: The smallest k for which the cube is in D_{n,k}: one more than the largest number of robots at or next to a
+             vertex.
+    :rtype: int
+    '''
+    loads = {}
+    intervals = cube.tuple()
+    for start in range(0, len(intervals), width):
+        robot = intervals[start:start+width]
+        lower = position[tuple(a for (a, b) in robot)]
+        upper = position[tuple(b for (a, b) in robot)]
+        loads[lower] = loads.get(lower, 0) + 1
+        if upper != lower:
+            loads[upper] = loads.get(upper, 0) + 1
+    return max(loads.values()) + 1
+
+@tracing.traced
+def persistence(cubical, lookup, prime=PRIME):
+    '''
+    The persistent homology of the filtration of D_{n,k_max} by k.
+
+    EXAMPLE (D_{3,2}Y and D_{3,3}Y inside D_{3,4}Y, which is contractible):
+    >>> import conf_n_k_Y
+    >>> intervals = persistence(conf_n_k_Y.the_complex(3, 4, subdivision=2), conf_n_k_Y.generate_tree(3)[0])
+    >>> [betti_numbers(intervals, k) for k in (2, 3, 4)]
+    [[1, 13, 0, 0], [1, 0, 5, 0], [1, 0, 0, 0]]
+
+    :param cubical: The complex D_{n,k_max} of a tree, as built by the_complex. The tree must be subdivided enough for
+                    every k, e.g. as for k=2 (see minimal_subdivision).
+    :type cubical: CubicalComplex
+    :param lookup: The coordinates of the vertices of the tree, as the first element of generate_tree.
+    :type lookup: list
+    :param prime: The prime to reduce modulo.
+    :type prime: int
+    :return: A dictionary mapping every dimension to the sorted list of its (birth, death) intervals.
+    :rtype: dict
+    '''
+    position = dict((tuple(point), vertex) for (vertex, point) in enumerate(lookup))
+    width = len(lookup[0])
+    births = dict((dim, [cell_birth(cube, position, width) for cube in cubical.cell_index(dim)[0]])
+                  for dim in range(cubical.dimension()+1))
+    return reduce_filtration(cubical, births, prime)
+
+@tracing.traced
+def reduce_filtration(cubical, births, prime=PRIME):
+    '''
+    The persistent homology of a filtration of a cubical complex.
+
+    The cells of every dimension are put in the order of their births (and, among cells born at the same time, of
+    cell_index), and the boundary matrices of CubicalComplex.boundary_matrix are reduced one dimension at a time, from the
+    top down, by the standard column reduction. A cell whose column is reduced to zero starts a class; a cell whose column is
+    not kills the class started by the lowest face left in its column. Columns of cells known to start a class (they are the
+    lowest faces of a reduced column one dimension up) are skipped without reducing them ("clearing").
+
+    :param cubical: A cubical complex.
+    :type cubical: CubicalComplex
+    :param births: A dictionary mapping every dimension to the list of the births of its cells, in the order of cell_index.
+                   No cell may be born before its faces.
+    :type births: dict
+    :param prime: The prime to reduce modulo.
+    :type prime: int
+    :return: A dictionary mapping every dimension to the sorted list of its (birth, death) intervals, with death None for
+             the classes that never die.
+    :rtype: dict
+    '''
+    top = cubical.dimension()
+    order = {}
+    rank = {}
+    for dim in range(top+1):
+        order[dim] = sorted(range(len(births[dim])), key=lambda index: (births[dim][index], index))
+        rank[dim] = [0]*len(births[dim])
+        for (place, index) in enumerate(order[dim]):
+            rank[dim][index] = place
+
+    intervals = dict((dim, []) for dim in range(top+1))
+    # The cells of the dimension below that kill a class, i.e. the lowest faces of the reduced columns.
+    paired = set()
+    for dim in range(top, -1, -1):
+        killers = paired
+        paired = set()
+        starters = []
+        if dim == 0:
+            starters = [index for index in order[0]]
+        else:
+            (nrows, ncols, rows, cols, values) = cubical.boundary_matrix(dim)
+            columns = [{} for index in range(ncols)]
+            for (row, col, value) in zip(rows, cols, values):
+                columns[col][rank[dim-1][row]] = value % prime
+            # The reduced columns, by the rank of their lowest face.
+            pivots = {}
+            for index in order[dim]:
+                if index in killers:
+                    starters.append(index)
+                    continue
+                column = columns[index]
+                columns[index] = None
+                while column:
+                    low = max(column)
+                    other = pivots.get(low)
+                    if other is None:
+                        break
+                    factor = column[low] * pow(other[low], prime-2, prime) % prime
+                    for (row, value) in other.items():
+                        entry = (column.get(row, 0) - factor*value) % prime
+                        if entry:
+                            column[row] = entry
+                        else:
+                            column.pop(row, None)
+                    if memory.budget_kb is not None:
+                        memory.checkpoint("persistence")
+                if column:
+                    low = max(column)
+                    pivots[low] = column
+                    face = order[dim-1][low]
+                    paired.add(face)
+                    if births[dim-1][face] < births[dim][index]:
+                        intervals[dim-1].append((births[dim-1][face], births[dim][index]))
+                else:
+                    starters.append(index)
+            if tracing.enabled:
+                tracing.count("persistence pairs", len(pivots))
+            del columns, pivots
+        # The classes started in this dimension that nothing kills live on to k_max.
+        intervals[dim].extend((births[dim][index], None) for index in starters if index not in killers)
+    for dim in intervals:
+        intervals[dim].sort(key=lambda interval: (interval[0], interval[1] is None, interval[1]))
+    return intervals
+
+def betti_numbers(intervals, k):
+    '''
+    EXAMPLE:
+    >>> betti_numbers({0: [(2, None)], 1: [(2, 3), (2, 3), (3, None)]}, 2)
+    [1, 2]
+
+    :param intervals: The intervals of every dimension, as given by persistence.
+    :type intervals: dict
+    :param k: A value of k, at most k_max.
+    :type k: int
+    :return: The Betti numbers of D_{n,k}, by dimension.
+    :rtype: list
+    '''
+    return [inclusion_rank(intervals, dim, k, k) for dim in range(len(intervals))]
+
+def inclusion_rank(intervals, dim, k, l):
+    '''
+    EXAMPLE (a class born at k=2 that dies at k=3 is not in the image of the inclusion of D_{n,2} in D_{n,3}):
+    >>> intervals = {0: [(2, None)], 1: [(2, 3), (2, None), (3, None)]}
+    >>> inclusion_rank(intervals, 1, 2, 3), inclusion_rank(intervals, 1, 3, 3)
+    (1, 2)
+
+    :param intervals: The intervals of every dimension, as given by persistence.
+    :type intervals: dict
+    :param dim: A dimension.
+    :type dim: int
+    :param k: The smaller value of k.
+    :type k: int
+    :param l: The larger value of k, at most k_max.
+    :type l: int
+    :return: The rank of the map from the homology of D_{n,k} to that of D_{n,l} in dimension dim, induced by the inclusion.
+    :rtype: int
+    '''
+    return sum(1 for (birth, death) in intervals.get(dim, ()) if birth <= k and (death is None or death > l))
+
+def persistence_star(d, n, k_max, prime=PRIME):
+    '''
+    The persistent homology across k of D_{n,k} of the star with d arms (see generate_star_tree), or of the interval if d is
+    None (see generate_interval), for k up to k_max. The tree is subdivided as for k=2, which is enough for every k.
+    '''
+    if d is None:
+        import conf_n_k_I
+        subdivision = conf_n_k_I.minimal_subdivision(n, 2)
+        return persistence(conf_n_k_I.the_complex(n, k_max, subdivision), conf_n_k_I.generate_interval(n, subdivision)[0],
+                           prime)
+    import conf_n_k_Y
+    subdivision = conf_n_k_Y.minimal_subdivision(n, 2, d)
+    return persistence(conf_n_k_Y.the_complex(n, k_max, d, subdivision), conf_n_k_Y.generate_star_tree(d, n, subdivision)[0],
+                       prime)
@@ -0,0 +1,147 @@
+'''
+This code computes the stabilization maps D_{n,k}Y -> D_{n+1,k}Y, which add a robot at a leaf, and the maps they induce on
+homology, for studying how the homology of D_{n,k} changes with n.
+
+The complexes here subdivide every arm of the star into n-1 edges (see generate_star_tree), as Abrams does for k=2, rather
+than into the fewer edges the_complex uses by default for larger k. So the trees for n and n+1 robots differ. But the
+vertex at distance t from the center along arm j has the same coordinates in both, so the tree for n robots is the part of the
+tree for n+1 robots within distance n-1 of the center, and only the leaves of the bigger tree are new. Putting robot n (the new,
+last one) at the leaf of one arm, away from everything else, maps every cube of D_{n,k} to a cube of D_{n+1,k} with the same
+coordinates plus those of the leaf (see stabilized_cube). This is an inclusion of cubical complexes, so the chain map is a
+matrix with a single 1 in every column (see stabilization_matrix), and its image is a subcomplex isomorphic to D_{n,k}.
+
+The map on homology comes from a single reduction of the bigger complex, filtered with the image first and the rest second
+(see persistence.py): the classes born first and alive at the end are the image of the homology of D_{n,k}. For example, from
+this directory,
+
+    import stabilization
+    for (n, ranks) in stabilization.stabilization_sweep(3, 2, [2, 3, 4]):
+        print(n, ranks)
+
+prints, for every dimension, the Betti numbers of D_{n,2}Y and D_{n+1,2}Y and the rank of the map between them, for n = 2 and
+3, building each of the complexes once.
+'''
+from array import array
+
+import cubical_complex
+import persistence
+import tracing
+
+def stabilization_leaf(d, n, axis=0):
+    '''
+    EXAMPLE (the ends of two arms of the Y-graph for 3 robots, which are not in the Y-graph for 2 robots):
+    >>> stabilization_leaf(3, 2), stabilization_leaf(3, 2, axis=2)
+    ((2, 0, 0), (0, 0, 2))
+
+    :param d: The number of arms of the star.
+    :type d: int
+    :param n: The number of robots of the smaller complex.
+    :type n: int
+    :param axis: The coordinate along which the arm with the leaf lies (see generate_star_tree).
+    :type axis: int
+    :return: The coordinates of the leaf of that arm in the star for n+1 robots.
+    :rtype: tuple
+    '''
+    return tuple(n if coordinate == axis else 0 for coordinate in range(d))
+
+def stabilized_cube(cube, leaf):
+    '''
+    EXAMPLE:
+    >>> stabilized_cube(cubical_complex.Cube([[0, 1], [0], [0]]), (2, 0, 0))
+    [0,1] x [0,0] x [0,0] x [2,2] x [0,0] x [0,0]
+
+    :param cube: A cube of D_{n,k}.
+    :type cube: Cube
+    :param leaf: The coordinates of the leaf for the new robot (see stabilization_leaf).
+    :type leaf: tuple
+    :return: The cube of D_{n+1,k} with the same robots, and the new one at the leaf.
+    :rtype: Cube
+    '''
+    return cubical_complex.Cube(cube.tuple() + tuple((x, x) for x in leaf))
+
+@tracing.traced
+def stabilization_matrix(small, large, leaf, dim):
+    '''
+    The chain map from D_{n,k} to D_{n+1,k} in dimension dim, in the same form as CubicalComplex.boundary_matrix: its rows
+    and columns are in the orderings of large.cell_index(dim) and small.cell_index(dim), which are reused (and cached) as they
+    are, so no cell of either complex is listed again.
+
+    EXAMPLE:
+    >>> import conf_n_k_Y
+    >>> (small, large) = (conf_n_k_Y.the_complex(2, 2, subdivision=1), conf_n_k_Y.the_complex(3, 2, subdivision=2))
+    >>> (nrows, ncols, rows, cols, values) = stabilization_matrix(small, large, stabilization_leaf(3, 2), 1)
+    >>> nrows, ncols, len(set(rows)), sorted(set(values))
+    (360, 12, 12, [1])
+
+    :param small: D_{n,k}, as built by the_complex with subdivision n-1.
+    :type small: CubicalComplex
+    :param large: D_{n+1,k}, as built by the_complex with subdivision n.
+    :type large: CubicalComplex
+    :param leaf: The coordinates of the leaf for the new robot (see stabilization_leaf).
+    :type leaf: tuple
+    :param dim: The dimension.
+    :type dim: int
+    :return: A tuple (nrows, ncols, rows, cols, values) giving the shape of the matrix and, in three arrays of the same
+             length, the row, column and value of each of its nonzero entries.
+    :rtype: tuple
+    '''
+    cells = small.cell_index(dim)[0]
+    (large_cells, positions) = large.cell_index(dim)
+    rows = array('l', [positions[stabilized_cube(cube, leaf)] for cube in cells])
+    cols = array('l', range(len(cells)))
+    values = array('l', [1]*len(cells))
+    return (len(large_cells), len(cells), rows, cols, values)
+
+def stabilization_ranks(small, large, leaf, prime=persistence.PRIME):
+    '''
+    EXAMPLE (D_{2,2}Y is a circle, and it goes to one of the 13 independent circles of D_{3,2}Y):
+    >>> import conf_n_k_Y
+    >>> stabilization_ranks(conf_n_k_Y.the_complex(2, 2), conf_n_k_Y.the_complex(3, 2), stabilization_leaf(3, 2))
+    [(1, 1, 1), (1, 13, 1), (0, 0, 0), (0, 0, 0)]
+
+    :param small: D_{n,k}, as built by the_complex with subdivision n-1.
+    :type small: CubicalComplex
+    :param large: D_{n+1,k}, as built by the_complex with subdivision n.
+    :type large: CubicalComplex
+    :param leaf: The coordinates of the leaf for the new robot (see stabilization_leaf).
+    :type leaf: tuple
+    :param prime: The prime to compute the homology modulo (see persistence.py).
+    :type prime: int
+    :return: For every dimension of D_{n+1,k}, the Betti numbers of D_{n,k} and D_{n+1,k} and the rank of the stabilization
+             map between their homologies, which is the dimension of the stable part.
+    :rtype: list
+    '''
+    births = {}
+    for dim in range(large.dimension()+1):
+        births[dim] = [1]*len(large.cell_index(dim)[0])
+        if dim <= small.dimension():
+            for row in stabilization_matrix(small, large, leaf, dim)[2]:
+                births[dim][row] = 0
+    intervals = persistence.reduce_filtration(large, births, prime)
+    return [(persistence.inclusion_rank(intervals, dim, 0, 0), persistence.inclusion_rank(intervals, dim, 1, 1),
+             persistence.inclusion_rank(intervals, dim, 0, 1)) for dim in range(large.dimension()+1)]
+
+def stabilization_sweep(d, k, ns, axis=0, prime=persistence.PRIME):
+    '''
+    Compute the stabilization maps D_{n,k} -> D_{n+1,k} of the star with d arms for consecutive values of n, building every
+    complex once: D_{n+1,k} is the bigger complex of one map and the smaller complex of the next, and keeps its cell indices
+    in between.
+
+    :param ns: Consecutive numbers of robots, in increasing order.
+    :type ns: list
+    :return: A generator of pairs (n, ranks), for every n in ns but the last, where ranks is as returned by
+             stabilization_ranks for D_{n,k} -> D_{n+1,k}.
+    :rtype: generator
+    '''
+    import conf_n_k_Y
+    small = None
+    for (n, larger) in zip(ns, ns[1:]):
+        if larger != n + 1:
+            raise ValueError("The numbers of robots must be consecutive, but " + str(larger) + " follows " + str(n) + ".")
+        if small is None:
+            small = conf_n_k_Y.the_complex(n, k, d=d, subdivision=n-1)
+        large = conf_n_k_Y.the_complex(larger, k, d=d, subdivision=larger-1)
+        yield (n, stabilization_ranks(small, large, stabilization_leaf(d, n, axis), prime))
+        # Only the cell indices of the bigger complex are needed for the next map, not its cells.
+        large._release_caches(keep_indices=range(large.dimension()+1), keep_cells=False)
+        small = large
@@ -0,0 +1,208 @@
+'''
+This code records where the time goes when building the Abrams-discretized models and computing their cycles, so that we
+don't have to guess which stage dominates for a given (n, k).
+
+Tracing is off unless it is switched on, and costs (almost) nothing while it is off: traced functions only check a flag
+before calling straight through, and counters are only touched behind "if tracing.enabled:". Once it is on, it keeps
+- spans: the time spent in every call of the traced functions (see traced), kept as a timeline of events and as totals per
+  function, and
+- counters: e.g. how many configurations were scanned and accepted, or how many cubes were dropped as duplicates (see count).
+
+The timeline can be written as a Chrome trace file, which chrome://tracing or https://ui.perfetto.dev show as nested bars on a
+timeline. For example, from this directory,
+
+    import tracing, conf_n_k_Y
+    tracing.enable()
+    conf_n_k_Y.the_complex(3, 2).sorted_n_cycles(1)
+    tracing.write_chrome_trace("trace.json")
+    print(tracing.summary())
+'''
+import collections
+import functools
+import inspect
+import json
+import os
+import time
+
+# Whether tracing is on. Hot loops check this before counting anything.
+enabled = False
+
+_origin = 0.0
+_max_events = 0
+_events = []
+_dropped_events = 0
+_totals = collections.defaultdict(lambda: [0, 0.0])
+_counters = collections.Counter()
+
+def enable(max_events=1000000):
+    '''
+    Switch tracing on, and start a new trace.
+
+    :param max_events: How many spans to keep on the timeline. Spans after that still count towards the totals.
+    :type max_events: int
+    '''
+    global enabled, _max_events
+    reset()
+    _max_events = max_events
+    enabled = True
+
+def disable():
+    '''
+    Switch tracing off. What was recorded so far is kept.
+    '''
+    global enabled
+    enabled = False
+
+def reset():
+    global _origin, _dropped_events
+    _origin = time.time()
+    del _events[:]
+    _dropped_events = 0
+    _totals.clear()
+    _counters.clear()
+
+def _record(name, start, end, args=None):
+    global _dropped_events
+    total = _totals[name]
+    total[0] += 1
+    total[1] += end - start
+    if len(_events) < _max_events:
+        _events.append((name, start, end, args))
+    else:
+        _dropped_events += 1
+
+def count(name, amount=1):
+    '''
+    Add amount to a counter. Callers in hot loops should check enabled first.
+    '''
+    _counters[name] += amount
+
+class span(object):
+    '''
+    A context manager recording the time spent in a block as a span, e.g.
+
+        with tracing.span("the_complex"):
+            ...
+    '''
+    def __init__(self, name):
+        self._name = name
+        self._start = None
+
+    def __enter__(self):
+        if enabled:
+            self._start = time.time()
+        return self
+
+    def __exit__(self, *exception):
+        if self._start is not None:
+            _record(self._name, self._start, time.time())
+            self._start = None
+        return False
+
+def traced(function=None, name=None):
+    '''
+    A decorator recording every call of a function as a span named after the function (or name). For generator functions,
+    the span lasts from the first item to the last one, and only the time spent inside the generator counts towards the
+    totals (it is also given as "own_seconds" on the timeline).
+
+    EXAMPLE:
+    >>> @traced
+    ... def square(x):
+    ...     return x*x
+    >>> square(3); sorted(spans())
+    9
+    []
+    >>> enable(); square(3); sorted(spans()); disable()
+    9
+    ['square']
+    '''
+    if function is None:
+        return lambda function: traced(function, name)
+    label = name or function.__name__
+
+    if inspect.isgeneratorfunction(function):
+        @functools.wraps(function)
+        def generator_wrapper(*args, **kwargs):
+            if not enabled:
+                for item in function(*args, **kwargs):
+                    yield item
+                return
+            iterator = function(*args, **kwargs)
+            first = None
+            own = 0.0
+            while True:
+                start = time.time()
+                if first is None:
+                    first = start
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    own += time.time() - start
+                    break
+                own += time.time() - start
+                yield item
+            _record(label, first, first + own, {"own_seconds": own, "wall_seconds": time.time() - first})
+        return generator_wrapper
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        if not enabled:
+            return function(*args, **kwargs)
+        start = time.time()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            _record(label, start, time.time())
+    return wrapper
+
+def spans():
+    '''
+    :return: A dictionary mapping every span name to the pair (number of calls, total seconds).
+    :rtype: dict
+    '''
+    return dict((name, tuple(total)) for (name, total) in _totals.items())
+
+def counters():
+    '''
+    :return: A dictionary of the counters.
+    :rtype: dict
+    '''
+    return dict(_counters)
+
+def summary():
+    '''
+    :return: A table of the spans, slowest first, followed by the counters, for humans.
+    :rtype: str
+    '''
+    lines = ["%-24s %10s %12s" % ("span", "calls", "seconds")]
+    for name, (calls, seconds) in sorted(spans().items(), key=lambda item: -item[1][1]):
+        lines.append("%-24s %10d %12.4f" % (name, calls, seconds))
+    lines.extend("%-24s %10d" % (name, value) for (name, value) in sorted(_counters.items()))
+    if _dropped_events:
+        lines.append("(%d spans were left off the timeline)" % _dropped_events)
+    return "\n".join(lines)
+
+def chrome_trace():
+    '''
+    :return: The trace in the Chrome trace event format: a complete ("X") event for every span on the timeline, and the final
+             value of every counter as a counter ("C") event at the end.
+    :rtype: dict
+    '''
+    pid = os.getpid()
+    micros = lambda t: int((t - _origin)*1e6)
+    events = []
+    end = _origin
+    for (name, start, stop, args) in _events:
+        event = {"name": name, "ph": "X", "ts": micros(start), "dur": max(micros(stop) - micros(start), 0),
+                 "pid": pid, "tid": 0}
+        if args:
+            event["args"] = args
+        events.append(event)
+        end = max(end, stop)
+    for name, value in sorted(_counters.items()):
+        events.append({"name": name, "ph": "C", "ts": micros(end), "pid": pid, "args": {name: value}})
+    return {"traceEvents": events, "displayTimeUnit": "ms", "otherData": {"dropped_events": _dropped_events}}
+
+def write_chrome_trace(path):
+    with open(path, "w") as f:
+        json.dump(chrome_trace(), f)
@@ -0,0 +1,276 @@
+'''
+This code exports the cycle animations of StarGraph (see star_graph.py) as a single self-contained HTML file, so that they can
+be shared and watched in any web browser, without Python, Sage or Tkinter.
+
+The file embeds the layout of the star (see star_layout.py) and the keyframes of every cycle (see keyframes.py), with each
+keyframe packed into one small integer (see encode_keyframes). A small JavaScript player draws the star on a canvas and works
+out where the robots are at any moment exactly as keyframes.CycleTimeline does, so the animation looks the same as in
+StarGraph: the robots rest at each step, then move at a constant speed to the next one, passing through the center when they
+switch arms. The player can pause, step, scrub, change speed and switch between cycles.
+
+For example,
+
+    python html_export.py 3 4 2 --output D_4_2_Y.html
+
+writes every cycle of D_{4,2}Y into D_4_2_Y.html, using its bundle (see cycle_bundle.py) if there is one and computing the
+cycles otherwise.
+'''
+import argparse
+import json
+
+import cycle_bundle
+import keyframes
+import star_layout
+
+# These match StarGraph: robots move 5 pixels every 30 milliseconds, and rest for 0.6 seconds at each step.
+SPEED = 5 * 1000.0/30 # pixels per second
+PAUSE = 0.6 # seconds
+
+def encode_keyframes(compiled):
+    '''
+    Pack the keyframes of a cycle into a flat list of integers, one per robot per step (robot i at step s is at index
+    s*n + i). A keyframe (edge, fraction, via_center) is packed into ((edge+1)*2 + (fraction == 1.0))*2 + via_center, since
+    fractions are always 0.0 (at the center), 0.5 or 1.0.
+
+    EXAMPLE (n=3, one robot on its way from the end of the first edge of arm 0 to the vertex at distance 2 along arm 1,
+    through the center and back, while the others rest at the center and at the end of the first edge of arm 2):
+    >>> encode_keyframes(keyframes.CycleKeyframes([[(0, 1, 1), (-1, 0, 0), (2, 1, 1)], [(1, 2, 2), (-1, 0, 0), (2, 1, 1)]], 3))
+    [7, 0, 22, 19, 0, 22]
+
+    :param compiled: The keyframes of the cycle.
+    :type compiled: CycleKeyframes
+    :return: The packed keyframes.
+    :rtype: list
+    '''
+    return [((edge+1)*2 + (fraction == 1.0))*2 + via_center
+            for (edge, fraction, via_center) in (compiled.keyframe(step, i)
+                                                 for step in range(len(compiled)) for i in range(compiled.n))]
+
+def player_data(starNum, n, k, cycles, size=600.0, speed=SPEED, pause=PAUSE):
+    '''
+    :param cycles: The cycles to embed, each of which is a list of robot positions (see cycle_bundle.py).
+    :type cycles: iterable
+    :return: Everything the player needs, as a dictionary that can be written as JSON.
+    :rtype: dict
+    '''
+    layout = star_layout.StarLayout(starNum, n, size)
+    # Rounding the coordinates to a tenth of a pixel keeps the file small without visibly moving anything.
+    rounded = lambda point: [round(point[0], 1), round(point[1], 1)]
+    return {"starNum": starNum, "n": n, "k": k, "size": size, "speed": speed, "pause": pause,
+            "center": rounded(layout.center),
+            "arms": [[rounded(vertex) for vertex in arm] for arm in layout.arms],
+            "colors": star_layout.ROBOT_COLORS, "vertexRadius": star_layout.VERTEX_RADIUS,
+            "robotRadius": star_layout.ROBOT_RADIUS,
+            "cycles": [encode_keyframes(keyframes.CycleKeyframes(cycle, n)) for cycle in cycles]}
+
+_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>%(title)s</title>
+<style>
+body { font-family: sans-serif; text-align: center; }
+#controls > * { margin: 2px; vertical-align: middle; }
+#timeline { width: 300px; }
+</style>
+</head>
+<body>
+<h3>%(title)s</h3>
+<div id="controls">
+<button id="previous">Previous</button>
+<select id="cycle"></select>
+<button id="next">Next</button>
+<button id="play">Pause</button>
+<button id="step">Step</button>
+<input id="timeline" type="range" min="0" max="1" step="0.01" value="0">
+<select id="speed"><option>0.25</option><option>0.5</option><option selected>1</option><option>2</option><option>4</option><option>8</option></select>
+</div>
+<div id="label"></div>
+<canvas id="star"></canvas>
+<script>
+var DATA = %(data)s;
+(function () {
+    var n = DATA.n, center = DATA.center;
+    var canvas = document.getElementById("star"), context = canvas.getContext("2d");
+    canvas.width = canvas.height = DATA.size;
+
+    // The place (edge, fraction) of a keyframe, as in StarLayout.keyframe_point.
+    function vertex(arm, distance) { return distance === 0 ? center : DATA.arms[arm][distance-1]; }
+    function point(code) {
+        var edge = (code >> 2) - 1;
+        if (edge < 0) { return center; }
+        var fraction = (code >> 1) & 1 ? 1.0 : 0.5, edges = DATA.arms[0].length;
+        var arm = Math.floor(edge / edges), i = edge %% edges;
+        var p = vertex(arm, i), q = vertex(arm, i+1);
+        return [p[0] + fraction*(q[0]-p[0]), p[1] + fraction*(q[1]-p[1])];
+    }
+
+    // The timing of a cycle, as in keyframes.CycleTimeline.
+    function Timeline(codes) {
+        this.steps = codes.length / n;
+        this.places = []; this.paths = []; this.starts = [0];
+        for (var s = 0; s < this.steps; s++) {
+            var places = [];
+            for (var i = 0; i < n; i++) { places.push(point(codes[s*n+i])); }
+            this.places.push(places);
+        }
+        for (s = 0; s < this.steps; s++) {
+            var target = (s+1) %% this.steps, paths = [], longest = 0;
+            for (i = 0; i < n; i++) {
+                var end = this.places[target][i];
+                var path = codes[target*n+i] & 1 ? [this.places[s][i], center, end] : [this.places[s][i], end];
+                var lengths = [0];
+                for (var j = 1; j < path.length; j++) {
+                    lengths.push(lengths[j-1] + Math.hypot(path[j][0]-path[j-1][0], path[j][1]-path[j-1][1]));
+                }
+                longest = Math.max(longest, lengths[lengths.length-1]);
+                paths.push([path, lengths]);
+            }
+            this.paths.push(paths);
+            this.starts.push(this.starts[s] + DATA.pause + longest/DATA.speed);
+        }
+        this.duration = this.starts[this.steps];
+    }
+    Timeline.prototype.stepAt = function (t) {
+        var low = 0, high = this.steps - 1;
+        while (low < high) {
+            var middle = (low + high + 1) >> 1;
+            if (this.starts[middle] <= t) { low = middle; } else { high = middle - 1; }
+        }
+        return low;
+    };
+    Timeline.prototype.at = function (t) {
+        t = ((t %% this.duration) + this.duration) %% this.duration;
+        var step = this.stepAt(t), distance = (t - this.starts[step] - DATA.pause)*DATA.speed;
+        if (distance <= 0) { return [step, this.places[step]]; }
+        return [step, this.paths[step].map(function (pathLengths) {
+            var path = pathLengths[0], lengths = pathLengths[1];
+            for (var i = 1; i < path.length; i++) {
+                if (distance <= lengths[i]) {
+                    var segment = lengths[i] - lengths[i-1], u = segment > 0 ? (distance - lengths[i-1])/segment : 1;
+                    return [path[i-1][0] + u*(path[i][0]-path[i-1][0]), path[i-1][1] + u*(path[i][1]-path[i-1][1])];
+                }
+            }
+            return path[path.length-1];
+        })];
+    };
+
+    function circle(p, radius, color) {
+        context.beginPath(); context.arc(p[0], p[1], radius, 0, 2*Math.PI); context.fillStyle = color; context.fill();
+    }
+    function draw(points) {
+        context.fillStyle = "white"; context.fillRect(0, 0, canvas.width, canvas.height);
+        context.strokeStyle = "black"; context.beginPath();
+        DATA.arms.forEach(function (arm) {
+            context.moveTo(center[0], center[1]);
+            arm.forEach(function (v) { context.lineTo(v[0], v[1]); });
+        });
+        context.stroke();
+        circle(center, DATA.vertexRadius, "black");
+        DATA.arms.forEach(function (arm) { arm.forEach(function (v) { circle(v, DATA.vertexRadius, "black"); }); });
+        points.forEach(function (p, i) { circle(p, DATA.robotRadius, DATA.colors[i %% DATA.colors.length]); });
+    }
+
+    var cycleBox = document.getElementById("cycle"), slider = document.getElementById("timeline");
+    var label = document.getElementById("label"), playButton = document.getElementById("play");
+    var speedBox = document.getElementById("speed");
+    DATA.cycles.forEach(function (codes, c) {
+        var option = document.createElement("option"); option.value = c; option.text = "Cycle #" + (c+1);
+        cycleBox.appendChild(option);
+    });
+    var current = 0, timeline = null, playhead = 0, playing = true, last = null;
+
+    function render() {
+        var shown = timeline.at(playhead);
+        draw(shown[1]);
+        slider.value = playhead;
+        label.textContent = "Cycle #" + (current+1) + " of #" + DATA.cycles.length + ", position " + (shown[0]+1) +
+            " of " + timeline.steps;
+    }
+    function show(c) {
+        current = ((c %% DATA.cycles.length) + DATA.cycles.length) %% DATA.cycles.length;
+        cycleBox.value = current;
+        // Cycles are only compiled into timelines when they are shown.
+        timeline = new Timeline(DATA.cycles[current]);
+        slider.max = timeline.duration;
+        playhead = 0;
+        render();
+    }
+    function frame(now) {
+        if (playing && last !== null) { playhead = (playhead + (now - last)/1000*parseFloat(speedBox.value)) %% timeline.duration; }
+        last = now;
+        render();
+        if (playing) { window.requestAnimationFrame(frame); }
+    }
+
+    document.getElementById("previous").onclick = function () { show(current-1); };
+    document.getElementById("next").onclick = function () { show(current+1); };
+    cycleBox.onchange = function () { show(parseInt(cycleBox.value, 10)); };
+    document.getElementById("step").onclick = function () {
+        var step = timeline.stepAt(playhead %% timeline.duration);
+        playhead = timeline.starts[(step+1) %% timeline.steps];
+        render();
+    };
+    slider.oninput = function () { playhead = parseFloat(slider.value); render(); };
+    playButton.onclick = function () {
+        playing = !playing;
+        playButton.textContent = playing ? "Pause" : "Play";
+        last = null;
+        if (playing) { window.requestAnimationFrame(frame); }
+    };
+
+    if (DATA.cycles.length === 0) {
+        label.textContent = "This complex has no 1-cycles.";
+        return;
+    }
+    show(0);
+    window.requestAnimationFrame(frame);
+})();
+</script>
+</body>
+</html>
+"""
+
+def export_html(path, starNum, n, k, cycles, size=600.0):
+    '''
+    Write the player for the given cycles of D_{n,k} of the starNum-star to path.
+
+    :param cycles: The cycles, each of which is a list of robot positions (see cycle_bundle.py).
+    :type cycles: iterable
+    :param size: The width and height of the canvas, in pixels.
+    :type size: float
+    '''
+    title = str(starNum) + "-Star Graph with " + str(n) + " Robots (Non-" + str(k) + "-Equal)"
+    data = json.dumps(player_data(starNum, n, k, cycles, size), separators=(",", ":"))
+    # Keep the data from closing the script element early.
+    data = data.replace("</", "<\\/")
+    with open(path, "w") as f:
+        f.write(_TEMPLATE % {"title": title, "data": data})
+
+def export_complex(path, starNum, n, k, size=600.0, bundle_directory=None):
+    '''
+    Write the player for every cycle of D_{n,k} of the starNum-star to path, reading the cycles from their bundle (see
+    cycle_bundle.py) if there is one, and computing them otherwise.
+    '''
+    bundle = cycle_bundle.load_cycles(starNum, n, k, bundle_directory)
+    if bundle is None:
+        cycles = [cycle_bundle.decode_cycle(cycle, starNum, n) for cycle in cycle_bundle.iter_cycles(starNum, n, k)]
+        export_html(path, starNum, n, k, cycles, size)
+    else:
+        try:
+            export_html(path, starNum, n, k, bundle, size)
+        finally:
+            bundle.close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Export the cycle animations of star_graph.py as a self-contained HTML player.")
+    parser.add_argument("starNum", type=int, help="the number of arms of the star")
+    parser.add_argument("n", type=int, help="the number of robots")
+    parser.add_argument("k", type=int, nargs="?", default=2, help="the k of the non-k-equal configuration space")
+    parser.add_argument("--output", default=None, help="the HTML file to write (default: star<d>_n<n>_k<k>.html)")
+    parser.add_argument("--size", type=float, default=600.0, help="the width and height of the player, in pixels")
+    parser.add_argument("--bundles", default=None, help="the directory of the cycle bundles (see cycle_bundle.py)")
+    args = parser.parse_args()
+    output = args.output or "star%d_n%d_k%d.html" % (args.starNum, args.n, args.k)
+    export_complex(output, args.starNum, args.n, args.k, args.size, args.bundles)
+    print(output)
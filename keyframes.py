@@ -0,0 +1,196 @@
+'''
+This code compiles a sorted cycle, given as the robot positions at each of its steps (see cycle_bundle.py), into compact arrays
+of per-robot keyframes, once per cycle. The animation loops (see star_graph.py and render.py) then only index into these
+arrays, instead of decoding cube intervals on every frame.
+
+The edges of a d-star subdivided for n robots are numbered arm by arm, from the center outwards: edge arm*(n-1) + i joins the
+vertices at distances i and i+1 from the center along that arm. A keyframe places a robot on an edge, at a fractional position
+along it (0.0 at the end nearer the center, 0.5 at the midpoint, 1.0 at the outer end); the center itself is the edge
+CENTER_EDGE at 0.0. Each keyframe also records whether the robot has to pass through the center to get there from its previous
+keyframe, which is the case when it switches arms.
+
+A CycleTimeline then lays the keyframes of a cycle out in time, so that where every robot is at any moment of the animation can
+be worked out directly, without playing the cycle up to that moment.
+'''
+import bisect
+import math
+from array import array
+
+CENTER_EDGE = -1
+
+def position_to_keyframe(position, n):
+    '''
+    EXAMPLE (n=3, a robot at the vertex at distance 2 along arm 1, and a robot on the first edge of arm 0):
+    >>> position_to_keyframe((1, 2, 2), 3)
+    (3, 1.0)
+    >>> position_to_keyframe((0, 0, 1), 3)
+    (0, 0.5)
+
+    :param position: An (arm, start, end) robot position.
+    :type position: tuple
+    :param n: The number of robots.
+    :type n: int
+    :return: The (edge, fraction) place of the robot.
+    :rtype: tuple
+    '''
+    arm, start, end = position
+    if arm < 0:
+        return (CENTER_EDGE, 0.0)
+    return (arm*(n-1) + end-1, 1.0 if start == end else 0.5)
+
+class CycleKeyframes(object):
+    '''
+    The keyframes of one cycle. The keyframe of robot i at step s is stored at index s*n + i of the arrays edges (signed
+    16-bit edge ids), fractions (32-bit floats) and via_center (bytes, nonzero if the robot passes through the center on its
+    way from step s-1, where the step before the first one is the last one).
+    '''
+    def __init__(self, cycle, n):
+        '''
+        :param cycle: The robot positions at each step of the cycle.
+        :type cycle: list
+        :param n: The number of robots.
+        :type n: int
+        '''
+        self.n = n
+        self.steps = len(cycle)
+        self.edges = array('h')
+        self.fractions = array('f')
+        self.via_center = array('b')
+        for step, positions in enumerate(cycle):
+            previous = cycle[step-1]
+            for i, position in enumerate(positions):
+                edge, fraction = position_to_keyframe(position, n)
+                self.edges.append(edge)
+                self.fractions.append(fraction)
+                self.via_center.append(previous[i][0] >= 0 and position[0] >= 0 and previous[i][0] != position[0])
+
+    def __len__(self):
+        return self.steps
+
+    def keyframe(self, step, i):
+        '''
+        :return: The (edge, fraction, via_center) keyframe of robot i at the given step.
+        :rtype: tuple
+        '''
+        index = step*self.n + i
+        return (self.edges[index], self.fractions[index], self.via_center[index] != 0)
+
+def polyline(path):
+    '''
+    :param path: The coordinates of the points of a polyline.
+    :type path: list
+    :return: The (path, lengths) pair, where lengths[i] is the length of the polyline up to path[i].
+    :rtype: tuple
+    '''
+    lengths = [0.0]
+    for (x0, y0), (x1, y1) in zip(path, path[1:]):
+        lengths.append(lengths[-1] + math.hypot(x1-x0, y1-y0))
+    return (path, lengths)
+
+def along(path, lengths, distance):
+    '''
+    The point at a given distance along a polyline (see polyline), or its last point if the polyline is shorter than that.
+    '''
+    for i in range(1, len(path)):
+        if distance <= lengths[i]:
+            (x0, y0), (x1, y1) = path[i-1], path[i]
+            segment = lengths[i] - lengths[i-1]
+            t = (distance - lengths[i-1])/segment if segment > 0 else 1.0
+            return (x0 + t*(x1-x0), y0 + t*(y1-y0))
+    return path[-1]
+
+class CycleTimeline(object):
+    '''
+    The timing of the animation of one cycle. At each step the robots rest at their places for pause seconds, and then all
+    move at the same speed to their places at the next step, passing through the center when they switch arms; the next step
+    starts once the robot with the longest way to go has arrived. After the last step, the robots go back to the first one.
+
+    EXAMPLE (on a star with one edge per arm, of length 100 in the layout, one robot goes back and forth between the
+    middle and the end of the first arm while the other one stays put at the end of the second arm):
+    >>> class Layout(object):
+    ...     center = (0.0, 0.0)
+    ...     def keyframe_point(self, edge, fraction):
+    ...         return (100.0*(edge + fraction), 0.0)
+    >>> cycle = [[(0, 0, 1), (1, 1, 1)], [(0, 1, 1), (1, 1, 1)]]
+    >>> timeline = CycleTimeline(CycleKeyframes(cycle, 2), Layout(), speed=100.0, pause=1.0)
+    >>> timeline.duration
+    3.0
+    >>> timeline.step_start(1)
+    1.5
+    >>> timeline.at(0.5)
+    (0, [(50.0, 0.0), (200.0, 0.0)])
+    >>> timeline.at(1.25)
+    (0, [(75.0, 0.0), (200.0, 0.0)])
+    >>> timeline.at(5.75)
+    (1, [(75.0, 0.0), (200.0, 0.0)])
+    '''
+    def __init__(self, compiled, layout, speed, pause):
+        '''
+        :param compiled: The keyframes of the cycle.
+        :type compiled: CycleKeyframes
+        :param layout: The layout of the star (see star_layout.py).
+        :type layout: StarLayout
+        :param speed: How far robots move per second, in the units of the layout.
+        :type speed: float
+        :param pause: How long (in seconds) robots rest at each step.
+        :type pause: float
+        '''
+        self.speed = speed
+        self.pause = pause
+        self.steps = len(compiled)
+        # self.places[s][i] is the place of robot i at step s, and self.paths[s][i] is the (path, lengths) polyline it follows
+        # to its place at the next step (see polyline).
+        self.places = [[layout.keyframe_point(*compiled.keyframe(step, i)[:2]) for i in range(compiled.n)]
+                       for step in range(self.steps)]
+        self.paths = []
+        # self._starts[s] is the time step s starts at, and the last entry is the duration of the whole cycle.
+        self._starts = [0.0]
+        for step in range(self.steps):
+            target = (step+1) % self.steps
+            paths = []
+            for i, point in enumerate(self.places[step]):
+                end = self.places[target][i]
+                paths.append(polyline([point, layout.center, end] if compiled.keyframe(target, i)[2] else [point, end]))
+            self.paths.append(paths)
+            self._starts.append(self._starts[-1] + pause + max(lengths[-1] for (path, lengths) in paths)/speed)
+        self.duration = self._starts[-1]
+
+    def __len__(self):
+        return self.steps
+
+    def step_start(self, step):
+        '''
+        :return: The time (in seconds from the start of the cycle) at which the robots arrive at the given step.
+        :rtype: float
+        '''
+        return self._starts[step]
+
+    def step_at(self, t):
+        '''
+        :return: The step that is being shown (or left) at time t, which wraps around the duration of the cycle.
+        :rtype: int
+        '''
+        t %= self.duration
+        return min(bisect.bisect_right(self._starts, t) - 1, self.steps-1)
+
+    def at(self, t):
+        '''
+        :param t: A time in seconds from the start of the cycle, which wraps around the duration of the cycle.
+        :type t: float
+        :return: The (step, points) pair of the step being shown at time t and the coordinates of every robot at that time.
+        :rtype: tuple
+        '''
+        t %= self.duration
+        step = self.step_at(t)
+        moved = t - self._starts[step] - self.pause
+        if moved <= 0:
+            return (step, self.places[step])
+        return (step, self.moving(step, moved*self.speed))
+
+    def moving(self, step, distance):
+        '''
+        :return: The coordinates of every robot once it has moved the given distance from its place at the given step towards
+                 its place at the next step (where it stays once it gets there).
+        :rtype: list
+        '''
+        return [along(path, lengths, distance) for (path, lengths) in self.paths[step]]
@@ -0,0 +1,194 @@
+'''
+This code reads robot configurations streamed by another program (e.g. a motion planner) so that StarGraph (see
+star_graph.py) can show them live, on the same star as the cycles.
+
+The stream is newline-delimited: each record gives the places of all n robots, in the vertex labels of generate_tree (see
+homology/conf_n_k_Y.py). Records are either a JSON list, or labels separated by spaces or commas. A robot on an edge is given
+by the labels of the two ends of the edge, as a JSON pair or as two labels joined by a dash. For example, with n=3 these are
+the same record, with robot #0 at vertex 5, robot #1 at the center and robot #2 halfway between vertices 3 and 4:
+
+    [5, 2, [3, 4]]
+    5 2 3-4
+
+The stream is read by a background thread, which parses every record but only keeps the newest one. The animation takes it
+when it draws its next frame, so if records arrive faster than they can be shown, the stale ones are skipped ("coalesced")
+instead of piling up. The Tkinter side never waits for input.
+
+For example,
+
+    python live_stream.py 3 3 2 /tmp/planner.sock
+
+opens StarGraph on D_{3,2}Y and shows the configurations read from the Unix socket /tmp/planner.sock (a named pipe or a
+regular file work too, and "-" reads from the standard input).
+'''
+import argparse
+import json
+import os
+import socket
+import stat
+import sys
+import threading
+
+import cycle_bundle
+
+def vertex_position(label, n):
+    '''
+    The place of a vertex of the Y-graph, as numbered by generate_tree: vertices 0 to n-2 lie on arm 1 (from the outer end
+    inwards), n-1 is the center, n to 2n-2 lie on arm 0 and 2n-1 to 3n-3 on arm 2 (both from the center outwards). The arms
+    are the coordinates of the lookup of generate_tree, which are also the arms of decode_position (see cycle_bundle.py).
+
+    EXAMPLE (n=3):
+    >>> [vertex_position(label, 3) for label in range(7)]
+    [(1, 2, 2), (1, 1, 1), (-1, 0, 0), (0, 1, 1), (0, 2, 2), (2, 1, 1), (2, 2, 2)]
+
+    :param label: The label of a vertex.
+    :type label: int
+    :param n: The number of robots.
+    :type n: int
+    :return: The (arm, distance, distance) position of a robot at that vertex, or the center position.
+    :rtype: tuple
+    '''
+    if not 0 <= label <= 3*n-3:
+        raise ValueError("There is no vertex " + str(label) + " in the Y-graph for " + str(n) + " robots.")
+    if label < n-1:
+        return (1, n-1-label, n-1-label)
+    if label == n-1:
+        return cycle_bundle.CENTER
+    if label < 2*n-1:
+        return (0, label-n+1, label-n+1)
+    return (2, label-2*n+2, label-2*n+2)
+
+def edge_position(labels, n):
+    '''
+    EXAMPLE (n=3, the edge between the center and the first vertex of arm 2, and the last edge of arm 1):
+    >>> edge_position((2, 5), 3), edge_position((0, 1), 3)
+    ((2, 0, 1), (1, 1, 2))
+
+    :param labels: The labels of the two ends of an edge, in any order.
+    :type labels: tuple
+    :return: The (arm, start, end) position of a robot on that edge.
+    :rtype: tuple
+    '''
+    (arm0, d0, e0), (arm1, d1, e1) = [vertex_position(label, n) for label in labels]
+    arm = arm1 if arm0 < 0 else arm0
+    if abs(d0 - d1) != 1 or (arm0 != arm1 and min(arm0, arm1) >= 0):
+        raise ValueError("Vertices " + str(labels[0]) + " and " + str(labels[1]) + " are not joined by an edge.")
+    return (arm, min(d0, d1), max(d0, d1))
+
+def parse_record(line, n):
+    '''
+    EXAMPLE (n=3):
+    >>> parse_record("[5, 2, [3, 4]]", 3) == parse_record("5 2 3-4", 3) == ((2, 1, 1), (-1, 0, 0), (0, 1, 2))
+    True
+
+    :param line: A record of the stream (see above).
+    :type line: str
+    :param n: The number of robots.
+    :type n: int
+    :return: The (arm, start, end) positions of the robots (see cycle_bundle.py).
+    :rtype: tuple
+    '''
+    line = line.strip()
+    if line.startswith("["):
+        places = json.loads(line)
+    else:
+        places = [[int(label) for label in token.split("-")] if "-" in token else int(token)
+                  for token in line.replace(",", " ").split()]
+    if len(places) != n:
+        raise ValueError("Expected the places of " + str(n) + " robots, got " + str(len(places)) + ".")
+    return tuple(edge_position(place, n) if isinstance(place, list) else vertex_position(place, n) for place in places)
+
+class PositionStream(object):
+    '''
+    Reads the robot configurations of a stream in a background thread, keeping only the newest one.
+    '''
+    def __init__(self, source, n):
+        '''
+        :param source: The path of a Unix socket to connect to, or of a named pipe or file to read, or "-" for the standard
+                       input.
+        :type source: str
+        :param n: The number of robots.
+        :type n: int
+        '''
+        self._source = source
+        self._n = n
+        self._lock = threading.Lock()
+        self._latest = None
+        self._socket = None
+        self._thread = threading.Thread(target=self._read)
+        # Don't keep the visualization alive waiting for input once its window is closed.
+        self._thread.daemon = True
+
+        # The number of records received, of records that were replaced by a newer one before they were shown, and of
+        # records that could not be parsed.
+        self.received = 0
+        self.coalesced = 0
+        self.errors = 0
+        # True once the stream has ended, and the reason if it broke.
+        self.closed = False
+        self.error = None
+
+    def start(self):
+        self._thread.start()
+
+    def _open(self):
+        if self._source == "-":
+            return sys.stdin
+        if stat.S_ISSOCK(os.stat(self._source).st_mode):
+            self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self._socket.connect(self._source)
+            return self._socket.makefile("r")
+        # Opening a named pipe waits for a writer, which is why this happens in the thread.
+        return open(self._source, "r")
+
+    def _read(self):
+        try:
+            stream = self._open()
+            for line in iter(stream.readline, ""):
+                if not line.strip():
+                    continue
+                try:
+                    positions = parse_record(line, self._n)
+                except ValueError:
+                    self.errors += 1
+                    continue
+                with self._lock:
+                    if self._latest is not None:
+                        self.coalesced += 1
+                    self._latest = positions
+                    self.received += 1
+        except (IOError, OSError, socket.error) as e:
+            self.error = str(e)
+        self.closed = True
+
+    def latest(self):
+        '''
+        Take the newest configuration, without waiting.
+
+        :return: The positions of the robots in the newest record that was not taken yet, or None if there is none.
+        :rtype: tuple
+        '''
+        with self._lock:
+            positions, self._latest = self._latest, None
+        return positions
+
+    def close(self):
+        '''
+        Stop reading from a socket. (Reading from a pipe or file stops when the process exits.)
+        '''
+        if self._socket is not None:
+            try:
+                self._socket.shutdown(socket.SHUT_RDWR)
+            except socket.error:
+                pass
+            self._socket.close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Show robot configurations streamed from a pipe or Unix socket on StarGraph.")
+    parser.add_argument("starNum", type=int, help="the number of arms of the star")
+    parser.add_argument("n", type=int, help="the number of robots")
+    parser.add_argument("k", type=int, nargs="?", default=2, help="the k of the non-k-equal configuration space")
+    parser.add_argument("source", help="a Unix socket, named pipe or file to read records from, or - for the standard input")
+    args = parser.parse_args()
+    import star_graph
+    star_graph.StarGraph(args.starNum, args.n, args.k, stream=PositionStream(args.source, args.n))
@@ -0,0 +1,229 @@
+'''
+This code renders the cycle animations of StarGraph (see star_graph.py) without Tkinter or a display, so that animations for
+every cycle of every complex can be produced in batch, e.g. on a build server.
+
+Frames are drawn from cycle data (see cycle_bundle.py) into in-memory images with Pillow, following the same motion as
+StarGraph: at each step of a cycle the robots pause, then move at a constant speed to their next positions, passing through
+the center when they switch arms. Each cycle is written as an animated GIF or as a sequence of PNG frames.
+
+Rendering is parallel: the bundles of the requested (n, k) values are built in a process pool first (if they don't exist
+yet), and then every cycle of every complex is rendered as a separate job in the same pool. For example,
+
+    python render.py 3 --n 3 4 --k 2 3 --format gif --output animations
+
+writes one GIF per cycle of D_{3,2}Y, D_{3,3}Y, D_{4,2}Y and D_{4,3}Y into the directory animations.
+'''
+import argparse
+import math
+import multiprocessing
+import os
+
+import cycle_bundle
+import keyframes
+import star_layout
+
+try:
+    from PIL import Image, ImageColor, ImageDraw
+except ImportError:
+    Image = ImageColor = ImageDraw = None
+
+# These mirror the Tkinter animation: robots move _SPEED pixels every 30 milliseconds, and pause for 0.6 seconds at each step.
+FRAME_DURATION = 30 # milliseconds
+SPEED = 5 # pixels per frame
+PAUSE_FRAMES = 20
+
+# Frames are drawn in palette mode with a fixed palette, so that encoding them doesn't need to quantize every frame.
+_COLORS = ["white", "black"] + star_layout.ROBOT_COLORS
+
+def cycle_frames(layout, cycle, speed=SPEED, pause_frames=PAUSE_FRAMES):
+    '''
+    Generate the frames of the animation of one cycle. The animation ends where it starts, so it can be looped.
+
+    :param layout: The layout of the star.
+    :type layout: StarLayout
+    :param cycle: The robot positions at each step of the cycle (see cycle_bundle.py).
+    :type cycle: list
+    :param speed: How many pixels robots move per frame.
+    :type speed: float
+    :param pause_frames: How many frames robots pause for at each step.
+    :type pause_frames: int
+    :return: A generator of (step, points) pairs, where points is the list of the coordinates of each robot.
+    :rtype: generator
+    '''
+    # The timeline counts time in frames here; only its paths are needed, since frames are drawn step by step.
+    timeline = keyframes.CycleTimeline(keyframes.CycleKeyframes(cycle, len(cycle[0])), layout, speed, pause_frames)
+    for step in range(len(timeline)):
+        for i in range(pause_frames):
+            yield (step, timeline.places[step])
+        count = int(math.ceil(max(lengths[-1] for (path, lengths) in timeline.paths[step])/speed))
+        for frame in range(1, count+1):
+            yield (step, timeline.moving(step, frame*speed))
+
+def render_frame(layout, points, caption=None):
+    '''
+    Draw one frame.
+
+    :param layout: The layout of the star.
+    :type layout: StarLayout
+    :param points: The coordinates of each robot.
+    :type points: list
+    :param caption: Text to write in the top-left corner of the frame.
+    :type caption: str
+    :return: The frame.
+    :rtype: PIL.Image.Image
+    '''
+    if Image is None:
+        raise ImportError("Rendering without Tkinter requires Pillow (pip install Pillow).")
+    size = int(layout.frame_size)
+    image = Image.new("P", (size, size), 0)
+    image.putpalette([u for color in _COLORS for u in ImageColor.getrgb(color)])
+    draw = ImageDraw.Draw(image)
+
+    def circle(point, radius, color):
+        x, y = point
+        draw.ellipse((x-radius, y-radius, x+radius, y+radius), fill=_COLORS.index(color))
+
+    for (start, end) in layout.edges():
+        draw.line(start + end, fill=_COLORS.index("black"))
+    circle(layout.center, star_layout.VERTEX_RADIUS, "black")
+    for arm in layout.arms:
+        for vertex in arm:
+            circle(vertex, star_layout.VERTEX_RADIUS, "black")
+    for i, point in enumerate(points):
+        circle(point, star_layout.ROBOT_RADIUS, star_layout.ROBOT_COLORS[i % len(star_layout.ROBOT_COLORS)])
+    if caption is not None:
+        draw.text((5, 5), caption, fill=_COLORS.index("black"))
+    return image
+
+def render_thumbnail(layout, cycle):
+    '''
+    Draw a still summary of a cycle: the star, with the route of each robot traced in its color.
+
+    :param layout: The layout of the star, usually with a small frame_size.
+    :type layout: StarLayout
+    :param cycle: The robot positions at each step of the cycle (see cycle_bundle.py).
+    :type cycle: list
+    :return: The thumbnail, in RGB mode so that it can be handed to ImageTk.
+    :rtype: PIL.Image.Image
+    '''
+    image = render_frame(layout, [])
+    draw = ImageDraw.Draw(image)
+    compiled = keyframes.CycleKeyframes(cycle, len(cycle[0]))
+    for i in range(compiled.n):
+        color = _COLORS.index(star_layout.ROBOT_COLORS[i % len(star_layout.ROBOT_COLORS)])
+        route = []
+        for step in range(len(compiled)+1):
+            edge, fraction, via_center = compiled.keyframe(step % len(compiled), i)
+            if via_center:
+                route.append(layout.center)
+            route.append(layout.keyframe_point(edge, fraction))
+        if len(route) > 1:
+            draw.line([u for point in route for u in point], fill=color, width=2)
+        x, y = route[0]
+        r = star_layout.ROBOT_RADIUS
+        draw.ellipse((x-r, y-r, x+r, y+r), fill=color)
+    return image.convert("RGB")
+
+def render_cycle(layout, cycle, title=""):
+    '''
+    :return: The list of frames animating one cycle.
+    :rtype: list
+    '''
+    return [render_frame(layout, points, title + "Position " + str(step+1) + " of " + str(len(cycle)))
+            for (step, points) in cycle_frames(layout, cycle)]
+
+def animation_path(directory, starNum, n, k, c, fmt):
+    '''
+    :return: The file (for GIFs) or directory (for PNG frames) that the animation of cycle c of D_{n,k} is written to.
+    :rtype: str
+    '''
+    name = "star%d_n%d_k%d_cycle%03d" % (starNum, n, k, c+1)
+    return os.path.join(directory, name + ".gif" if fmt == "gif" else name)
+
+def export_cycle(starNum, n, k, c, directory, fmt="gif", size=600.0, bundle_directory=None):
+    '''
+    Render cycle c of the bundle of D_{n,k} of the starNum-star, and write it to directory.
+
+    :param fmt: Either "gif" for an animated GIF, or "png" for a directory of numbered PNG frames.
+    :type fmt: str
+    :return: The path that was written (see animation_path).
+    :rtype: str
+    '''
+    bundle = cycle_bundle.load_cycles(starNum, n, k, bundle_directory)
+    try:
+        cycle = bundle[c]
+    finally:
+        bundle.close()
+    title = "Cycle #" + str(c+1) + " of #" + str(len(bundle)) + "\n"
+    frames = render_cycle(star_layout.StarLayout(starNum, n, size), cycle, title)
+
+    path = animation_path(directory, starNum, n, k, c, fmt)
+    if fmt == "gif":
+        # The frames already share a small palette, so skip Pillow's (slow) palette optimization.
+        frames[0].save(path, save_all=True, append_images=frames[1:], duration=FRAME_DURATION, loop=0, optimize=False)
+    else:
+        if not os.path.isdir(path):
+            os.makedirs(path)
+        for i, frame in enumerate(frames):
+            frame.save(os.path.join(path, "frame%05d.png" % i))
+    return path
+
+# Pool.map only passes a single argument, so these unpack a tuple of arguments.
+def _build_bundle(args):
+    return cycle_bundle.build_bundle(*args)
+
+def _export_cycle(args):
+    return export_cycle(*args)
+
+def export_animations(starNum, ns, ks, directory, fmt="gif", size=600.0, processes=None, bundle_directory=None):
+    '''
+    Render every cycle of D_{n,k} of the starNum-star, for every n in ns and k in ks (with k <= n), in a process pool.
+
+    :param ns: The numbers of robots.
+    :type ns: list
+    :param ks: The values of k.
+    :type ks: list
+    :param directory: The directory the animations are written to.
+    :type directory: str
+    :param processes: The number of worker processes. Defaults to the number of CPUs.
+    :type processes: int
+    :return: The list of paths that were written.
+    :rtype: list
+    '''
+    if Image is None:
+        raise ImportError("Rendering without Tkinter requires Pillow (pip install Pillow).")
+    if not os.path.isdir(directory):
+        os.makedirs(directory)
+    grid = [(n, k) for n in ns for k in ks if k <= n]
+    pool = multiprocessing.Pool(processes)
+    try:
+        # Build the missing bundles first, so every render job can cheaply load its cycle from a memory map.
+        missing = [(starNum, n, k, bundle_directory) for (n, k) in grid
+                   if not os.path.exists(cycle_bundle.bundle_path(starNum, n, k, bundle_directory))]
+        pool.map(_build_bundle, missing)
+
+        jobs = []
+        for (n, k) in grid:
+            bundle = cycle_bundle.load_cycles(starNum, n, k, bundle_directory)
+            jobs.extend((starNum, n, k, c, directory, fmt, size, bundle_directory) for c in range(len(bundle)))
+            bundle.close()
+        paths = pool.map(_export_cycle, jobs)
+    finally:
+        pool.close()
+        pool.join()
+    return paths
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Render the cycle animations of star_graph.py without a display.")
+    parser.add_argument("starNum", type=int, help="the number of arms of the star")
+    parser.add_argument("--n", type=int, nargs="+", required=True, help="the numbers of robots")
+    parser.add_argument("--k", type=int, nargs="+", default=[2], help="the values of k of the non-k-equal configuration spaces")
+    parser.add_argument("--format", choices=["gif", "png"], default="gif", help="animated GIFs, or directories of PNG frames")
+    parser.add_argument("--output", default="animations", help="the directory to write the animations to")
+    parser.add_argument("--size", type=float, default=600.0, help="the width and height of the frames, in pixels")
+    parser.add_argument("--processes", type=int, default=None, help="the number of worker processes (default: one per CPU)")
+    parser.add_argument("--bundles", default=None, help="the directory of the cycle bundles (see cycle_bundle.py)")
+    args = parser.parse_args()
+    for path in export_animations(args.starNum, args.n, args.k, args.output, args.format, args.size,
+                                  args.processes, args.bundles):
+        print(path)
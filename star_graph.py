@@ -26,15 +26,38 @@ import math
 import random
 import time
 import Tkinter as tk
-from homology.conf_n_k_Y import the_complex as Y_COMPLEX
-# from homology.conf_n_k_I import the_complex as I_COMPLEX
+import cycle_bundle
+import cycle_worker
+import frame_stats
+import keyframes
+import render
+import star_layout
+try:
+    from PIL import ImageTk
+except ImportError:
+    ImageTk = None
 
 # We need sine and cosine functions to calculate the movement angle of robots moving along the graph.
 sin = lambda degs: math.sin(math.radians(degs))
 cos = lambda degs: math.cos(math.radians(degs))
 
 class StarGraph(object):
-    def __init__(self, starNum, n, k=2):
+    # How often (in milliseconds) we check whether the background worker has finished more cycles.
+    _POLL_INTERVAL = 100
+    # How often (in milliseconds) the robots are moved, how long (in seconds) they rest at each position of a cycle, and how
+    # fast (in pixels per second) they move between positions at normal speed.
+    _FRAME_INTERVAL = 30
+    _STEP_PAUSE = 0.6
+    _SPEED = 5 * 1000.0/30
+    # The playback speeds offered, as multiples of normal speed.
+    _PLAYBACK_SPEEDS = ("0.25", "0.5", "1", "2", "4", "8")
+    # How often (in seconds) the frame-time overlay is refreshed.
+    _HUD_INTERVAL = 0.5
+    # The longest (in seconds) robots take to reach a configuration received from a live stream: they move at normal speed
+    # if they can get there in time, and faster otherwise.
+    _LIVE_LATENCY = 0.25
+
+    def __init__(self, starNum, n, k=2, hud=False, frame_hooks=(), stream=None):
         '''
         :param starNum: The number of "arms" a given star has (see above description). If starNum = d then we call our graph a d-star.
         :type starNum: int
@@ -42,6 +65,13 @@ class StarGraph(object):
         :type n: int
         :param k: The integer k for the non-k-equal configuration space. The default is 2 (no points can cross).
         :type k: int
+        :param hud: Whether to show the frame-time overlay (FPS, time per phase of a frame and dropped frames) from the start.
+                    It can also be toggled with the F1 key.
+        :type hud: bool
+        :param frame_hooks: Functions called with the timing record of every frame (see frame_stats.FrameProfiler.add_hook).
+        :type frame_hooks: list
+        :param stream: If given, show the robot configurations read from this stream as they arrive, instead of the cycles.
+        :type stream: live_stream.PositionStream
         '''
 
         # Make sure the numbers are not wonky.
@@ -50,28 +80,68 @@ class StarGraph(object):
         if k > n:       raise ValueError("The value k can only be at most as large as the value n.")
 
         self._FRAME_SIZE = 600.0 # Change this to suit the screen you are using.
-        self._CENTER_POINT = self._FRAME_SIZE/2
-        self._OFFSET_RADIUS = self._FRAME_SIZE/2 - 10
 
         # These keep track of which cycles is currently being displayed, and which position in the cycle the robots are at.
         self.current_cycle = 0
         self.current_position = 0
+        # The keyframes and timeline of the cycle on screen (see keyframes.py), compiled when it is shown.
+        self._keyframes = None
+        self._timeline = None
+        # Where the animation is in the timeline (in seconds), how fast it plays, and when that was last worked out.
+        self._playhead = 0.0
+        self._speed = 1.0
+        self._playing = True
+        self._last_frame = None
+        # The value the timeline slider was last set to by the animation itself, rather than by the user.
+        self._slider_value = None
+
+        # Frames are only timed if something wants the timings: the overlay, a hook, or the debug log of frame_stats.
+        self._profiler = None
+        if hud or frame_hooks or frame_stats.logger.isEnabledFor(frame_stats.logging.DEBUG):
+            self._profiler = frame_stats.FrameProfiler()
+            for hook in frame_hooks:
+                self._profiler.add_hook(hook)
+        self._hud = None
+        self._hud_updated = 0.0
 
         self._edges = [[] for i in range(starNum)]
-        cubical_complex = Y_COMPLEX(n,k) if starNum == 3 else I_COMPLEX(n,k)
 
-        # TODO: Currently, when calling cubical_complex.sorted_n_cycles(n), n has to be manually changed to get the desired
-        #       n-cycles. Perhaps there a should be a neater way to choose n, maybe based on the largest homology.
-        self._cycles = cubical_complex.sorted_n_cycles(1)
-        assert(len(self._cycles) > 0)
+        # In live mode, the (path, lengths) polylines the robots follow to the positions they are heading for (see
+        # keyframes.polyline), when they set off and how fast they move.
+        self._stream = stream
+        self._live_paths = None
+        self._live_departure = 0.0
+        self._live_speed = self._SPEED
+
+        # Each cycle is a list of steps, and each step gives the (arm, start, end) position of every robot (see cycle_bundle.py).
+        # Load the cycles from a precomputed bundle if there is one. Otherwise they are computed in a background process (see
+        # cycle_worker.py), which is started before Tkinter so that the window opens right away, and cycles are added to
+        # self._cycles as they arrive.
+        self._worker = None
+        self._cycles = cycle_bundle.load_cycles(starNum, n, k) if stream is None else []
+        if stream is not None:
+            stream.start()
+        elif self._cycles is None:
+            self._cycles = []
+            self._worker = cycle_worker.CycleWorker(starNum, n, k)
+            self._worker.start()
+        else:
+            assert(len(self._cycles) > 0)
 
         # Helper setup methods
         self._tk_setup(starNum, n, k)
         self._init_points(starNum, n, k)
-        self._init_robots(starNum, n, k)
-
-        # Animate with Tkinter
-        self._next_position(starNum, n, k)
+        if hud:
+            self._toggle_hud()
+
+        # Animate with Tkinter, as soon as the first cycle is available.
+        if self._stream is not None:
+            self._init_robots(starNum, n, k)
+            self._scheduler.start()
+        elif self._worker is None:
+            self._start_animation(starNum, n, k)
+        else:
+            self._poll_worker(starNum, n, k)
         self._root.mainloop()
 
     def _tk_setup(self, starNum, n, k):
@@ -81,118 +151,466 @@ class StarGraph(object):
         self._root = tk.Tk()
         self._root.title(str(starNum) + "-Star Graph with " + str(n) + " Robots " + "(Non-" + str(k) + "-Equal)")
         self.canvas = tk.Canvas(self._root, bg="white", height=self._FRAME_SIZE, width=self._FRAME_SIZE)
-        next_cycle_button = tk.Button(self._root, text="Next", command=lambda: self._next_cycle_callback(starNum, n, k))
-        next_cycle_button.pack()
-        self.cycle_label = tk.Label(self._root, text="Cycle #"+str(self.current_cycle+1) + " of #"+str(len(self._cycles)) 
-                                    + "\nPosition " + str(self.current_position+1) + " of " + str(len(self._cycles[self.current_cycle])))
+        self._root.protocol("WM_DELETE_WINDOW", self._close)
+
+        # Cycle navigation: step through the cycles, jump to any of them by number, or pick one from the thumbnail browser.
+        controls = tk.Frame(self._root)
+        controls.pack()
+        self.previous_cycle_button = tk.Button(controls, text="Previous",
+                                               command=lambda: self._show_cycle(starNum, n, k, self.current_cycle-1))
+        self.previous_cycle_button.pack(side=tk.LEFT)
+        self.next_cycle_button = tk.Button(controls, text="Next", command=lambda: self._next_cycle_callback(starNum, n, k))
+        self.next_cycle_button.pack(side=tk.LEFT)
+        self.cycle_entry = tk.Entry(controls, width=6)
+        self.cycle_entry.bind("<Return>", lambda event: self._jump_callback(starNum, n, k))
+        self.cycle_entry.pack(side=tk.LEFT)
+        tk.Button(controls, text="Go", command=lambda: self._jump_callback(starNum, n, k)).pack(side=tk.LEFT)
+        tk.Button(controls, text="Browse...", command=lambda: self._browse_callback(starNum, n, k)).pack(side=tk.LEFT)
+        self._browser = None
+
+        self.cycle_label = tk.Label(self._root)
         self.cycle_label.pack()
 
+        # Playback: pause, jump to a position of the cycle, drag the slider to any time in it, or change the speed.
+        playback = tk.Frame(self._root)
+        playback.pack()
+        self.play_button = tk.Button(playback, text="Pause", width=5, command=self._play_callback)
+        self.play_button.pack(side=tk.LEFT)
+        tk.Label(playback, text="Position").pack(side=tk.LEFT)
+        self.position_box = tk.Spinbox(playback, from_=1, to=1, width=5, command=self._position_callback)
+        self.position_box.bind("<Return>", lambda event: self._position_callback())
+        self.position_box.pack(side=tk.LEFT)
+        self.timeline_slider = tk.Scale(playback, from_=0, to=1, resolution=0.01, orient=tk.HORIZONTAL, length=300,
+                                        showvalue=0, command=self._scrub_callback)
+        self.timeline_slider.pack(side=tk.LEFT)
+        tk.Label(playback, text="Speed").pack(side=tk.LEFT)
+        self._speed_variable = tk.StringVar(self._root, "1")
+        self.speed_box = tk.Spinbox(playback, values=self._PLAYBACK_SPEEDS, textvariable=self._speed_variable, width=5,
+                                    command=self._speed_callback)
+        self.speed_box.pack(side=tk.LEFT)
+
+        self.canvas.pack()
+        self._root.bind("<F1>", lambda event: self._toggle_hud())
+        if self._stream is not None:
+            # There are no cycles to navigate or play back in live mode.
+            for widget in (self.previous_cycle_button, self.next_cycle_button, self.cycle_entry, self.play_button,
+                           self.position_box, self.timeline_slider, self.speed_box):
+                widget['state'] = tk.DISABLED
+        self._update_controls()
+        tick = self._next_frame if self._stream is None else lambda: self._next_live_frame(n)
+        self._scheduler = AnimationScheduler(self._root, tick, self._FRAME_INTERVAL)
+
+    def _update_controls(self):
+        '''
+        Refresh the cycle label, and only allow moving on to the next cycle if there is one (a cycle that is still being
+        computed doesn't count). If computing the cycles failed, the label says so under the cycles that did arrive.
+        '''
+        if self._stream is not None:
+            text = ("Live: " + str(self._stream.received) + " configurations received, " + str(self._stream.coalesced)
+                    + " skipped, " + str(self._stream.errors) + " unreadable" + ("\nThe stream has ended." if self._stream.closed else ""))
+            # This is called on every frame in live mode, so only touch the label when the text changes.
+            if self.cycle_label['text'] != text:
+                self.cycle_label['text'] = text
+            return
+        if self._keyframes is None:
+            self.cycle_label['text'] = "Computing cycles..."
+        else:
+            total = str(len(self._cycles)) + ("+" if self._worker is not None and not self._worker.done else "")
+            self.cycle_label['text'] = ("Cycle #"+str(self.current_cycle+1) + " of #"+total
+                                        + "\nPosition " + str(self.current_position+1) + " of " + str(len(self._keyframes)))
+            self.position_box.delete(0, tk.END)
+            self.position_box.insert(0, str(self.current_position+1))
+        if self._worker is not None and self._worker.error is not None:
+            failure = "Computing the cycles failed:\n" + self._worker.error.strip().splitlines()[-1]
+            self.cycle_label['text'] = failure if self._keyframes is None else self.cycle_label['text'] + "\n" + failure
+        waiting = self._worker is not None and not self._worker.done and self.current_cycle >= len(self._cycles)-1
+        self.next_cycle_button['state'] = tk.DISABLED if waiting or len(self._cycles) < 2 else tk.NORMAL
+        self.previous_cycle_button['state'] = tk.DISABLED if len(self._cycles) < 2 else tk.NORMAL
+
+    def _poll_worker(self, starNum, n, k):
+        '''
+        Add the cycles the background worker has finished since the last call, start the animation once the first one is in,
+        and keep polling until the worker is done.
+        '''
+        started = len(self._cycles) > 0
+        self._cycles.extend(self._worker.poll())
+        # Even if the worker failed, the cycles it sent before that are shown (and the failure is reported by
+        # _update_controls).
+        if not started and len(self._cycles) > 0:
+            self._start_animation(starNum, n, k)
+        self._update_controls()
+        if self._worker.done:
+            if len(self._cycles) == 0 and self._worker.error is None:
+                self.cycle_label['text'] = "This complex has no 1-cycles."
+        else:
+            self._root.after(self._POLL_INTERVAL, lambda: self._poll_worker(starNum, n, k))
+
+    def _start_animation(self, starNum, n, k):
+        '''
+        Put the robots at the start of the current cycle and start animating.
+        '''
+        self._init_robots(starNum, n, k)
+        self._show_cycle(starNum, n, k, self.current_cycle)
+
+    def _close(self):
+        '''
+        Called when the window is closed: stop computing cycles nobody is going to look at.
+        '''
+        if self._worker is not None:
+            self._worker.stop()
+        if self._stream is not None:
+            self._stream.close()
+        self._scheduler.stop()
+        self._root.destroy()
+
+    def _show_cycle(self, starNum, n, k, c):
+        '''
+        Show cycle c (modulo the number of cycles) from its start, moving the existing robots there.
+        '''
+        self.current_cycle = c % len(self._cycles)
+        self._keyframes = keyframes.CycleKeyframes(self._cycles[self.current_cycle], n)
+        self._timeline = keyframes.CycleTimeline(self._keyframes, self.layout, self._SPEED, self._STEP_PAUSE)
+        self.position_box.config(to=len(self._timeline))
+        self.timeline_slider.config(to=self._timeline.duration)
+        self.current_position = None
+        self._seek(0.0)
+
+    def _seek(self, t):
+        '''
+        Jump to time t (in seconds) of the cycle on screen, and carry on playing from there if the animation is playing.
+        The robots are placed straight from the timeline, so this takes the same time wherever t is.
+        '''
+        self._playhead = t % self._timeline.duration
+        self._draw_robots()
+        if self._playing:
+            self._last_frame = time.time()
+            self._scheduler.start()
+
+    def _play_callback(self):
+        '''
+        A callback method called when the user clicks the "Pause"/"Play" button.
+        '''
+        self._playing = not self._playing
+        self.play_button['text'] = "Pause" if self._playing else "Play"
+        if self._playing:
+            self._seek(self._playhead)
+        else:
+            self._scheduler.stop()
+
+    def _position_callback(self):
+        '''
+        A callback method called when the user picks a position of the cycle: jump to when the robots arrive there.
+        '''
+        try:
+            position = int(self.position_box.get()) - 1
+        except ValueError:
+            position = -1
+        if self._timeline is None or not 0 <= position < len(self._timeline):
+            self._root.bell()
+            return
+        self._seek(self._timeline.step_start(position))
+
+    def _scrub_callback(self, value):
+        '''
+        A callback method called when the timeline slider changes. Tkinter also calls this when the animation itself moves
+        the slider, which is told apart by the value.
+        '''
+        value = float(value)
+        if self._timeline is None or self._slider_value is not None and abs(value - self._slider_value) < 0.005:
+            return
+        self._seek(value)
+
+    def _speed_callback(self):
+        '''
+        A callback method called when the user changes the playback speed. Only how fast the playhead moves from now on
+        changes, so the robots carry on from where they are.
+        '''
+        if self._timeline is not None:
+            self._next_frame()
+        self._speed = float(self._speed_variable.get())
+
+    def _jump_callback(self, starNum, n, k):
+        '''
+        A callback method called when the user asks to jump to the cycle whose number is in the entry box.
+        '''
+        try:
+            c = int(self.cycle_entry.get()) - 1
+        except ValueError:
+            c = -1
+        if not 0 <= c < len(self._cycles):
+            self._root.bell()
+            return
+        self._show_cycle(starNum, n, k, c)
+
+    def _browse_callback(self, starNum, n, k):
+        '''
+        A callback method called when the user clicks the "Browse..." button: open the thumbnail browser, or bring it back up.
+        '''
+        if self._browser is None or not self._browser.is_open():
+            self._browser = CycleBrowser(self._root, self._cycles, starNum, n, lambda c: self._show_cycle(starNum, n, k, c),
+                                         self.current_cycle // CycleBrowser.PAGE_SIZE)
+        else:
+            self._browser.lift()
+
     def _init_points(self, starNum, n, k):
         '''
         Set up the the center vertex build edges from it to outer vertices.
         '''
-        self.center = Vertex(self, self._CENTER_POINT, self._CENTER_POINT)
-        num_edges = n - 1
-        for i in range(num_edges):
-            for j in range(starNum):
-                angle = 360.0/starNum * (j+1)
-                if i == 0:
-                    start = self.center
-                else:
-                    current = self._edges[j]
-                    start = current[len(current)-1].end
-                end = Vertex(self, start.x+((self._OFFSET_RADIUS/num_edges)*sin(angle)), (start.y+(self._OFFSET_RADIUS/num_edges)*cos(angle)))
+        self.layout = star_layout.StarLayout(starNum, n, self._FRAME_SIZE)
+        self.center = Vertex(self, *self.layout.center)
+        for j in range(starNum):
+            start = self.center
+            for (x, y) in self.layout.arms[j]:
+                end = Vertex(self, x, y)
                 edge = Edge(self, start, end)
                 self._edges[j].append(edge)
+                start = end
 
     def _init_robots(self, starNum, n, k):
         '''
-        Build the robots and put them at the start position.
+        Build the robots and put them at the start position. The robots (and their canvas items) are only created once, and
+        are reused for every cycle (see _show_cycle).
         '''
-        self.robots = []
-        for i in range(n):
-            point = self._get_point_for_robot(starNum, n, k, i)
-            robot = Robot(self, point.x, point.y, i)
-            if point != self.center:
-                robot.centered = False
-            self.robots.append(robot)
-        self.canvas.pack()
-
-    def _get_point_for_robot(self, starNum, n, k, i):
-        '''
-        At any given moment, get the point where Robot i is meant to be.
-        '''
-        dimension = len(self._cycles[0][0][1].tuple()) # TODO: is there a more elegant way to do this?
-        num_robots = n
-        positions = self._cycles[self.current_cycle][self.current_position][1].tuple()
-        robot_position = positions[i*starNum:i*starNum+(dimension/n)]
-        for j in range(len(robot_position)):
-            if not robot_position[j] == (0, 0):
-                startPosition = robot_position[j][0]
-                endPosition   = robot_position[j][1]
-                if startPosition == endPosition:
-                    point = self._edges[j%starNum][endPosition-1].end
-                else:
-                    point = self._edges[j%starNum][endPosition-1].midpoint()
-                return point
-        return self.center
-
-    def _move_robots(self, starNum, n, k):
-        '''
-        Helper method called by _next_position to move the robots.
-        '''
-        for i in range(len(self.robots)):
-            point = self._get_point_for_robot(starNum, n, k, i)
-            if self.robots[i].current_point.angle_to_point(self.center) == point.angle_to_point(self.center) or self.robots[i].current_point == self.center:
-                if point == self.center:
-                    self.robots[i].centered = True
-                self.robots[i].move_to(point)
-            else:
-                self.robots[i].centered = False
-                self.robots[i].move_to(self.center)
+        self.robots = [Robot(self, self.center.x, self.center.y, i) for i in range(n)]
 
-    def _next_position(self, starNum, n, k):
+    def _draw_robots(self, profiler=None):
         '''
-        This is the animation method called by Tkinter. It facilitates moving from one position in a cycle to the next.
-        When it gets to the last position it simply moves back to the first position.
+        Move the robots to where the timeline puts them at the playhead, and update the controls if they have reached
+        another position of the cycle.
+
+        :param profiler: If given, the end of each phase of the frame is marked on it.
+        :type profiler: frame_stats.FrameProfiler
         '''
-        self.current_position += 1
-        position_changed = True
+        step, points = self._timeline.at(self._playhead)
+        for robot, (x, y) in zip(self.robots, points):
+            robot.x, robot.y = x, y
+        if profiler is not None:
+            profiler.mark("timeline")
+        # Redraw all the robots that moved in one pass, after their positions have been worked out.
         for robot in self.robots:
-            if robot.next_point is not None or (robot.current_point==self.center and not robot.centered):
-                self.current_position -= 1
-                position_changed = False
-                break
-        if self.current_position == len(self._cycles[self.current_cycle]):
-            self.current_position = 0
-        if position_changed:
-            time.sleep(0.3)
-            self.cycle_label['text'] = "Cycle #"+str(self.current_cycle+1) + " of #"+str(len(self._cycles)) + "\nPosition " + str(self.current_position+1) + " of " + str(len(self._cycles[self.current_cycle]))
-            time.sleep(0.3)
-        self._move_robots(starNum, n, k)
-        self.animation_id = self.canvas.after(30, lambda: self._next_position(starNum, n, k))
-
-    def _reset(self, starNum, n, k):
-        '''
-        This method is called every time the cycle is changed. It reconfigures the robots and runs the animation for the new cycle.
-        '''
-        self.canvas.after_cancel(self.animation_id)
-        self.current_cycle += 1
-        if self.current_cycle >= len(self._cycles)-1:
-            self.current_cycle %= len(self._cycles)
-        self.current_position = 0
+            robot.draw()
+        if profiler is not None:
+            profiler.mark("canvas")
+
+        self._slider_value = round(self._playhead, 2)
+        self.timeline_slider.set(self._slider_value)
+        if step != self.current_position:
+            self.current_position = step
+            self._update_controls()
+        if profiler is not None:
+            profiler.mark("controls")
+
+    def _next_frame(self):
+        '''
+        This is the animation method called by the AnimationScheduler on every frame. It moves the playhead on by the time
+        since the last frame (scaled by the playback speed), wrapping around at the end of the cycle, and redraws the robots.
+        Since positions come from the timeline, a late frame simply shows the robots further along.
+        '''
+        profiler = self._profiler
+        if profiler is not None:
+            profiler.begin_frame()
+        now = time.time()
+        if self._playing and self._last_frame is not None:
+            self._playhead = (self._playhead + (now - self._last_frame)*self._speed) % self._timeline.duration
+        self._last_frame = now
+        self._draw_robots(profiler)
+        if profiler is not None:
+            self._end_frame(profiler, now)
+
+    def _end_frame(self, profiler, now):
+        '''
+        Finish timing a frame, and refresh the frame-time overlay if it is due.
+        '''
+        profiler.end_frame(self._scheduler.dropped_frames)
+        if self._hud is not None and now - self._hud_updated >= self._HUD_INTERVAL:
+            self.canvas.itemconfig(self._hud, text=profiler.summary())
+            self._hud_updated = now
+
+    def _next_live_frame(self, n):
+        '''
+        The animation method used instead of _next_frame in live mode. When the stream has a new configuration, the robots
+        set off from wherever they are towards it (any configurations received in between are skipped, see
+        live_stream.py), and they get there within _LIVE_LATENCY seconds.
+        '''
+        profiler = self._profiler
+        if profiler is not None:
+            profiler.begin_frame()
+        now = time.time()
+        positions = self._stream.latest()
+        if positions is not None:
+            paths = []
+            for i, (robot, position) in enumerate(zip(self.robots, positions)):
+                end = self.layout.keyframe_point(*keyframes.position_to_keyframe(position, n))
+                # Robots switching arms have to go through the center. A robot may still be on its way from an earlier
+                # target, so its arm is the one it is on now, not the one of the last target.
+                current = self.layout.arm_at((robot.x, robot.y))
+                via_center = current >= 0 and position[0] >= 0 and current != position[0]
+                paths.append(keyframes.polyline([(robot.x, robot.y), self.layout.center, end] if via_center
+                                                else [(robot.x, robot.y), end]))
+            self._live_paths = paths
+            self._live_departure = now
+            self._live_speed = max(self._SPEED, max(lengths[-1] for (path, lengths) in paths)/self._LIVE_LATENCY)
+        if self._live_paths is not None:
+            distance = (now - self._live_departure)*self._live_speed
+            for robot, (path, lengths) in zip(self.robots, self._live_paths):
+                robot.x, robot.y = keyframes.along(path, lengths, distance)
+        if profiler is not None:
+            profiler.mark("timeline")
         for robot in self.robots:
-            self.canvas.delete(robot.oval)
-        self._init_robots(starNum, n, k)
-        self.current_position = -1 # A temporary fix
-        self._next_position(starNum, n, k)
+            robot.draw()
+        if profiler is not None:
+            profiler.mark("canvas")
+        self._update_controls()
+        if profiler is not None:
+            profiler.mark("controls")
+            self._end_frame(profiler, now)
+
+    def _toggle_hud(self):
+        '''
+        Show or hide the frame-time overlay in the top-left corner of the canvas. Frames are timed from the first time it is
+        shown on.
+        '''
+        if self._hud is not None:
+            self.canvas.delete(self._hud)
+            self._hud = None
+            return
+        if self._profiler is None:
+            self._profiler = frame_stats.FrameProfiler()
+        self._hud = self.canvas.create_text(5, 5, anchor=tk.NW, font=("Courier", 9), text=self._profiler.summary())
+        self._hud_updated = 0.0
 
     def _next_cycle_callback(self, starNum, n, k):
         '''
         A callback method called every time the user clicks the "Next button on the Tkinter window.
         '''
-        self._reset(starNum, n, k)
-        self.cycle_label['text'] = "Cycle #"+str(self.current_cycle+1) + " of #"+str(len(self._cycles)) + "\nPosition " + str(self.current_position+1) + " of " + str(len(self._cycles[self.current_cycle]))
+        self._show_cycle(starNum, n, k, self.current_cycle+1)
+
+class AnimationScheduler(object):
+    '''
+    Drives an animation from a single Tkinter timer. Frames are scheduled against a fixed timeline rather than a fixed delay
+    after each frame, so the time a frame took is subtracted from the wait for the next one, and Tkinter keeps handling
+    events (button presses, redraws) between frames.
+    '''
+    def __init__(self, widget, tick, frame_interval):
+        '''
+        :param widget: Any Tkinter widget, used for its timers.
+        :type widget: tk.Widget
+        :param tick: The function called on every frame.
+        :type tick: function
+        :param frame_interval: The time between two frames, in milliseconds.
+        :type frame_interval: int
+        '''
+        self._widget = widget
+        self._tick = tick
+        self._frame_interval = frame_interval/1000.0
+        self._after_id = None
+        self._next_frame = None
+
+        # The number of frames that were skipped because we had fallen behind.
+        self.dropped_frames = 0
+
+    def start(self):
+        '''
+        Start calling tick, beginning with a frame right away.
+        '''
+        self.stop()
+        self._next_frame = time.time()
+        self._after_id = self._widget.after(0, self._run)
+
+    def stop(self):
+        if self._after_id is not None:
+            self._widget.after_cancel(self._after_id)
+            self._after_id = None
+
+    def _run(self):
+        self._tick()
+        now = time.time()
+        self._next_frame += self._frame_interval
+        # If we have fallen behind (e.g. the machine is busy), skip the frames we missed instead of rushing to catch up.
+        # Motion is based on time, so the robots still end up where they should be.
+        if self._next_frame < now:
+            skipped = int((now - self._next_frame)/self._frame_interval) + 1
+            self.dropped_frames += skipped
+            self._next_frame += skipped*self._frame_interval
+        self._after_id = self._widget.after(int((self._next_frame - now)*1000), self._run)
+
+class CycleBrowser(object):
+    '''
+    A window showing the cycles as a grid of thumbnails (or numbered buttons, without Pillow), one page at a time. Only the
+    thumbnails of the page on screen are drawn, and only its cycles are read, so this stays quick with thousands of cycles
+    (which are read lazily from a bundle, see cycle_bundle.py).
+    '''
+    ROWS, COLUMNS = 3, 4
+    PAGE_SIZE = ROWS*COLUMNS
+    _THUMBNAIL_SIZE = 140
+
+    def __init__(self, master, cycles, starNum, n, on_select, page=0):
+        '''
+        :param master: The StarGraph window.
+        :type master: tk.Tk
+        :param cycles: The cycles, which may still be growing while the cycle worker runs.
+        :type cycles: list or CycleBundle
+        :param starNum: The number of "arms" of the star.
+        :type starNum: int
+        :param n: The number of robots.
+        :type n: int
+        :param on_select: The function called with the index of a cycle when its thumbnail is clicked.
+        :type on_select: function
+        :param page: The page to show first.
+        :type page: int
+        '''
+        self._cycles = cycles
+        self._layout = star_layout.StarLayout(starNum, n, self._THUMBNAIL_SIZE)
+        self._on_select = on_select
+        self._page = page
+        # Tkinter doesn't keep references to its images, so we hold on to the thumbnails of the current page.
+        self._images = []
+
+        self._window = tk.Toplevel(master)
+        self._window.title("Cycles")
+        self._grid = tk.Frame(self._window)
+        self._grid.pack()
+        navigation = tk.Frame(self._window)
+        navigation.pack()
+        self._previous_button = tk.Button(navigation, text="<", command=lambda: self._show_page(self._page-1))
+        self._previous_button.pack(side=tk.LEFT)
+        self._page_label = tk.Label(navigation)
+        self._page_label.pack(side=tk.LEFT)
+        self._next_button = tk.Button(navigation, text=">", command=lambda: self._show_page(self._page+1))
+        self._next_button.pack(side=tk.LEFT)
+        self._show_page(page)
+
+    def is_open(self):
+        return bool(self._window.winfo_exists())
+
+    def lift(self):
+        self._window.lift()
+
+    def _pages(self):
+        return max(1, (len(self._cycles) + self.PAGE_SIZE-1) // self.PAGE_SIZE)
+
+    def _show_page(self, page):
+        '''
+        Replace the grid by the cycles of the given page.
+        '''
+        self._page = max(0, min(page, self._pages()-1))
+        for widget in self._grid.winfo_children():
+            widget.destroy()
+        self._images = []
+        first = self._page*self.PAGE_SIZE
+        for c in range(first, min(first + self.PAGE_SIZE, len(self._cycles))):
+            row, column = divmod(c - first, self.COLUMNS)
+            command = lambda c=c: self._on_select(c)
+            if ImageTk is not None and render.Image is not None:
+                image = ImageTk.PhotoImage(render.render_thumbnail(self._layout, self._cycles[c]))
+                self._images.append(image)
+                button = tk.Button(self._grid, image=image, text="#"+str(c+1), compound=tk.TOP, command=command)
+            else:
+                button = tk.Button(self._grid, text="Cycle #"+str(c+1), width=12, command=command)
+            button.grid(row=row, column=column)
+        self._page_label['text'] = "Page " + str(self._page+1) + " of " + str(self._pages())
+        self._previous_button['state'] = tk.DISABLED if self._page == 0 else tk.NORMAL
+        self._next_button['state'] = tk.DISABLED if self._page >= self._pages()-1 else tk.NORMAL
 
 class Point(object):
     '''
@@ -205,19 +623,15 @@ class Point(object):
     _SIN_270 = sin(270)
 
     # How large vertices and robots are.
-    _POINT_RADIUS = 5
+    _POINT_RADIUS = star_layout.VERTEX_RADIUS
 
     def __init__(self, graph, x, y):
         self._graph = graph
         self._color = "black"
 
-        # These values are important for robot movement:
-        # - self.x and self.y encode the REAL coordinates of a point in the Tkinter window,
-        # - self.current_point is a copy of this point that encodes the last position where this point was stationary.
-        # - self.next_point is None if the robot is not currently going anywhere, and contains a point if it has a destination.
+        # self.x and self.y encode the REAL coordinates of a point in the Tkinter window. Robots are moved by changing them
+        # (see StarGraph._draw_robots).
         self.x, self.y = x, y
-        self.current_point = self
-        self.next_point = None
 
     def _bounds(self):
         """ 
@@ -235,25 +649,11 @@ class Point(object):
         '''
         return math.sqrt((self.x-point.x)**2 + (self.y-point.y)**2)
 
-    def angle_to_point(self, point):
-        '''
-        The angle (in degrees) from self to another point, adjusted so that is a multiple of 10 (so that we don't end up with
-        values that are slightly off when checking angle equality).
-        '''
-        if self == point: 
-            return 0.0
-        angle = math.ceil(180/math.pi * (math.atan2(point.y-self.y, self.x-point.x)-math.pi/2))
-        if angle < 0:
-            angle += math.fabs(angle) % 10
-        elif angle > 0:
-            angle -= math.fabs(angle) % 10
-        return angle
-
     def __str__(self):
         return "(" + str(self.x) + ", " + str(self.y) + ")"
 
     def __eq__(self, other):
-        return self.current_point.x == other.current_point.x and self.current_point.y == other.current_point.y
+        return self.x == other.x and self.y == other.y
 
     def __ne__(self, other):
         return not self.__eq__(other)
@@ -270,38 +670,24 @@ class Robot(Point):
     '''
     A robot that can move along a graph.
     '''
-    _ROBOT_COLORS = ["red", "blue", "green", "cyan", "yellow", "magenta"]
-    _SPEED = 5
+    _ROBOT_COLORS = star_layout.ROBOT_COLORS
 
     def __init__(self, graph, x, y, i):
         super(Robot, self).__init__(graph, x, y)
         self._color = self._ROBOT_COLORS[i%len(self._ROBOT_COLORS)]
 
-        # A boolean value that is True if the robot's INTENDED position is the center of the graph, and False otherwise.
-        # Note that this will be False if the robot is merely passing through the center to get somewhere else.
-        self.centered = True
-
         # We make robots slightly smaller than vertices.
-        self._POINT_RADIUS -= 1
+        self._POINT_RADIUS = star_layout.ROBOT_RADIUS
         self._draw()
+        self._drawn_at = (self.x, self.y)
 
-    def move_to(self, point):
-        '''
-        Move this robot to point.
-        '''
-        if self.next_point is None:
-            self.next_point = point
-        distance = self.distance_to_point(self.next_point)
-        angle = self.angle_to_point(self.next_point)
-        if self.current_point != point:
-            self._graph.canvas.move(self.oval, self._SPEED*sin(angle), self._SPEED*cos(angle))
-        x0, y0, x1, y1 = self._graph.canvas.coords(self.oval)
-        self.x = (x0+x1)/2
-        self.y = (y0+y1)/2
-        if distance <= self._SPEED:
-            self.next_point = None
-            self.current_point = point
-            self.x, self.y = self.current_point.x, self.current_point.y
+    def draw(self):
+        '''
+        Move this robot's oval on the canvas to its current coordinates, if it has moved since it was last drawn.
+        '''
+        if self._drawn_at != (self.x, self.y):
+            self._graph.canvas.coords(self.oval, *self._bounds())
+            self._drawn_at = (self.x, self.y)
 
 class Edge:
     '''
@@ -0,0 +1,92 @@
+'''
+This code lays out a d-star in the plane, and is shared by the Tkinter visualization (see star_graph.py) and the headless
+renderer (see render.py), so it does not depend on Tkinter.
+
+The center vertex sits in the middle of a square frame, and arm j leaves it at an angle of 360/d * (j+1) degrees with n-1 edges
+of equal length. Places on the star are given as in keyframes.py.
+'''
+import math
+
+# Shared drawing constants.
+ROBOT_COLORS = ["red", "blue", "green", "cyan", "yellow", "magenta"]
+VERTEX_RADIUS = 5
+ROBOT_RADIUS = VERTEX_RADIUS - 1 # We make robots slightly smaller than vertices.
+
+class StarLayout(object):
+    '''
+    The coordinates of the vertices of a d-star subdivided for n robots.
+    '''
+    def __init__(self, starNum, n, frame_size=600.0):
+        '''
+        :param starNum: The number of "arms" of the star.
+        :type starNum: int
+        :param n: The number of robots, so that every arm has n-1 edges.
+        :type n: int
+        :param frame_size: The width (and height) of the square frame the star is drawn in.
+        :type frame_size: float
+        '''
+        self.frame_size = frame_size
+        self.center = (frame_size/2, frame_size/2)
+        offset_radius = frame_size/2 - 10
+        num_edges = n - 1
+
+        # self.arms[j][i] is the vertex at distance i+1 from the center along arm j.
+        self.arms = []
+        for j in range(starNum):
+            angle = math.radians(360.0/starNum * (j+1))
+            x, y = self.center
+            arm = []
+            for i in range(num_edges):
+                x, y = x + (offset_radius/num_edges)*math.sin(angle), y + (offset_radius/num_edges)*math.cos(angle)
+                arm.append((x, y))
+            self.arms.append(arm)
+
+    def vertex(self, arm, distance):
+        '''
+        :return: The coordinates of the vertex at the given distance from the center along an arm.
+        :rtype: tuple
+        '''
+        if distance == 0:
+            return self.center
+        return self.arms[arm][distance-1]
+
+    def arm_at(self, point):
+        '''
+        EXAMPLE (the Y-graph for 3 robots):
+        >>> layout = StarLayout(3, 3)
+        >>> layout.arm_at(layout.vertex(2, 1)), layout.arm_at(layout.keyframe_point(1, 0.5)), layout.arm_at(layout.center)
+        (2, 0, -1)
+
+        :param point: The coordinates of a place on the star.
+        :type point: tuple
+        :return: The arm the place is on, or -1 for the center.
+        :rtype: int
+        '''
+        (x, y) = (point[0] - self.center[0], point[1] - self.center[1])
+        if math.hypot(x, y) < 1e-6*self.frame_size:
+            return -1
+        # Arm j leaves the center in the direction (sin, cos) of its angle, so the place is on the arm closest to its own.
+        angles = [math.radians(360.0/len(self.arms) * (j+1)) for j in range(len(self.arms))]
+        return max(range(len(self.arms)), key=lambda j: x*math.sin(angles[j]) + y*math.cos(angles[j]))
+
+    def edges(self):
+        '''
+        :return: The list of the ((x0, y0), (x1, y1)) endpoints of every edge, from the center outwards.
+        :rtype: list
+        '''
+        return [(self.vertex(arm, i), self.vertex(arm, i+1)) for arm in range(len(self.arms)) for i in range(len(self.arms[arm]))]
+
+    def keyframe_point(self, edge, fraction):
+        '''
+        :param edge: An edge id, or CENTER_EDGE (see keyframes.py).
+        :type edge: int
+        :param fraction: The fractional position along the edge, from 0.0 at the end nearer the center to 1.0 at the outer end.
+        :type fraction: float
+        :return: The coordinates of that place on the star.
+        :rtype: tuple
+        '''
+        if edge < 0:
+            return self.center
+        arm, i = divmod(edge, len(self.arms[0]))
+        (x0, y0), (x1, y1) = self.vertex(arm, i), self.vertex(arm, i+1)
+        return (x0 + fraction*(x1-x0), y0 + fraction*(y1-y0))
@@ -0,0 +1,320 @@
+'''
+This code computes the homology of the Abrams-discretized models D_{n,k} for a whole grid of graphs, numbers of robots n and
+values of k in one go, so that nightly sweeps don't need hand-edited scripts.
+
+The graphs are given by name: I (the interval, see homology/conf_n_k_I.py), Y and X (the stars with 3 and 4 arms), or
+star<d> for the star with d arms (see homology/conf_n_k_Y.py). Every (graph, n, k) case with 2 <= k <= n is a job. The jobs
+run in a pool of worker processes, most expensive first, so that a long job does not start last and hold up the whole
+sweep. plan orders the jobs by the number of cells of their complexes, as estimate_job counts them without building them
+(see homology/estimate.py), since the time spent on building a complex and on its homology grows with it. With a memory
+budget, the jobs whose estimated memory is already over the budget are not run at all, and --dry-run only prints the
+estimates of the jobs that would run.
+
+Each job writes its result to its own JSON file in the results directory: the subdivision of the graph (see
+job_subdivision), the Betti numbers, the number of cells in every dimension, the Euler characteristic and how long each stage
+took. With --bundles, the jobs on stars also write the cycle bundles of their 1-cycles (see cycle_bundle.py) into the
+"bundles" directory under the results directory, for StarGraph. Jobs whose results are already there, computed with the
+same subdivision and with their bundles if they need them, are skipped (see is_done), so a sweep that was interrupted (or
+extended with new values) only computes what is missing. Failed jobs write nothing, so they are tried again by the next
+sweep. At the end, the results of every job in the directory are collected into summary.json.
+
+Computing the homology needs Sage, so the sweep is run with Sage's Python, e.g.
+
+    sage -python sweep.py --graphs I Y X star5 --n 2 3 4 --k 2 3 --processes 4 --bundles results
+
+computes the (up to) 20 cases of the grid with 4 worker processes and writes the results to the directory "results".
+'''
+import argparse
+import glob
+import json
+import multiprocessing
+import os
+import re
+import sys
+import time
+import traceback
+
+import cycle_bundle
+
+SUMMARY = "summary.json"
+
+def parse_graph(name):
+    '''
+    EXAMPLE:
+    >>> [parse_graph(name) for name in ("I", "Y", "X", "star5")]
+    [None, 3, 4, 5]
+
+    :param name: The name of a graph: I, Y, X or star<d>.
+    :type name: str
+    :return: The number of arms, for stars, and None for the interval.
+    :rtype: int
+    '''
+    if name == "I":
+        return None
+    if name in ("Y", "X"):
+        return 3 if name == "Y" else 4
+    match = re.match(r"^star(\d+)$", name)
+    if match is None or int(match.group(1)) < 2:
+        raise ValueError("Unknown graph " + repr(name) + ": expected I, Y, X or star<d> (with d >= 2).")
+    return int(match.group(1))
+
+def graph_name(arms):
+    '''
+    The inverse of parse_graph, giving the usual names of the interval, the Y-graph and the X-graph.
+    '''
+    if arms is None:
+        return "I"
+    return {3: "Y", 4: "X"}.get(arms, "star%d" % arms)
+
+def job_subdivision(graph, n, k, bundles=False):
+    '''
+    :param bundles: Whether the job writes a cycle bundle. StarGraph draws every arm of a star with n-1 edges, so the
+                    complexes of these jobs are subdivided that way too.
+    :type bundles: bool
+    :return: The number of edges every arm of the graph (or the interval) is subdivided into for a job (see
+             minimal_subdivision in homology/conf_n_k_Y.py).
+    :rtype: int
+    '''
+    from homology import conf_n_k_I, conf_n_k_Y
+    arms = parse_graph(graph)
+    if arms is None:
+        return conf_n_k_I.minimal_subdivision(n, k)
+    if bundles:
+        return n-1
+    return conf_n_k_Y.minimal_subdivision(n, k, arms)
+
+def estimate_job(graph, n, k, bundles=False):
+    '''
+    :return: The estimated size of the complex of a job (see homology/estimate.py).
+    :rtype: dict
+    '''
+    from homology import estimate
+    return estimate.estimate_star(parse_graph(graph), n, k, job_subdivision(graph, n, k, bundles))
+
+def result_path(directory, graph, n, k):
+    '''
+    :return: The path of the result file of a job.
+    :rtype: str
+    '''
+    return os.path.join(directory, "%s_n%d_k%d.json" % (graph_name(parse_graph(graph)), n, k))
+
+def is_done(directory, graph, n, k, bundles=False):
+    '''
+    Whether a job already has its result in the directory: a result file with the subdivision the job would use (see
+    job_subdivision) and, for the jobs that write a cycle bundle, the bundle too.
+
+    :param bundles: Whether the job writes a cycle bundle.
+    :type bundles: bool
+    :rtype: bool
+    '''
+    path = result_path(directory, graph, n, k)
+    if not os.path.exists(path):
+        return False
+    try:
+        with open(path) as f:
+            result = json.load(f)
+    except ValueError:
+        return False
+    if result.get("subdivision") != job_subdivision(graph, n, k, bundles):
+        return False
+    arms = parse_graph(graph)
+    if bundles and arms is not None:
+        return os.path.exists(cycle_bundle.bundle_path(arms, n, k, os.path.join(directory, "bundles")))
+    return True
+
+def _write_json(path, data):
+    # Write to a temporary file first, so that a sweep killed halfway never leaves a truncated result behind to be skipped.
+    temporary = path + ".tmp"
+    with open(temporary, "w") as f:
+        json.dump(data, f, indent=1, sort_keys=True)
+    os.rename(temporary, path)
+
+def run_job(graph, n, k, bundles=None):
+    '''
+    Build D_{n,k} of the graph and compute its homology (and its cycle bundle).
+
+    :param graph: The name of the graph (see parse_graph).
+    :type graph: str
+    :param bundles: The directory to write the cycle bundle to, or None for no bundle. Only stars have bundles.
+    :type bundles: str
+    :return: A dictionary with the graph, n and k, the "subdivision" of the graph, the "betti" numbers and the number of
+             "cells" in every dimension, the "euler_characteristic" and the "seconds" each stage took.
+    :rtype: dict
+    '''
+    from homology import conf_n_k_I, conf_n_k_Y
+    from sage.all import QQ
+    arms = parse_graph(graph)
+    seconds = {}
+
+    start = time.time()
+    subdivision = job_subdivision(graph, n, k, bundles is not None)
+    if arms is None:
+        cubical = conf_n_k_I.the_complex(n, k, subdivision)
+    else:
+        cubical = conf_n_k_Y.the_complex(n, k, arms, subdivision)
+    seconds["build"] = time.time() - start
+
+    start = time.time()
+    cells = dict((dim, len(cubical.cells().get(dim, ()))) for dim in range(cubical.dimension()+1))
+    seconds["cells"] = time.time() - start
+
+    start = time.time()
+    homology = cubical.homology(base_ring=QQ, reduced=False)
+    betti = dict((dim, int(group.dimension())) for (dim, group) in homology.items())
+    seconds["homology"] = time.time() - start
+
+    result = {"graph": graph_name(arms), "n": n, "k": k, "subdivision": subdivision, "betti": betti, "cells": cells,
+              "euler_characteristic": cubical.euler_characteristic(), "seconds": seconds}
+    if bundles is not None and arms is not None:
+        start = time.time()
+        path = cycle_bundle.bundle_path(arms, n, k, bundles)
+        cycles = list(cubical.iter_sorted_n_cycles(1)) if cubical.dimension() >= 1 else []
+        cycle_bundle.write_bundle(path, arms, n, k, cycles)
+        seconds["bundle"] = time.time() - start
+        result["bundle"] = os.path.basename(path)
+    return result
+
+def _run_job(job):
+    (graph, n, k, directory, bundles, memory_budget_kb) = job
+    from homology import memory
+    memory.set_budget(memory_budget_kb)
+    try:
+        result = run_job(graph, n, k, bundles)
+    except Exception:
+        return (graph, n, k, None, traceback.format_exc())
+    _write_json(result_path(directory, graph, n, k), result)
+    return (graph, n, k, result, None)
+
+def plan(graphs, ns, ks, directory, force=False, memory_budget_kb=None, bundles=False):
+    '''
+    List the jobs of a sweep that still need to run, most expensive first: by the number of cells estimate_job counts for
+    them, with the subdivision they will be built with.
+
+    :param force: Whether to run the jobs whose results are already in the directory (see is_done) too.
+    :type force: bool
+    :param memory_budget_kb: If given, leave out the jobs whose estimated memory (see homology/estimate.py) is over this
+                             many kilobytes. The estimate is a lower bound, so these jobs could only fail.
+    :type memory_budget_kb: int
+    :param bundles: Whether the jobs write cycle bundles (see job_subdivision).
+    :type bundles: bool
+    :return: The list of the (graph, n, k) of the jobs to run, and the list of the (graph, n, k, estimate) of the jobs left
+             out for the memory budget.
+    :rtype: tuple
+    '''
+    jobs = [(graph, n, k) for graph in graphs for n in ns for k in ks if 2 <= k <= n]
+    if not force:
+        jobs = [(graph, n, k) for (graph, n, k) in jobs if not is_done(directory, graph, n, k, bundles)]
+    estimates = dict(((graph, n, k), estimate_job(graph, n, k, bundles)) for (graph, n, k) in jobs)
+    rejected = []
+    if memory_budget_kb is not None:
+        rejected = [job + (estimates[job],) for job in jobs if estimates[job]["memory_kb"] > memory_budget_kb]
+        jobs = [job for job in jobs if estimates[job]["memory_kb"] <= memory_budget_kb]
+    return (sorted(jobs, key=lambda job: -sum(estimates[job]["cells"])), rejected)
+
+def sweep(graphs, ns, ks, directory, processes=None, bundles=False, force=False, memory_budget_kb=None, log=None):
+    '''
+    Run every job of the grid that does not have a result in the directory yet (see the top of this file), and then
+    collect all the results in the directory into its summary.
+
+    :param processes: The number of worker processes. Defaults to the number of CPUs.
+    :type processes: int
+    :param bundles: Whether to write the cycle bundles of the stars too.
+    :type bundles: bool
+    :param memory_budget_kb: The memory budget of every job in kilobytes (see homology/memory.py).
+                             Jobs estimated to need more than that are not run (see plan).
+    :type memory_budget_kb: int
+    :param log: A function called with a line of progress after every job.
+    :type log: function
+    :return: The list of (graph, n, k, traceback) of the jobs that failed, where the traceback is None for the jobs that
+             were not run for the memory budget.
+    :rtype: list
+    '''
+    for graph in graphs:
+        parse_graph(graph)
+    if not os.path.isdir(directory):
+        os.makedirs(directory)
+    bundle_directory = os.path.join(directory, "bundles") if bundles else None
+    (planned, rejected) = plan(graphs, ns, ks, directory, force, memory_budget_kb, bundles)
+    jobs = [(graph, n, k, directory, bundle_directory, memory_budget_kb) for (graph, n, k) in planned]
+
+    failures = [(graph, n, k, None) for (graph, n, k, estimate) in rejected]
+    if log is not None:
+        for (graph, n, k, estimate) in rejected:
+            log("D_{%d,%d}%s: skipped, estimated to need %d KB of the %d KB memory budget"
+                % (n, k, graph_name(parse_graph(graph)), estimate["memory_kb"], memory_budget_kb))
+    if jobs:
+        pool = multiprocessing.Pool(processes)
+        try:
+            # With a chunk size of 1, the jobs are handed out one at a time, in the order of the list.
+            for (graph, n, k, result, error) in pool.imap_unordered(_run_job, jobs, chunksize=1):
+                if error is not None:
+                    failures.append((graph, n, k, error))
+                if log is not None:
+                    log(format_result(graph, n, k, result, error))
+        finally:
+            pool.close()
+            pool.join()
+    write_summary(directory)
+    return failures
+
+def write_summary(directory):
+    '''
+    Collect the results of all the jobs in the directory into its summary.json, sorted by graph, n and k.
+
+    :return: The list of results.
+    :rtype: list
+    '''
+    results = []
+    for path in glob.glob(os.path.join(directory, "*_n*_k*.json")):
+        with open(path) as f:
+            results.append(json.load(f))
+    results.sort(key=lambda result: (result["graph"], result["n"], result["k"]))
+    _write_json(os.path.join(directory, SUMMARY), results)
+    return results
+
+def format_result(graph, n, k, result, error=None):
+    '''
+    :return: A line describing the result of a job for humans.
+    :rtype: str
+    '''
+    title = "D_{%d,%d}%s" % (n, k, graph_name(parse_graph(graph)))
+    if error is not None:
+        return title + ": failed\n" + error
+    betti = ", ".join("b%s=%d" % (dim, rank) for (dim, rank) in sorted(result["betti"].items()))
+    return "%s: %s (%d cells, %.1f s)" % (title, betti, sum(result["cells"].values()), sum(result["seconds"].values()))
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compute the homology of D_{n,k} for a grid of graphs, n and k.")
+    parser.add_argument("directory", help="the results directory")
+    parser.add_argument("--graphs", nargs="+", default=["Y"], help="the graphs: I, Y, X or star<d> (default: Y)")
+    parser.add_argument("--n", type=int, nargs="+", default=[2, 3], help="the numbers of robots")
+    parser.add_argument("--k", type=int, nargs="+", default=[2], help="the values of k")
+    parser.add_argument("--processes", type=int, default=None, help="the number of worker processes (default: one per CPU)")
+    parser.add_argument("--bundles", action="store_true", help="also write the cycle bundles of the stars")
+    parser.add_argument("--force", action="store_true", help="recompute the results that are already in the directory")
+    parser.add_argument("--memory-budget", type=int, default=None, help="the memory budget of every job, in megabytes")
+    parser.add_argument("--dry-run", action="store_true", help="only print the estimated sizes of the jobs that would run")
+    args = parser.parse_args()
+    try:
+        for graph in args.graphs:
+            parse_graph(graph)
+    except ValueError as e:
+        parser.error(str(e))
+
+    def log(line):
+        print(line)
+        sys.stdout.flush()
+    budget = args.memory_budget * 1024 if args.memory_budget is not None else None
+    if args.dry_run:
+        (planned, rejected) = plan(args.graphs, args.n, args.k, args.directory, args.force, budget, args.bundles)
+        for (graph, n, k) in planned:
+            estimate = estimate_job(graph, n, k, args.bundles)
+            log("D_{%d,%d}%s: %d cells, %d maximal cubes, about %d KB" % (n, k, graph_name(parse_graph(graph)),
+                sum(estimate["cells"]), sum(estimate["maximal_cells"]), estimate["memory_kb"]))
+        for (graph, n, k, estimate) in rejected:
+            log("D_{%d,%d}%s: over the memory budget, about %d KB" % (n, k, graph_name(parse_graph(graph)),
+                                                                      estimate["memory_kb"]))
+        sys.exit(0)
+    failures = sweep(args.graphs, args.n, args.k, args.directory, args.processes, args.bundles, args.force, budget, log)
+    if failures:
+        parser.exit(1, "%d jobs failed or were skipped.\n" % len(failures))